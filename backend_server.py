@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
@@ -9,6 +9,8 @@ from datetime import datetime
 # Add the parent directory to the path to import the noise estimator
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from noise_estimator.api.executor import CalculationExecutor, CalculationCancelled, ExecutorBusy
+from noise_estimator.core.cache import ResultCache
 from noise_estimator.core.calculator import NoiseCalculator
 from noise_estimator.core.dataset import DatasetManager
 
@@ -26,10 +28,22 @@ app.add_middleware(
 # Initialize the calculator
 try:
     dataset_manager = DatasetManager('datasets')
-    calculator = NoiseCalculator(dataset_manager)
+    result_cache = ResultCache()
+    # Same calculation settings as the noise_estimator API
+    calculator = NoiseCalculator(
+        dataset_manager,
+        result_cache=result_cache,
+        propagation_mode=os.environ.get("NOISE_ESTIMATOR_PROPAGATION_MODE", "nearest"),
+        extended_range=os.environ.get("NOISE_ESTIMATOR_EXTENDED_RANGE", "0") == "1",
+        met_category=os.environ.get("NOISE_ESTIMATOR_MET_CATEGORY") or None,
+        spectral=os.environ.get("NOISE_ESTIMATOR_SPECTRAL", "0") == "1"
+    )
+    # Calculations run on a bounded pool so /health stays responsive
+    executor = CalculationExecutor(calculator, mode=os.environ.get("NOISE_ESTIMATOR_EXECUTOR", "thread"))
 except Exception as e:
     print(f"Error initializing calculator: {e}")
     calculator = None
+    executor = None
 
 class EstimationRequest(BaseModel):
     assessment_type: str
@@ -376,10 +390,15 @@ async def root():
 async def health_check():
     if calculator is None:
         raise HTTPException(status_code=503, detail="Calculator not initialized")
-    return {"status": "healthy", "calculator": "ready"}
+    return {
+        "status": "healthy",
+        "calculator": "ready",
+        "result_cache": calculator.result_cache.stats(),
+        "executor": executor.stats()
+    }
 
 @app.post("/calculate")
-async def calculate_noise(request: EstimationRequest):
+async def calculate_noise(request: EstimationRequest, http_request: Request):
     if calculator is None:
         raise HTTPException(status_code=503, detail="Calculator not initialized")
     
@@ -407,7 +426,12 @@ async def calculate_noise(request: EstimationRequest):
         )
         
         # Perform the calculation
-        result = calculator.calculate(estimation_request)
+        try:
+            result = await executor.calculate(estimation_request, http_request)
+        except ExecutorBusy as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        except CalculationCancelled as e:
+            raise HTTPException(status_code=499, detail=str(e))
         
         # Generate comprehensive requirements based on results
         impact_band = result.impact_band.value if hasattr(result.impact_band, 'value') else str(result.impact_band)
@@ -492,6 +516,8 @@ async def calculate_noise(request: EstimationRequest):
         
         return comprehensive_result
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Load test: concurrent calculation throughput against calculation pool size"""
+
+import asyncio
+import logging
+import os
+import sys
+import time
+
+from noise_estimator.api.executor import CalculationExecutor
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.core.dataset import DatasetManager
+from noise_estimator.models.schemas import (
+    EstimationRequest, AssessmentType, CalculationMode,
+    EnvironmentApproach, TimePeriod, PropagationType, OutputPack
+)
+
+# Per-request info logging would dominate the timings
+logging.disable(logging.INFO)
+
+total_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+mode = sys.argv[2] if len(sys.argv) > 2 else "process"
+
+dataset_manager = DatasetManager('datasets')
+calculator = NoiseCalculator(dataset_manager)
+
+# Distinct distance-based requests with narrative packs, like wizard traffic
+requests = [
+    EstimationRequest(
+        assessment_type=AssessmentType.DISTANCE_BASED,
+        calculation_mode=CalculationMode.SCENARIO,
+        environment_approach=EnvironmentApproach.REPRESENTATIVE_NOISE_ENVIRONMENT,
+        time_period=TimePeriod.DAY,
+        propagation_type=PropagationType.RURAL,
+        noise_category_id="R1",
+        scenario_id="excavation",
+        receiver_distance=10.0 + i * 0.25,
+        include_trace=True,
+        output_pack=OutputPack.BOTH
+    )
+    for i in range(total_requests)
+]
+
+
+async def run_load(executor: CalculationExecutor) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(executor.calculate(request) for request in requests))
+    return time.perf_counter() - start
+
+
+cpus = os.cpu_count() or 1
+worker_counts = sorted({1, 2, 4, cpus} & set(range(1, cpus + 1)))
+
+print(f"Load test: {total_requests} concurrent requests, {mode} pool, {cpus} CPUs\n")
+baseline = None
+for workers in worker_counts:
+    executor = CalculationExecutor(calculator, max_workers=workers, max_queue=total_requests, mode=mode)
+    try:
+        asyncio.run(run_load(executor))  # warm up workers
+        seconds = asyncio.run(run_load(executor))
+    finally:
+        executor.shutdown()
+
+    throughput = total_requests / seconds
+    baseline = baseline or throughput
+    print(f"{workers:>3} workers: {throughput:8.0f} requests/s  ({throughput / baseline:.1f}x)")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Benchmark NoiseCalculator.calculate_many against a loop over calculate()"""
+
+import itertools
+import logging
+import sys
+import time
+
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.core.dataset import DatasetManager
+from noise_estimator.models.schemas import (
+    EstimationRequest, AssessmentType, CalculationMode,
+    EnvironmentApproach, TimePeriod, PropagationType
+)
+
+# Per-request info logging would dominate the timings
+logging.disable(logging.INFO)
+
+receivers = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+print("Initializing noise calculator...")
+dataset_manager = DatasetManager('datasets')
+calculator = NoiseCalculator(dataset_manager)
+
+# Every receiver x time period x scenario, as in a project assessment
+requests = []
+distances = [5.0 + 0.5 * i for i in range(receivers)]
+for distance, time_period, scenario_id in itertools.product(
+    distances, [TimePeriod.DAY, TimePeriod.EVENING, TimePeriod.NIGHT], ["excavation", "paving"]
+):
+    requests.append(EstimationRequest(
+        assessment_type=AssessmentType.FULL_ESTIMATOR,
+        calculation_mode=CalculationMode.SCENARIO,
+        environment_approach=EnvironmentApproach.REPRESENTATIVE_NOISE_ENVIRONMENT,
+        time_period=time_period,
+        propagation_type=PropagationType.RURAL,
+        noise_category_id="R1",
+        scenario_id=scenario_id,
+        receiver_distance=distance
+    ))
+
+print(f"Benchmarking {len(requests)} requests...")
+
+start = time.perf_counter()
+loop_results = [calculator.calculate(request) for request in requests]
+loop_seconds = time.perf_counter() - start
+
+start = time.perf_counter()
+batch_results = list(calculator.calculate_many(requests))
+batch_seconds = time.perf_counter() - start
+
+mismatches = sum(
+    1 for a, b in zip(loop_results, batch_results)
+    if a.predicted_level_db != b.predicted_level_db or a.impact_band != b.impact_band
+)
+
+print(f"\nLoop over calculate(): {loop_seconds * 1000:.1f} ms ({loop_seconds / len(requests) * 1e6:.0f} us/request)")
+print(f"calculate_many():      {batch_seconds * 1000:.1f} ms ({batch_seconds / len(requests) * 1e6:.0f} us/request)")
+print(f"Speed-up: {loop_seconds / batch_seconds:.1f}x")
+print(f"Result mismatches: {mismatches}")
@@ -11,10 +11,12 @@ import logging
 
 try:
     from openpyxl import load_workbook
-    from openpyxl.utils import range_boundaries
+    from openpyxl.utils import get_column_letter, range_boundaries
 except ImportError:
     raise ImportError("openpyxl is required for dataset extraction")
 
+from noise_estimator.core.formulas import FormulaModel, parse_cell
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,6 +62,11 @@ def extract_workbook_logic(workbook_path: str, output_path: str):
         if sheet_name in wb.sheetnames:
             extraction["sheets"][sheet_name] = extract_sheet_with_formulas(wb[sheet_name])
     
+    # Tables and constant cells the formulas read, so the formula engine
+    # (noise_estimator.core.formulas) can evaluate them without the workbook
+    extraction["tables"] = extract_tables(wb)
+    extraction["constants"] = extract_constants(wb, extraction)
+    
     # Extract specific calculation logic
     extraction["key_logic"] = {
         "concawe_tables": extract_concawe_tables(wb),
@@ -121,6 +128,38 @@ def extract_sheet_with_formulas(ws):
     return sheet_data
 
 
+def extract_tables(wb):
+    """Extract Excel table definitions that structured references resolve to."""
+    tables = {}
+    for ws in wb.worksheets:
+        for table in ws.tables.values():
+            min_col, min_row, max_col, max_row = range_boundaries(table.ref)
+            header_rows = table.headerRowCount if table.headerRowCount is not None else 1
+            totals_rows = table.totalsRowCount or 0
+            tables[table.name] = {
+                "sheet": ws.title,
+                "ref": table.ref,
+                "data_range": f"{get_column_letter(min_col)}{min_row + header_rows}:"
+                              f"{get_column_letter(max_col)}{max_row - totals_rows}",
+                "columns": [column.name for column in table.tableColumns]
+            }
+    return tables
+
+
+def extract_constants(wb, extraction):
+    """Extract the values of non-formula cells that the extracted formulas read."""
+    model = FormulaModel.from_logic(extraction)
+    constants = {}
+    for cell in model.inputs:
+        sheet_name, row, column = parse_cell(cell)
+        if sheet_name not in wb.sheetnames:
+            continue
+        value = wb[sheet_name].cell(row=row, column=column).value
+        if value is not None and not (isinstance(value, str) and value.startswith("=")):
+            constants[cell] = value
+    return constants
+
+
 def extract_concawe_tables(wb):
     """Extract Concawe propagation tables."""
     concawe_data = {}
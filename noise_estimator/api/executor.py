@@ -0,0 +1,217 @@
+"""
+Bounded executor for running calculations off the event loop.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from ..core.calculator import NoiseCalculator
+from ..core.worker import init_worker, calculate_many, calculate_in_worker, calculate_many_in_worker
+from ..models.schemas import EstimationRequest, EstimationResult
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutorBusy(Exception):
+    """Raised when the calculation queue is full."""
+
+
+class CalculationCancelled(Exception):
+    """Raised when the client disconnected before its calculation finished."""
+
+
+class CalculationExecutor:
+    """Runs calculator work on a bounded thread or process pool.
+
+    At most ``max_workers + max_queue`` calculations are in flight; further
+    submissions are rejected with ``ExecutorBusy`` so overload turns into a
+    fast 503 rather than an ever-growing queue. Threads share the calculator
+    (and its result cache) with the server; processes each load their own
+    copy of the dataset and give true parallelism for CPU-bound requests.
+
+    Thread mode is the default: the pre-forking launcher already runs one
+    server process per CPU, each with its own GIL, and a process pool inside
+    each of those would hold a further dataset copy per worker. Process mode
+    suits a single server process on a multi-core host.
+    """
+
+    def __init__(self, calculator: NoiseCalculator, max_workers: Optional[int] = None,
+                 max_queue: Optional[int] = None, mode: str = "thread", poll_interval: float = 0.1):
+        """Initialize executor.
+
+        Args:
+            calculator: Calculator used in thread mode, and for dataset
+                resolution and result caching in process mode.
+            max_workers: Pool size. Defaults to the number of CPUs.
+            max_queue: Calculations allowed to wait for a worker. Defaults to
+                four per worker.
+            mode: "thread" or "process".
+            poll_interval: Seconds between client disconnect checks.
+        """
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unknown executor mode: {mode}")
+
+        self.calculator = calculator
+        self.mode = mode
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue if max_queue is not None else 4 * self.max_workers
+        self.poll_interval = poll_interval
+
+        self._pool: Executor
+        if mode == "process":
+            dataset_dir = str(Path(calculator.dataset_manager.dataset_dir).resolve())
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=init_worker, initargs=(dataset_dir, calculator.settings())
+            )
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="calculation")
+
+        self._lock = threading.Lock()
+        self._in_flight: Set[Future] = set()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+
+    def submit(self, request: EstimationRequest) -> Future:
+        """Submit a calculation.
+
+        Raises:
+            ExecutorBusy: If the pool and its queue are full.
+        """
+        if self.mode == "process":
+            return self._submit(calculate_in_worker, request)
+        return self._submit(self.calculator.calculate, request)
+
+    def submit_many(self, requests: List[EstimationRequest]) -> Future:
+        """Submit a batch of calculations as one unit of work.
+
+        The future resolves to one result or exception per request, in
+        order, from ``NoiseCalculator.calculate_many``. In process mode,
+        requests should already be pinned with
+        ``NoiseCalculator.pin_dataset_version`` (off the event loop);
+        unpinned ones are pinned here, which may load the dataset.
+
+        Raises:
+            ExecutorBusy: If the pool and its queue are full.
+        """
+        if self.mode == "process":
+            return self._submit(calculate_many_in_worker, self.calculator.pin_dataset_version(requests))
+        return self._submit(calculate_many, self.calculator, requests)
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        with self._lock:
+            if len(self._in_flight) >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusy(f"Calculation queue full ({len(self._in_flight)} in flight)")
+
+            future = self._pool.submit(fn, *args)
+            self._in_flight.add(future)
+            self.submitted += 1
+
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _prepare(self, request: EstimationRequest) -> Tuple[EstimationRequest, Optional[str], Optional[EstimationResult]]:
+        """Pin a request for the process pool and look it up in the result cache.
+
+        Workers load datasets independently, so "current" must be decided
+        here rather than in the worker. Loads datasets, so it runs off the
+        event loop.
+
+        Returns:
+            Tuple of (pinned request, cache key, cached result).
+        """
+        request = self.calculator.pin_dataset_version([request])[0]
+        cache = self.calculator.result_cache
+        if cache is None:
+            return request, None, None
+        dataset = self.calculator.dataset_manager.load_dataset(request.dataset_version)
+        cache_key = cache.key_for(request, dataset, self.calculator.cache_context(dataset))
+        return request, cache_key, cache.get(cache_key)
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._in_flight.discard(future)
+            if future.cancelled():
+                self.cancelled += 1
+            elif future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    async def calculate(self, request: EstimationRequest, http_request: Any = None) -> EstimationResult:
+        """Run a calculation without blocking the event loop.
+
+        Args:
+            request: Estimation request.
+            http_request: Incoming HTTP request; if given, the calculation is
+                cancelled when its client disconnects.
+
+        Returns:
+            Estimation result.
+
+        Raises:
+            ExecutorBusy: If the queue is full.
+            CalculationCancelled: If the client disconnected first.
+        """
+        cache_key = None
+        if self.mode == "process":
+            # Serve repeats from the server-side cache before dispatching
+            request, cache_key, cached = await asyncio.to_thread(self._prepare, request)
+            if cached is not None:
+                return cached
+
+        result = await self.wait(self.submit(request), http_request)
+        if cache_key is not None:
+            self.calculator.result_cache.put(cache_key, result)
+        return result
+
+    async def wait(self, future: Future, http_request: Any = None) -> Any:
+        """Await a submitted future, cancelling it if the client disconnects.
+
+        Raises:
+            CalculationCancelled: If the client disconnected first.
+        """
+        wrapped = asyncio.wrap_future(future)
+        try:
+            while True:
+                done, _ = await asyncio.wait({wrapped}, timeout=self.poll_interval)
+                if done:
+                    break
+                if http_request is not None and await http_request.is_disconnected():
+                    future.cancel()
+                    raise CalculationCancelled("Client disconnected")
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        return wrapped.result()
+
+    def stats(self) -> Dict[str, Union[int, str]]:
+        """Queue depth and throughput counters."""
+        with self._lock:
+            running = sum(1 for future in self._in_flight if future.running())
+            return {
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": len(self._in_flight),
+                "running": running,
+                "queue_depth": len(self._in_flight) - running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Shut the pool down, dropping calculations that have not started."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
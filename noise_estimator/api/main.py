@@ -2,17 +2,26 @@
 FastAPI REST service for the noise estimator system.
 """
 
+import asyncio
+import codecs
+import json
 import logging
+import os
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
 from pydantic import BaseModel, Field
 
+from ..core.batch import error_details, merge_cached, split_cached
+from ..core.cache import ResultCache
 from ..core.dataset import DatasetManager
 from ..core.calculator import NoiseCalculator
+from .executor import CalculationExecutor, CalculationCancelled, ExecutorBusy
 from ..models.schemas import (
     EstimationRequest,
     EstimationResult,
@@ -35,27 +44,110 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Result cache settings
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get("NOISE_ESTIMATOR_CACHE_ENTRIES", "1024"))
+RESULT_CACHE_TTL_SECONDS = float(os.environ.get("NOISE_ESTIMATOR_CACHE_TTL", "600"))
+RESULT_CACHE_MAX_MB = float(os.environ.get("NOISE_ESTIMATOR_CACHE_MB", "64"))
+
+# Calculation pool settings (workers default to the CPU count). Threads are
+# the default as the pre-forking launcher already runs a server process per
+# CPU; "process" suits a single server process on a multi-core host
+EXECUTOR_MODE = os.environ.get("NOISE_ESTIMATOR_EXECUTOR", "thread")
+EXECUTOR_WORKERS = int(os.environ.get("NOISE_ESTIMATOR_WORKERS", "0")) or None
+EXECUTOR_MAX_QUEUE = int(os.environ["NOISE_ESTIMATOR_MAX_QUEUE"]) if "NOISE_ESTIMATOR_MAX_QUEUE" in os.environ else None
+
+# Requests calculated together by /estimate/batch
+BATCH_CHUNK_SIZE = int(os.environ.get("NOISE_ESTIMATOR_BATCH_CHUNK", "256"))
+
+# Seconds between checks for a new default dataset version (0 disables)
+DATASET_WATCH_INTERVAL = float(os.environ.get("NOISE_ESTIMATOR_DATASET_WATCH", "0"))
+
+# Estimated memory budget for resident dataset versions
+DATASET_CACHE_MAX_MB = float(os.environ.get("NOISE_ESTIMATOR_DATASET_CACHE_MB", "1024"))
+
+# Concawe table lookup: "nearest" row as the workbook does, or "interpolated"
+# in log-distance
+PROPAGATION_MODE = os.environ.get("NOISE_ESTIMATOR_PROPAGATION_MODE", "nearest")
+
+# Continue the measured Concawe table to 5 km instead of holding its last
+# row ("1" to enable)
+EXTENDED_RANGE = os.environ.get("NOISE_ESTIMATOR_EXTENDED_RANGE", "0") == "1"
+
+# Concawe met category (1-6 or "worst") to propagate with the parametric model;
+# unset uses the workbook's measured table
+MET_CATEGORY = os.environ.get("NOISE_ESTIMATOR_MET_CATEGORY") or None
+
+# Propagate octave-band sound power levels band by band ("1" to enable)
+SPECTRAL = os.environ.get("NOISE_ESTIMATOR_SPECTRAL", "0") == "1"
+
 # Global components
 dataset_manager: Optional[DatasetManager] = None
 calculator: Optional[NoiseCalculator] = None
+result_cache: Optional[ResultCache] = None
+executor: Optional[CalculationExecutor] = None
+
+
+def initialize_components(dataset_dir: Optional[str] = None):
+    """Create the dataset manager, result cache and calculator.
+    
+    Loads the latest dataset and compiles its views and propagation table,
+    so a pre-forking launcher can call this once in the parent process and
+    share the result with every worker.
+    """
+    global dataset_manager, calculator, result_cache
+    
+    dataset_manager = DatasetManager(dataset_dir, max_cache_bytes=int(DATASET_CACHE_MAX_MB * 1024 * 1024))
+    result_cache = ResultCache(
+        max_entries=RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds=RESULT_CACHE_TTL_SECONDS,
+        max_bytes=int(RESULT_CACHE_MAX_MB * 1024 * 1024)
+    )
+    calculator = NoiseCalculator(
+        dataset_manager,
+        result_cache=result_cache,
+        propagation_mode=PROPAGATION_MODE,
+        extended_range=EXTENDED_RANGE,
+        met_category=MET_CATEGORY,
+        spectral=SPECTRAL
+    )
+    dataset_manager.add_promotion_listener(on_dataset_promoted)
+    
+    # Try to load default dataset
+    try:
+        dataset_manager.load_dataset()
+        dataset_manager.get_propagation_table()
+        logger.info("Default dataset loaded successfully")
+    except FileNotFoundError:
+        logger.warning("No default dataset found. Please extract a dataset first.")
+
+
+def on_dataset_promoted(snapshot):
+    """Drop cached results for datasets that are no longer the default."""
+    if result_cache is not None:
+        result_cache.invalidate(keep_version=snapshot.version)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
-    global dataset_manager, calculator
+    global executor
     
     # Initialize components
     try:
-        dataset_manager = DatasetManager()
-        calculator = NoiseCalculator(dataset_manager)
+        # Components may already have been built by a pre-forking launcher
+        if dataset_manager is None:
+            initialize_components()
         
-        # Try to load default dataset
-        try:
-            dataset_manager.load_dataset()
-            logger.info("Default dataset loaded successfully")
-        except FileNotFoundError:
-            logger.warning("No default dataset found. Please extract a dataset first.")
+        # Pools hold threads or processes, so each server process builds its own
+        executor = CalculationExecutor(
+            calculator,
+            max_workers=EXECUTOR_WORKERS,
+            max_queue=EXECUTOR_MAX_QUEUE,
+            mode=EXECUTOR_MODE
+        )
+        
+        if DATASET_WATCH_INTERVAL > 0:
+            dataset_manager.start_watching(DATASET_WATCH_INTERVAL)
         
         logger.info("Noise Estimator API initialized successfully")
         
@@ -66,6 +158,10 @@ async def lifespan(app: FastAPI):
     yield
     
     # Cleanup
+    if dataset_manager is not None:
+        dataset_manager.stop_watching()
+    if executor is not None:
+        executor.shutdown()
     logger.info("Noise Estimator API shutting down")
 
 
@@ -143,6 +239,19 @@ def handle_validation_errors(func):
     return wrapper
 
 
+async def run_calculation(calc: NoiseCalculator, request: EstimationRequest, http_request: Optional[Request] = None) -> EstimationResult:
+    """Run a calculation on the executor, off the event loop."""
+    if executor is None:
+        return calc.calculate(request)
+    
+    try:
+        return await executor.calculate(request, http_request)
+    except ExecutorBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except CalculationCancelled as e:
+        raise HTTPException(status_code=499, detail=str(e))
+
+
 # API Endpoints
 
 @app.get("/health", response_model=HealthResponse)
@@ -177,9 +286,16 @@ async def get_metadata(dataset_mgr: DatasetManager = Depends(get_dataset_manager
         metadata = {
             "available_versions": datasets,
             "current_version": current_dataset.metadata.version if current_dataset else None,
+            "default_version": dataset_mgr.default_version(),
             "total_datasets": len(datasets)
         }
         
+        metadata["dataset_cache"] = dataset_mgr.cache_stats()
+        if result_cache is not None:
+            metadata["result_cache"] = result_cache.stats()
+        if executor is not None:
+            metadata["executor"] = executor.stats()
+        
         if current_dataset:
             metadata.update({
                 "current_dataset_info": {
@@ -295,6 +411,7 @@ async def list_categories(
 @app.post("/estimate/full/scenario", response_model=APIResponse)
 async def estimate_full_scenario(
     request: EstimationRequestModel,
+    http_request: Request,
     calc: NoiseCalculator = Depends(get_calculator)
 ):
     """Full estimator calculation for scenario mode."""
@@ -316,7 +433,7 @@ async def estimate_full_scenario(
             )
         
         # Perform calculation
-        result = calc.calculate(internal_request)
+        result = await run_calculation(calc, internal_request, http_request)
         
         return APIResponse(
             success=True,
@@ -324,6 +441,8 @@ async def estimate_full_scenario(
             request_id=result.request_id
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Validation error in full scenario estimate: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -335,6 +454,7 @@ async def estimate_full_scenario(
 @app.post("/estimate/full/plant", response_model=APIResponse)
 async def estimate_full_plant(
     request: EstimationRequestModel,
+    http_request: Request,
     calc: NoiseCalculator = Depends(get_calculator)
 ):
     """Full estimator calculation for individual plant mode."""
@@ -356,7 +476,7 @@ async def estimate_full_plant(
             )
         
         # Perform calculation
-        result = calc.calculate(internal_request)
+        result = await run_calculation(calc, internal_request, http_request)
         
         return APIResponse(
             success=True,
@@ -364,6 +484,8 @@ async def estimate_full_plant(
             request_id=result.request_id
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Validation error in full plant estimate: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -375,6 +497,7 @@ async def estimate_full_plant(
 @app.post("/estimate/distance/scenario", response_model=APIResponse)
 async def estimate_distance_scenario(
     request: EstimationRequestModel,
+    http_request: Request,
     calc: NoiseCalculator = Depends(get_calculator)
 ):
     """Distance-based calculation for scenario mode."""
@@ -402,7 +525,7 @@ async def estimate_distance_scenario(
             )
         
         # Perform calculation
-        result = calc.calculate(internal_request)
+        result = await run_calculation(calc, internal_request, http_request)
         
         return APIResponse(
             success=True,
@@ -410,6 +533,8 @@ async def estimate_distance_scenario(
             request_id=result.request_id
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Validation error in distance scenario estimate: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -421,6 +546,7 @@ async def estimate_distance_scenario(
 @app.post("/estimate/distance/noisiest_plant", response_model=APIResponse)
 async def estimate_distance_noisiest_plant(
     request: EstimationRequestModel,
+    http_request: Request,
     calc: NoiseCalculator = Depends(get_calculator)
 ):
     """Distance-based calculation for noisiest plant mode."""
@@ -448,7 +574,7 @@ async def estimate_distance_noisiest_plant(
             )
         
         # Perform calculation
-        result = calc.calculate(internal_request)
+        result = await run_calculation(calc, internal_request, http_request)
         
         return APIResponse(
             success=True,
@@ -456,6 +582,8 @@ async def estimate_distance_noisiest_plant(
             request_id=result.request_id
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Validation error in distance noisiest plant estimate: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -467,6 +595,7 @@ async def estimate_distance_noisiest_plant(
 @app.post("/estimate", response_model=APIResponse)
 async def estimate_universal(
     request: EstimationRequestModel,
+    http_request: Request,
     calc: NoiseCalculator = Depends(get_calculator)
 ):
     """Universal estimation endpoint that handles all calculation types."""
@@ -475,7 +604,7 @@ async def estimate_universal(
         internal_request = EstimationRequest(**request.dict())
         
         # Perform calculation
-        result = calc.calculate(internal_request)
+        result = await run_calculation(calc, internal_request, http_request)
         
         return APIResponse(
             success=True,
@@ -483,6 +612,8 @@ async def estimate_universal(
             request_id=result.request_id
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         logger.error(f"Validation error in universal estimate: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -491,6 +622,241 @@ async def estimate_universal(
         raise HTTPException(status_code=500, detail="Calculation failed")
 
 
+def batch_error(index: Optional[int], error: Exception) -> Dict[str, Any]:
+    """NDJSON record for a batch item that failed."""
+    return {"index": index, "success": False, "errors": error_details(error)}
+
+
+class BatchBodyParser:
+    """Incremental parser for a batch body: a JSON array or NDJSON.
+    
+    Fed text as it arrives, returns the (index, item) pairs completed so
+    far, so the body never has to be held whole. NDJSON lines that are not
+    valid JSON give the decode error in place of the item; a malformed
+    array raises ``ValueError``, as its remaining items cannot be found.
+    Items completed before the damage are returned first, and the error
+    (kept in ``error``) is raised by the next call.
+    """
+    
+    def __init__(self):
+        self.buffer = ""
+        self.index = 0
+        self.is_array: Optional[bool] = None
+        self.error: Optional[ValueError] = None
+        self._expect = "item"  # array state: "item", "separator" or "end"
+        self._decoder = json.JSONDecoder()
+    
+    def feed(self, text: str, final: bool = False) -> List[Tuple[int, Any]]:
+        """Parse more of the body; ``final`` marks its end."""
+        if self.error:
+            raise self.error
+        self.buffer += text
+        items: List[Tuple[int, Any]] = []
+        if self.is_array is None:
+            stripped = self.buffer.lstrip()
+            if not stripped:
+                return items
+            self.is_array = stripped.startswith("[")
+            if self.is_array:
+                self.buffer = stripped[1:]
+        
+        if self.is_array:
+            try:
+                self._feed_array(items, final)
+            except ValueError as e:
+                if not items:
+                    raise
+                self.error = e
+        else:
+            self._feed_lines(items, final)
+        return items
+    
+    def _feed_lines(self, items: List[Tuple[int, Any]], final: bool):
+        *lines, self.buffer = self.buffer.split("\n")
+        if final:
+            lines.append(self.buffer)
+            self.buffer = ""
+        for line in lines:
+            if line.strip():
+                try:
+                    items.append((self.index, json.loads(line)))
+                except json.JSONDecodeError as e:
+                    items.append((self.index, e))
+                self.index += 1
+    
+    def _feed_array(self, items: List[Tuple[int, Any]], final: bool):
+        buffer = self.buffer
+        position = 0
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position == len(buffer):
+                break
+            
+            char = buffer[position]
+            if self._expect == "end":
+                raise ValueError("Unexpected data after the batch array")
+            if char == "]" and (self._expect == "separator" or self.index == 0):
+                self._expect = "end"
+                position += 1
+            elif self._expect == "separator":
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' after batch item {self.index - 1}")
+                self._expect = "item"
+                position += 1
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if final:
+                        raise ValueError(f"Invalid JSON array: {e}")
+                    break
+                if end == len(buffer) and not final:
+                    # A number at the end of the buffer may have more digits to come
+                    break
+                items.append((self.index, item))
+                self.index += 1
+                self._expect = "separator"
+                position = end
+        
+        self.buffer = buffer[position:]
+        if final and self._expect != "end":
+            raise ValueError("Batch body must be a JSON array or NDJSON")
+
+
+async def read_batch_items(http_request: Request) -> AsyncIterator[Tuple[int, Any]]:
+    """Parse a batch body as it arrives, yielding (index, parsed item) pairs.
+    
+    See ``BatchBodyParser``; the body is decoded incrementally, so
+    characters split between network chunks are reassembled.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parser = BatchBodyParser()
+    async for chunk in http_request.stream():
+        for item in parser.feed(decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(decoder.decode(b"", final=True), final=True):
+        yield item
+    if parser.error:
+        raise parser.error
+
+
+def pin_and_split(calc: NoiseCalculator, valid: List[Tuple[int, EstimationRequest]]):
+    """Pin a chunk's requests to one dataset version, then look them up in the cache."""
+    requests = [request for _, request in valid]
+    try:
+        pinned = calc.pin_dataset_version(requests)
+    except Exception:
+        # No dataset loads; the calculation reports it per item
+        pinned = requests
+    return split_cached(calc, [(index, request) for (index, _), request in zip(valid, pinned)])
+
+
+async def calculate_batch_chunk(calc: NoiseCalculator, chunk: List[Tuple[int, Any]], http_request: Request) -> List[str]:
+    """Validate and calculate one chunk of batch items as NDJSON lines."""
+    records: Dict[int, Dict[str, Any]] = {}
+    valid: List[Tuple[int, EstimationRequest]] = []
+    for index, item in chunk:
+        try:
+            if isinstance(item, Exception):
+                raise ValueError(f"Invalid JSON: {item}")
+            valid.append((index, EstimationRequest.model_validate(item)))
+        except Exception as e:
+            records[index] = batch_error(index, e)
+    
+    if valid:
+        # Repeats are served from the result cache, as for /estimate; pinning
+        # (for process workers) and lookups may load datasets, so run off the loop
+        split, requests = await asyncio.to_thread(pin_and_split, calc, valid)
+        if executor is None or not requests:
+            calculated = list(calc.calculate_many(requests, return_exceptions=True))
+        else:
+            # Wait for capacity rather than failing items mid-stream
+            while True:
+                try:
+                    future = executor.submit_many(requests)
+                    break
+                except ExecutorBusy:
+                    if await http_request.is_disconnected():
+                        raise CalculationCancelled("Client disconnected")
+                    await asyncio.sleep(executor.poll_interval)
+            calculated = await executor.wait(future, http_request)
+        outcomes = merge_cached(calc, split, calculated)
+        
+        for (index, _), outcome in zip(valid, outcomes):
+            if isinstance(outcome, Exception):
+                records[index] = batch_error(index, outcome)
+            else:
+                records[index] = {"index": index, "success": True, "data": outcome.model_dump(mode="json")}
+    
+    return [json.dumps(records[index]) + "\n" for index, _ in chunk]
+
+
+class BodyStreamingResponse(StreamingResponse):
+    """Streaming response whose iterator still reads the request body.
+    
+    ``StreamingResponse`` may listen for the client disconnecting on the
+    request's receive channel while it streams, which would swallow body
+    chunks. This one leaves the channel to the body reader; disconnects
+    surface there, or through ``Request.is_disconnected`` once the body is
+    read, or as a failed send.
+    """
+    
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
+
+
+@app.post("/estimate/batch")
+async def estimate_batch(
+    http_request: Request,
+    calc: NoiseCalculator = Depends(get_calculator)
+):
+    """Batch estimation streaming one NDJSON result per request.
+    
+    The body is a JSON array or NDJSON stream of estimation requests. It
+    is parsed as it arrives, and requests are calculated in chunks through
+    the vectorized batch path, each chunk written as soon as it completes;
+    the next chunk is only read and calculated once the client has taken
+    the previous one, so memory does not grow with the body. Repeated
+    requests are served from the result cache. Failed items are reported
+    in place without ending the stream.
+    """
+    items = read_batch_items(http_request)
+    
+    # A body that is malformed from the start is rejected before streaming
+    try:
+        first = [await items.__anext__()]
+    except StopAsyncIteration:
+        first = []
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid batch body: {e}")
+    
+    async def stream():
+        chunk = first
+        try:
+            async for item in items:
+                chunk.append(item)
+                if len(chunk) >= BATCH_CHUNK_SIZE:
+                    for line in await calculate_batch_chunk(calc, chunk, http_request):
+                        yield line
+                    chunk = []
+            if chunk:
+                for line in await calculate_batch_chunk(calc, chunk, http_request):
+                    yield line
+        except (CalculationCancelled, ClientDisconnect):
+            logger.info("Batch estimate cancelled by client")
+        except Exception as e:
+            logger.error(f"Batch estimate failed: {e}")
+            yield json.dumps(batch_error(None, e)) + "\n"
+    
+    return BodyStreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @app.get("/datasets", response_model=Dict[str, Any])
 async def list_datasets(dataset_mgr: DatasetManager = Depends(get_dataset_manager)):
     """List available datasets with detailed information."""
@@ -522,6 +888,10 @@ async def load_dataset(
     try:
         dataset = dataset_mgr.load_dataset(version)
         
+        # Results for other datasets can no longer be requested by default
+        if result_cache is not None:
+            result_cache.invalidate(keep_version=dataset.metadata.version)
+        
         return {
             "success": True,
             "message": f"Dataset {version} loaded successfully",
@@ -572,7 +942,7 @@ async def validate_worked_examples(
                 request = EstimationRequest(**inputs)
                 
                 # Calculate result
-                result = calc.calculate(request)
+                result = await run_calculation(calc, request)
                 
                 # Get expected outputs
                 expected = example["expected_outputs"]
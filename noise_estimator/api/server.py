@@ -0,0 +1,234 @@
+"""
+Pre-forking launcher for the API server.
+Loads the dataset once in a parent process and forks workers that share it copy-on-write.
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Dict, Optional
+
+import uvicorn
+
+from . import main as api_main
+
+logger = logging.getLogger(__name__)
+
+
+class PreforkServer:
+    """Parent process that pre-loads the dataset and supervises API workers.
+
+    The parent builds the dataset manager, views, propagation tables and
+    calculator, freezes them out of the garbage collector and then forks
+    the workers, so every worker shares one copy of those pages until it
+    writes to them. Workers all accept on one listening socket.
+
+    Signals:
+        SIGHUP: Reload the latest dataset and restart workers one at a time.
+        SIGTERM / SIGINT: Shut workers down gracefully and exit.
+
+    With a watch interval set, a change of default dataset version in the
+    manifest (a new extraction or an activation) triggers the same rolling
+    restart as SIGHUP.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8000, workers: Optional[int] = None,
+                 dataset_dir: Optional[str] = None, watch_interval: float = 0.0,
+                 graceful_timeout: float = 30.0, log_level: str = "info"):
+        """Initialize launcher.
+
+        Args:
+            host: Interface to bind.
+            port: Port to bind.
+            workers: Number of worker processes. Defaults to the CPU count.
+            dataset_dir: Dataset directory.
+            watch_interval: Seconds between checks for a newly promoted
+                dataset version; 0 disables watching.
+            graceful_timeout: Seconds a worker is given to finish in-flight
+                requests before it is killed.
+            log_level: Uvicorn log level for workers.
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.dataset_dir = dataset_dir
+        self.watch_interval = watch_interval
+        self.graceful_timeout = graceful_timeout
+        self.log_level = log_level
+
+        self._socket: Optional[socket.socket] = None
+        self._children: Dict[int, float] = {}  # pid -> start time
+        self._loaded_version: Optional[str] = None
+        self._reload_requested = False
+        self._stopping = False
+
+    def run(self):
+        """Bind, pre-load, fork workers and supervise them until stopped."""
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind((self.host, self.port))
+        self._socket.listen(2048)
+        self._socket.set_inheritable(True)
+
+        self._preload()
+
+        signal.signal(signal.SIGHUP, self._on_reload_signal)
+        signal.signal(signal.SIGTERM, self._on_stop_signal)
+        signal.signal(signal.SIGINT, self._on_stop_signal)
+
+        for _ in range(self.workers):
+            self._spawn()
+        logger.info(f"Serving on http://{self.host}:{self.port} with {self.workers} pre-forked workers")
+
+        last_check = time.monotonic()
+        try:
+            while not self._stopping:
+                time.sleep(0.5)
+                self._reap()
+
+                if self.watch_interval and time.monotonic() - last_check >= self.watch_interval:
+                    last_check = time.monotonic()
+                    if self._latest_version() not in (None, self._loaded_version):
+                        self._reload_requested = True
+
+                if self._reload_requested and not self._stopping:
+                    self._reload_requested = False
+                    self._reload()
+        finally:
+            self._shutdown()
+
+    def _on_reload_signal(self, signum, frame):
+        self._reload_requested = True
+
+    def _on_stop_signal(self, signum, frame):
+        self._stopping = True
+
+    def _preload(self):
+        """Build shared components and freeze them for copy-on-write sharing."""
+        gc.unfreeze()
+        api_main.initialize_components(self.dataset_dir)
+
+        current = api_main.dataset_manager.get_current_dataset()
+        self._loaded_version = current.metadata.version if current else None
+
+        # Frozen objects are never touched by the collector, so collections
+        # in the workers do not dirty the shared pages
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Pre-loaded dataset {self._loaded_version}")
+
+    def _latest_version(self) -> Optional[str]:
+        try:
+            api_main.dataset_manager.get_manifest(refresh=True)
+            return api_main.dataset_manager.default_version()
+        except OSError:
+            return None
+
+    def _spawn(self) -> int:
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker()
+        self._children[pid] = time.monotonic()
+        return pid
+
+    def _run_worker(self):
+        """Worker process body; never returns."""
+        exit_code = 0
+        try:
+            for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+                signal.signal(signum, signal.SIG_DFL)
+
+            config = uvicorn.Config(
+                api_main.app,
+                log_level=self.log_level,
+                timeout_graceful_shutdown=int(self.graceful_timeout)
+            )
+            uvicorn.Server(config).run(sockets=[self._socket])
+        except BaseException as e:
+            logger.error(f"Worker {os.getpid()} failed: {e}")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def _reap(self):
+        """Collect exited workers and replace any that died unexpectedly."""
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            started = self._children.pop(pid, None)
+            if started is None or self._stopping:
+                continue
+
+            logger.warning(f"Worker {pid} exited with status {status}; restarting")
+            # Avoid a tight crash loop if workers die straight after starting
+            if time.monotonic() - started < 1.0:
+                time.sleep(1.0)
+            self._spawn()
+
+    def _stop_worker(self, pid: int):
+        """Ask a worker to finish in-flight requests and exit, then reap it."""
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            self._children.pop(pid, None)
+            return
+        self._wait_worker(pid, time.monotonic() + self.graceful_timeout)
+
+    def _wait_worker(self, pid: int, deadline: float):
+        """Reap a stopping worker, killing it if it outlives the deadline."""
+        while time.monotonic() < deadline:
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done == pid:
+                self._children.pop(pid, None)
+                return
+            time.sleep(0.1)
+
+        logger.warning(f"Worker {pid} did not stop within {self.graceful_timeout}s; killing")
+        try:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        except (ProcessLookupError, ChildProcessError):
+            # Exited (and possibly reaped) since the last check
+            pass
+        self._children.pop(pid, None)
+
+    def _reload(self):
+        """Reload the dataset in the parent and restart workers one by one."""
+        previous = self._loaded_version
+        try:
+            self._preload()
+        except Exception as e:
+            logger.error(f"Dataset reload failed, keeping current workers: {e}")
+            return
+
+        logger.info(f"Rolling restart of {len(self._children)} workers ({previous} -> {self._loaded_version})")
+        for pid in list(self._children):
+            # Start the replacement first so capacity never drops
+            self._spawn()
+            self._stop_worker(pid)
+
+    def _shutdown(self):
+        logger.info("Shutting down workers")
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+
+        # Workers drain in parallel, so one deadline covers them all
+        deadline = time.monotonic() + self.graceful_timeout
+        for pid in list(self._children):
+            self._wait_worker(pid, deadline)
+        if self._socket is not None:
+            self._socket.close()
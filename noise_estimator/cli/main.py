@@ -3,7 +3,10 @@ Main CLI interface for the noise estimator system.
 """
 
 import json
+import os
 import sys
+import time
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import logging
@@ -16,9 +19,11 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm, IntPrompt, FloatPrompt, Choice
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ..core.batch import run_batch
+from ..core.cache import ResultCache
 from ..core.dataset import DatasetManager
 from ..core.calculator import NoiseCalculator
-from ..extract.dataset_extractor import DatasetExtractor
+from ..extract.pipeline import run_pipeline
 from ..models.schemas import (
     EstimationRequest,
     AssessmentType,
@@ -59,18 +64,27 @@ def cli(ctx, verbose):
 @cli.command()
 @click.option('--workbook', '-w', required=True, help='Path to Excel workbook file')
 @click.option('--out', '-o', default='datasets', help='Output directory for datasets')
+@click.option('--workers', type=int, default=1, show_default=True, help='Processes reading sheets in parallel')
+@click.option('--frontend-dir', type=click.Path(file_okay=False), default=None,
+              help='Also publish the frontend data files (plants, scenarios, wizard data) here')
+@click.option('--no-artifacts', is_flag=True, help='Extract the dataset only, without artifacts')
+@click.option('--workbook-map', default='docs/workbook_map.json',
+              help='Structure map from workbook_mapper.py, used to locate tables when it matches the workbook')
 @click.pass_context
-def extract_dataset(ctx, workbook: str, out: str):
-    """Extract dataset from Excel workbook."""
+def extract_dataset(ctx, workbook: str, out: str, workers: int, frontend_dir: Optional[str], no_artifacts: bool,
+                    workbook_map: str):
+    """Extract dataset and artifacts from Excel workbook in one pass."""
     console.print(f"[bold green]Extracting dataset from: {workbook}[/bold green]")
     
     try:
-        extractor = DatasetExtractor()
-        version = extractor.extract_dataset(workbook, out)
+        version = run_pipeline(workbook, out, frontend_dir=frontend_dir, workers=workers,
+                               handlers=[] if no_artifacts else None, workbook_map=workbook_map)
         
         console.print(f"[bold green]✓[/bold green] Dataset extracted successfully!")
         console.print(f"Version: {version}")
         console.print(f"Output directory: {out}/{version}")
+        if frontend_dir and not no_artifacts:
+            console.print(f"Frontend data published to: {frontend_dir}")
         
     except Exception as e:
         console.print(f"[bold red]✗[/bold red] Extraction failed: {e}")
@@ -79,17 +93,32 @@ def extract_dataset(ctx, workbook: str, out: str):
 
 @cli.command()
 @click.option('--input', '-i', type=click.Path(exists=True), help='Input JSON file')
-@click.option('--output', '-o', type=click.Path(), help='Output JSON file')
+@click.option('--batch', '-b', type=click.Path(exists=True), help='Input JSONL file, one request per line')
+@click.option('--output', '--out', '-o', type=click.Path(), help='Output JSON file (JSONL with --batch)')
+@click.option('--workers', '-w', type=int, default=None, help='Worker processes for --batch [default: CPU count]')
 @click.option('--dataset-dir', '-d', default='datasets', help='Dataset directory')
+@click.option('--cache-mb', default=16.0, show_default=True, help='Result cache budget in MB (0 disables)')
+@click.option('--propagation-mode', type=click.Choice(['nearest', 'interpolated']), default='nearest', show_default=True,
+              help='Concawe table lookup: nearest row as the workbook does, or interpolated in log-distance')
+@click.option('--extended-range', is_flag=True, help='Continue the measured Concawe table to 5 km instead of holding its last row')
+@click.option('--met-category', type=click.Choice(['1', '2', '3', '4', '5', '6', 'worst']), default=None,
+              help='Propagate with the parametric Concawe model under this met category [default: workbook table]')
+@click.option('--spectral', is_flag=True, help='Propagate octave-band sound power levels band by band')
 @click.pass_context
-def run(ctx, input: Optional[str], output: Optional[str], dataset_dir: str):
+def run(ctx, input: Optional[str], batch: Optional[str], output: Optional[str], workers: Optional[int], dataset_dir: str, cache_mb: float,
+        propagation_mode: str, extended_range: bool, met_category: Optional[str], spectral: bool):
     """Run noise estimation calculation."""
     try:
         # Initialize components
         dataset_manager = DatasetManager(dataset_dir)
-        calculator = NoiseCalculator(dataset_manager)
-        
-        if input:
+        result_cache = ResultCache(max_bytes=int(cache_mb * 1024 * 1024)) if cache_mb > 0 else None
+        calculator = NoiseCalculator(dataset_manager, result_cache=result_cache, propagation_mode=propagation_mode,
+                                     extended_range=extended_range, met_category=met_category, spectral=spectral)
+        
+        if batch:
+            # Batch mode
+            run_batch_file(calculator, batch, output, workers or os.cpu_count() or 1)
+        elif input:
             # Non-interactive mode
             run_non_interactive(calculator, input, output)
         else:
@@ -136,6 +165,40 @@ def run_non_interactive(calculator: NoiseCalculator, input_file: str, output_fil
     print_result_summary(result)
 
 
+def run_batch_file(calculator: NoiseCalculator, batch_file: str, output_file: Optional[str], workers: int):
+    """Run a JSONL batch, writing JSONL results in input order."""
+    # Results go to stdout when there is no output file, so report on stderr
+    status = console if output_file else Console(stderr=True)
+    status.print(f"[bold blue]Running batch calculation with {workers} worker(s)...[/bold blue]")
+    
+    # Fail before starting workers if there is no dataset
+    calculator.dataset_manager.load_dataset()
+    
+    start = time.perf_counter()
+    with open(batch_file, 'r') as lines, \
+            (open(output_file, 'w') if output_file else nullcontext(sys.stdout)) as out:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("{task.completed} requests"),
+            console=status
+        ) as progress:
+            task = progress.add_task("Calculated", total=None)
+            counts = run_batch(
+                calculator, lines, out.write, workers=workers,
+                on_record=lambda record: progress.advance(task)
+            )
+    
+    elapsed = time.perf_counter() - start
+    total = counts["succeeded"] + counts["failed"]
+    status.print(
+        f"[bold green]✓[/bold green] {total} requests in {elapsed:.1f}s: "
+        f"{counts['succeeded']} succeeded, {counts['failed']} failed"
+    )
+    if output_file:
+        status.print(f"[bold green]✓[/bold green] Results saved to: {output_file}")
+
+
 def run_interactive(calculator: NoiseCalculator, output_file: Optional[str]):
     """Run calculation in interactive mode."""
     console.print(Panel.fit(
@@ -480,6 +543,32 @@ def print_result_summary(result):
         console.print(f"Distance to exceed background: {result.distances.distance_to_exceed_background} m")
 
 
+@cli.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='Interface to bind')
+@click.option('--port', '-p', default=8000, show_default=True, help='Port to bind')
+@click.option('--workers', '-w', type=int, default=None, help='API worker processes [default: CPU count]')
+@click.option('--dataset-dir', '-d', default='datasets', help='Dataset directory')
+@click.option('--watch-interval', default=30.0, show_default=True, help='Seconds between checks for a new dataset version (0 disables)')
+@click.option('--graceful-timeout', default=30.0, show_default=True, help='Seconds workers get to finish requests on restart')
+@click.pass_context
+def serve(ctx, host: str, port: int, workers: Optional[int], dataset_dir: str, watch_interval: float, graceful_timeout: float):
+    """Serve the API from pre-forked workers sharing one loaded dataset.
+    
+    Send SIGHUP to reload the latest dataset and restart workers one by one.
+    """
+    from ..api.server import PreforkServer
+    
+    PreforkServer(
+        host=host,
+        port=port,
+        workers=workers,
+        dataset_dir=dataset_dir,
+        watch_interval=watch_interval,
+        graceful_timeout=graceful_timeout,
+        log_level='debug' if ctx.obj['verbose'] else 'info'
+    ).run()
+
+
 @cli.command()
 @click.option('--dataset-dir', '-d', default='datasets', help='Dataset directory')
 @click.pass_context
@@ -589,6 +678,32 @@ def list_categories(ctx, dataset_dir: str):
         console.print(f"[bold red]✗[/bold red] Failed to list categories: {e}")
 
 
+@cli.command()
+@click.argument('version', required=False)
+@click.option('--latest', is_flag=True, help='Unpin, so the latest version is the default')
+@click.option('--rescan', is_flag=True, help='Rebuild the manifest from the dataset folders first')
+@click.option('--dataset-dir', '-d', default='datasets', help='Dataset directory')
+@click.pass_context
+def activate_dataset(ctx, version: Optional[str], latest: bool, rescan: bool, dataset_dir: str):
+    """Set the dataset version used when requests do not name one."""
+    try:
+        dataset_manager = DatasetManager(dataset_dir)
+        if rescan:
+            manifest = dataset_manager.rebuild_manifest()
+            console.print(f"Manifest rebuilt with {len(manifest['versions'])} versions")
+        
+        if version or latest:
+            dataset_manager.set_active_version(None if latest else version)
+        
+        manifest = dataset_manager.get_manifest(refresh=True)
+        console.print(f"Latest: {manifest['latest'] or 'none'}")
+        console.print(f"Active: {manifest['active'] or 'latest'}")
+        
+    except Exception as e:
+        console.print(f"[bold red]✗[/bold red] Failed to update manifest: {e}")
+        sys.exit(1)
+
+
 @cli.command()
 @click.option('--dataset-dir', '-d', default='datasets', help='Dataset directory')
 @click.pass_context
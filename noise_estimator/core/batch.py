@@ -0,0 +1,183 @@
+"""
+Streaming JSONL batch runner.
+Calculates a file of requests in bounded chunks and writes results in input order.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import json
+import logging
+
+from pydantic import ValidationError as PydanticValidationError
+
+from .calculator import NoiseCalculator
+from .worker import init_worker, calculate_many, calculate_many_in_worker
+from ..models.schemas import EstimationRequest, EstimationResult
+
+logger = logging.getLogger(__name__)
+
+# (line number, request or the error that stopped it being parsed)
+BatchItem = Tuple[int, Union[EstimationRequest, Exception]]
+
+
+def error_details(error: Exception) -> List[Dict[str, Any]]:
+    """Describe an error as a list of {field, message, value} entries."""
+    if isinstance(error, PydanticValidationError):
+        return [
+            {"field": ".".join(str(part) for part in e["loc"]) or "general", "message": e["msg"], "value": None}
+            for e in error.errors()
+        ]
+    return [{"field": "general", "message": str(error), "value": None}]
+
+
+def parse_request_lines(lines: Iterable[str]) -> Iterator[BatchItem]:
+    """Parse JSONL request lines lazily, skipping blank lines.
+
+    Line numbers start at 1 and count blank lines, so they match the file.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, EstimationRequest.model_validate_json(line)
+        except Exception as e:
+            yield line_number, e
+
+
+def _chunks(items: Iterator[BatchItem], size: int) -> Iterator[List[BatchItem]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _pin_chunks(calculator: NoiseCalculator, chunks: Iterator[List[BatchItem]]) -> Iterator[List[BatchItem]]:
+    """Pin unpinned requests to the default dataset version, resolved once for the run.
+
+    Workers load datasets on their own, so leaving the version to each of
+    them could split one run across versions after a promotion.
+    """
+    version: Optional[str] = None
+    for index, chunk in enumerate(chunks):
+        if index == 0:
+            try:
+                version = calculator.dataset_manager.load_dataset().metadata.version
+            except Exception as e:
+                # Left unpinned; the calculations report the failure
+                logger.warning(f"Could not resolve the default dataset version: {e}")
+        if version is not None:
+            chunk = [
+                (line_number, item if isinstance(item, Exception) or item.dataset_version is not None
+                 else item.model_copy(update={"dataset_version": version}))
+                for line_number, item in chunk
+            ]
+        yield chunk
+
+
+def _records(chunk: List[BatchItem], outcomes: List[Union[EstimationResult, Exception]]) -> Iterator[Dict[str, Any]]:
+    """Merge parse failures and calculation outcomes back into line order."""
+    outcomes = iter(outcomes)
+    for line_number, item in chunk:
+        outcome = item if isinstance(item, Exception) else next(outcomes)
+        if isinstance(outcome, Exception):
+            yield {"line": line_number, "success": False, "errors": error_details(outcome)}
+        else:
+            yield {"line": line_number, "success": True, "data": outcome.model_dump(mode="json")}
+
+
+# Cached result (or None) and cache key of each parsed request in a chunk
+CachedSplit = Tuple[List[Optional[EstimationResult]], List[Optional[Tuple[str, str]]]]
+
+
+def split_cached(calculator: NoiseCalculator, chunk: List[BatchItem]) -> Tuple[CachedSplit, List[EstimationRequest]]:
+    """Look up a chunk's parsed requests in the result cache.
+
+    Items may be tagged with line numbers or any other index; items that
+    failed to parse are skipped.
+
+    Returns:
+        Cached results and cache keys, one per parsed request, and the
+        requests still to calculate.
+    """
+    requests = [item for _, item in chunk if not isinstance(item, Exception)]
+    hits, keys = calculator.cache_lookup(requests)
+    return (hits, keys), [request for request, hit in zip(requests, hits) if hit is None]
+
+
+def merge_cached(calculator: NoiseCalculator, split: CachedSplit,
+                  calculated: List[Union[EstimationResult, Exception]]) -> List[Union[EstimationResult, Exception]]:
+    """Fill the cache misses with calculated outcomes, caching the new results."""
+    hits, keys = split
+    calculated = iter(calculated)
+    outcomes = [hit if hit is not None else next(calculated) for hit in hits]
+    calculator.cache_store([key if hit is None else None for key, hit in zip(keys, hits)], outcomes)
+    return outcomes
+
+
+def run_batch(calculator: NoiseCalculator, lines: Iterable[str], write: Callable[[str], Any],
+              workers: int = 1, chunk_size: int = 64,
+              on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, int]:
+    """Calculate a stream of JSONL requests and write JSONL results.
+
+    Requests are read lazily and calculated ``chunk_size`` at a time through
+    ``NoiseCalculator.calculate_many``. With more than one worker, chunks
+    run on a process pool whose workers each load the dataset once; at most
+    two chunks per worker are in flight, so memory stays constant however
+    long the input is. Results are written in input order, one line per
+    request, tagged with the input line number. Requests are looked up in
+    and added to the calculator's result cache here, as workers have none.
+    Requests without a dataset version are all calculated against the
+    default version resolved here when the run starts.
+
+    Args:
+        calculator: Calculator used in-process, and whose dataset directory
+            the workers load from.
+        lines: Input lines, one JSON request per line.
+        write: Called with each output line (including the newline).
+        workers: Number of worker processes; 1 runs in-process.
+        chunk_size: Requests calculated per task.
+        on_record: Optional callback for each record written.
+
+    Returns:
+        Counts of succeeded and failed requests.
+    """
+    counts = {"succeeded": 0, "failed": 0}
+
+    def emit(chunk: List[BatchItem], outcomes: List[Union[EstimationResult, Exception]]):
+        for record in _records(chunk, outcomes):
+            write(json.dumps(record) + "\n")
+            counts["succeeded" if record["success"] else "failed"] += 1
+            if on_record is not None:
+                on_record(record)
+
+    chunks = _pin_chunks(calculator, _chunks(parse_request_lines(lines), chunk_size))
+
+    if workers <= 1:
+        for chunk in chunks:
+            split, misses = split_cached(calculator, chunk)
+            emit(chunk, merge_cached(calculator, split, calculate_many(calculator, misses)))
+        return counts
+
+    dataset_dir = str(Path(calculator.dataset_manager.dataset_dir).resolve())
+    pending: Deque[Tuple[List[BatchItem], CachedSplit, Future]] = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(dataset_dir, calculator.settings())) as pool:
+        for chunk in chunks:
+            split, misses = split_cached(calculator, chunk)
+            pending.append((chunk, split, pool.submit(calculate_many_in_worker, misses)))
+
+            # Bounded window: write the oldest chunk before reading further
+            if len(pending) >= 2 * workers:
+                done_chunk, split, future = pending.popleft()
+                emit(done_chunk, merge_cached(calculator, split, future.result()))
+
+        while pending:
+            done_chunk, split, future = pending.popleft()
+            emit(done_chunk, merge_cached(calculator, split, future.result()))
+
+    return counts
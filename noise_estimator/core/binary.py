@@ -0,0 +1,311 @@
+"""
+Compiled binary dataset artifact.
+A columnar, memory-mappable companion to dataset.json that loads without re-validating rows.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from ..models.schemas import ExtractedDataset, DatasetMetadata, TableMetadata
+
+logger = logging.getLogger(__name__)
+
+BINARY_FILENAME = "dataset.bin"
+FORMAT_VERSION = 2
+
+# magic, format version, header length, SHA-256 of header + data
+_MAGIC = b"NEDS"
+_PREAMBLE = struct.Struct("<4sIQ32s")
+_ALIGN = 64
+
+
+class BinaryDatasetError(Exception):
+    """Raised when a binary artifact is missing, stale or corrupt."""
+
+
+def _pad(length: int) -> int:
+    return -length % _ALIGN
+
+
+class _ArrayWriter:
+    """Collects arrays into one 64-byte aligned data section."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> Dict[str, Any]:
+        array = np.ascontiguousarray(array)
+        ref = {"dtype": array.dtype.str, "offset": self.size, "count": int(array.size)}
+        data = array.tobytes()
+        self.chunks.append(data + b"\0" * _pad(len(data)))
+        self.size += len(data) + _pad(len(data))
+        return ref
+
+
+def _column_kind(values: List[Any]) -> str:
+    """Storage kind for the present (non-None) values of a column."""
+    present = [value for value in values if value is not None]
+    if not present:
+        return "json"
+    if all(type(value) is bool for value in present):
+        return "bool"
+    if all(type(value) is int for value in present) and all(-2 ** 63 <= value < 2 ** 63 for value in present):
+        return "int"
+    if all(type(value) is float for value in present):
+        return "float"
+    if all(type(value) is str for value in present):
+        return "str"
+    return "json"
+
+
+class _StringPool:
+    """Shared, de-duplicated string table referenced by integer codes."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.strings)
+            self.strings.append(value)
+        return code
+
+
+def _encode_column(values: List[Any], writer: _ArrayWriter, pool: _StringPool) -> Dict[str, Any]:
+    kind = _column_kind(values)
+    if kind == "json":
+        return {"kind": "json", "values": values}
+
+    nulls = [value is None for value in values]
+    if kind == "str":
+        data = np.array([pool.code(value) if value is not None else 0 for value in values], dtype=np.uint32)
+    elif kind == "bool":
+        data = np.array([bool(value) for value in values], dtype=np.uint8)
+    elif kind == "int":
+        data = np.array([value if value is not None else 0 for value in values], dtype=np.int64)
+    else:
+        data = np.array([value if value is not None else 0.0 for value in values], dtype=np.float64)
+
+    column = {"kind": kind, "data": writer.add(data)}
+    if any(nulls):
+        column["nulls"] = writer.add(np.array(nulls, dtype=np.uint8))
+    return column
+
+
+def _encode_table(table: Any, writer: _ArrayWriter, pool: _StringPool) -> Dict[str, Any]:
+    """Encode a list of row dicts column by column; anything else stays JSON."""
+    if not isinstance(table, list) or not table or not all(isinstance(row, dict) for row in table):
+        return {"layout": "json", "value": table}
+
+    names: List[str] = []
+    seen = set()
+    for row in table:
+        for key in row:
+            if key not in seen:
+                seen.add(key)
+                names.append(key)
+
+    columns = []
+    for name in names:
+        column = _encode_column([row.get(name) for row in table], writer, pool)
+        present = [name in row for row in table]
+        if not all(present):
+            column["present"] = writer.add(np.array(present, dtype=np.uint8))
+        columns.append(column)
+
+    return {"layout": "records", "rows": len(table), "names": names, "columns": columns}
+
+
+def source_stamp(content: bytes) -> Dict[str, Any]:
+    """Size and SHA-256 identifying the ``dataset.json`` an artifact was built from."""
+    return {"size": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+
+
+def write_dataset_binary(dataset: Dict[str, Any], path: Union[str, Path],
+                         source: Optional[Dict[str, Any]] = None) -> Path:
+    """Write the binary artifact for a dataset.
+
+    Args:
+        dataset: Dataset as written to ``dataset.json`` (metadata, tables,
+            table_metadata).
+        path: Output file. Written atomically.
+        source: ``source_stamp`` of the ``dataset.json`` content the dataset
+            was read from. ``load_if_current`` only uses artifacts whose
+            stamp matches the current file.
+
+    Returns:
+        Path of the written artifact.
+    """
+    path = Path(path)
+    writer = _ArrayWriter()
+    pool = _StringPool()
+
+    tables = {name: _encode_table(table, writer, pool) for name, table in dataset.get("tables", {}).items()}
+    header = {
+        "format_version": FORMAT_VERSION,
+        "source": source,
+        "metadata": dataset["metadata"],
+        "table_metadata": dataset.get("table_metadata", {}),
+        "strings": pool.strings,
+        "tables": tables,
+    }
+    header_bytes = json.dumps(header, separators=(",", ":"), default=str).encode("utf-8")
+    header_bytes += b" " * _pad(_PREAMBLE.size + len(header_bytes))
+
+    digest = hashlib.sha256(header_bytes)
+    for chunk in writer.chunks:
+        digest.update(chunk)
+
+    # A unique temporary name, so concurrent writers never share a file
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(_MAGIC, FORMAT_VERSION, len(header_bytes), digest.digest()))
+            f.write(header_bytes)
+            for chunk in writer.chunks:
+                f.write(chunk)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    logger.info(f"Wrote binary dataset {path} ({_PREAMBLE.size + len(header_bytes) + writer.size} bytes)")
+    return path
+
+
+def _decode_table(spec: Dict[str, Any], buffer: mmap.mmap, data_start: int, strings: List[str]) -> Any:
+    if spec["layout"] == "json":
+        return spec["value"]
+
+    def array(ref: Dict[str, Any]) -> np.ndarray:
+        return np.frombuffer(buffer, dtype=np.dtype(ref["dtype"]), count=ref["count"], offset=data_start + ref["offset"])
+
+    columns = []
+    masks = []
+    for column in spec["columns"]:
+        kind = column["kind"]
+        if kind == "json":
+            values = column["values"]
+        else:
+            data = array(column["data"])
+            if kind == "str":
+                values = list(map(strings.__getitem__, data.tolist()))
+            elif kind == "bool":
+                values = data.astype(bool).tolist()
+            else:
+                values = data.tolist()
+            if "nulls" in column:
+                nulls = array(column["nulls"]).tolist()
+                values = [None if null else value for value, null in zip(values, nulls)]
+        columns.append(values)
+        masks.append(array(column["present"]).tolist() if "present" in column else None)
+
+    names = spec["names"]
+    if not any(mask is not None for mask in masks):
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    rows = []
+    for i in range(spec["rows"]):
+        rows.append({
+            name: values[i]
+            for name, values, mask in zip(names, columns, masks)
+            if mask is None or mask[i]
+        })
+    return rows
+
+
+def read_dataset_binary(path: Union[str, Path], source: Optional[Dict[str, Any]] = None) -> ExtractedDataset:
+    """Load a dataset from its binary artifact.
+
+    The file is memory-mapped and checked against its stored SHA-256; rows
+    are trusted on that basis and the dataset is built with
+    ``model_construct`` instead of being re-validated.
+
+    Args:
+        path: Artifact to read.
+        source: If given, the ``source_stamp`` the artifact must have been
+            built from.
+
+    Raises:
+        BinaryDatasetError: If the file is not a valid artifact of this
+            format version, fails its hash check or was built from other
+            source content.
+    """
+    path = Path(path)
+    try:
+        f = open(path, "rb")
+    except OSError as e:
+        raise BinaryDatasetError(f"Cannot open {path}: {e}")
+
+    with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if len(buffer) < _PREAMBLE.size:
+            raise BinaryDatasetError(f"{path} is truncated")
+        magic, format_version, header_length, digest = _PREAMBLE.unpack_from(buffer, 0)
+        if magic != _MAGIC:
+            raise BinaryDatasetError(f"{path} is not a binary dataset")
+        if format_version != FORMAT_VERSION:
+            raise BinaryDatasetError(f"{path} has format version {format_version}, expected {FORMAT_VERSION}")
+
+        view = memoryview(buffer)
+        try:
+            if hashlib.sha256(view[_PREAMBLE.size:]).digest() != digest:
+                raise BinaryDatasetError(f"{path} failed its hash check")
+            header = json.loads(bytes(view[_PREAMBLE.size:_PREAMBLE.size + header_length]))
+        finally:
+            view.release()
+        if source is not None and header.get("source") != source:
+            raise BinaryDatasetError(f"{path} was built from a different dataset.json")
+
+        data_start = _PREAMBLE.size + header_length
+        strings = header["strings"]
+        tables = {
+            name: _decode_table(spec, buffer, data_start, strings)
+            for name, spec in header["tables"].items()
+        }
+
+    return ExtractedDataset.model_construct(
+        metadata=DatasetMetadata(**header["metadata"]),
+        tables=tables,
+        table_metadata={name: TableMetadata(**meta) for name, meta in header["table_metadata"].items()},
+    )
+
+
+def load_if_current(version_dir: Path, source: Optional[Dict[str, Any]] = None) -> Optional[ExtractedDataset]:
+    """Load ``dataset.bin`` from a version directory if it is up to date.
+
+    The artifact is only used if it was built from the current content of
+    ``dataset.json``, compared by size and SHA-256: modification times
+    miss edits that keep or restore an older mtime. ``source`` is the
+    ``source_stamp`` of that content, if the caller has already read it.
+    Returns None if there is no usable artifact.
+    """
+    binary_path = version_dir / BINARY_FILENAME
+    if not binary_path.exists():
+        return None
+
+    if source is None:
+        try:
+            source = source_stamp((version_dir / "dataset.json").read_bytes())
+        except OSError:
+            return None
+
+    try:
+        return read_dataset_binary(binary_path, source=source)
+    except BinaryDatasetError as e:
+        logger.warning(f"Ignoring binary dataset: {e}")
+        return None
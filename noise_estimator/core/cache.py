@@ -0,0 +1,173 @@
+"""
+Request-level result cache.
+Keeps recently computed results keyed by a canonical hash of the request and dataset.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+
+from ..models.schemas import EstimationRequest, EstimationResult
+
+logger = logging.getLogger(__name__)
+
+
+def request_cache_key(request: EstimationRequest, dataset_version: str, workbook_hash: str,
+                      context: Optional[Dict[str, Any]] = None) -> str:
+    """Canonical hash of a request against a resolved dataset.
+
+    The requested ``dataset_version`` is replaced by the resolved version and
+    workbook hash, so "latest" and an explicit version hit the same entry.
+
+    Args:
+        request: Estimation request.
+        dataset_version: Resolved dataset version.
+        workbook_hash: Hash of the workbook the dataset was extracted from.
+        context: JSON-serializable state outside the request and dataset
+            that results depend on, such as calculator settings.
+    """
+    payload = request.model_dump(mode="json", exclude={"dataset_version"})
+    payload["_dataset"] = [dataset_version, workbook_hash]
+    if context is not None:
+        payload["_context"] = context
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache of estimation results with TTL and memory budget.
+
+    Sizes are the length of each result's JSON encoding, which tracks the
+    memory held closely enough to enforce a budget.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = 600.0, max_bytes: int = 64 * 1024 * 1024):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached results.
+            ttl_seconds: Seconds a result stays valid, or None for no expiry.
+            max_bytes: Approximate memory budget for cached results.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+        # key -> (result, dataset version, size, expiry)
+        self._entries: "OrderedDict[str, Tuple[EstimationResult, str, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def key_for(self, request: EstimationRequest, dataset, context: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for a request against a loaded dataset.
+
+        Args:
+            request: Estimation request.
+            dataset: Loaded dataset the request resolves to.
+            context: Calculator state the result depends on; see
+                ``NoiseCalculator.cache_context``.
+        """
+        return request_cache_key(request, dataset.metadata.version, dataset.metadata.workbook_hash, context)
+
+    def get(self, key: str) -> Optional[EstimationResult]:
+        """Get a cached result.
+
+        Returns:
+            A copy of the cached result with a fresh request id and
+            timestamp, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None and entry[3] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[0]
+
+        return result.model_copy(deep=True, update={
+            "request_id": str(uuid.uuid4()),
+            "timestamp": datetime.utcnow(),
+        })
+
+    def put(self, key: str, result: EstimationResult):
+        """Store a result, evicting least recently used entries as needed."""
+        size = len(result.model_dump_json())
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        stored = result.model_copy(deep=True)
+        expiry = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else float("inf")
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (stored, result.dataset_version, size, expiry)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        _, _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def invalidate(self, keep_version: Optional[str] = None) -> int:
+        """Drop cached results.
+
+        Args:
+            keep_version: If given, results for this dataset version are kept.
+
+        Returns:
+            Number of results dropped.
+        """
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[1] != keep_version]
+            for key in stale:
+                self._remove(key)
+
+        if stale:
+            logger.info(f"Invalidated {len(stale)} cached results")
+        return len(stale)
+
+    def clear(self):
+        """Drop all cached results and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters and usage."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
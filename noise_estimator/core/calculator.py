@@ -6,13 +6,17 @@ Implements dB arithmetic, propagation calculations, and noise estimation logic.
 import math
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any, Union
 import logging
 
 import numpy as np
-from scipy import optimize
 
+from .cache import ResultCache
+from .concawe import ConcaweModel, parse_met_category
 from .dataset import DatasetManager
+from .propagation import EXTENDED_MAX_DISTANCE, NEAREST, PropagationTable, check_propagation_mode
+from .spectral import a_weighted_level, check_band_levels, propagate_bands
+from .views import DEFAULT_BACKGROUND_LEVELS
 from ..models.schemas import (
     EstimationRequest, EstimationResult,
     AssessmentType, CalculationMode, EnvironmentApproach,
@@ -26,14 +30,82 @@ logger = logging.getLogger(__name__)
 class NoiseCalculator:
     """Core noise calculation engine."""
     
-    def __init__(self, dataset_manager: DatasetManager):
+    # Assessment type / calculation mode pairs evaluated in vectorized batches
+    _VECTORIZED_MODES = {
+        (AssessmentType.FULL_ESTIMATOR, CalculationMode.SCENARIO),
+        (AssessmentType.FULL_ESTIMATOR, CalculationMode.INDIVIDUAL_PLANT),
+        (AssessmentType.DISTANCE_BASED, CalculationMode.SCENARIO),
+        (AssessmentType.DISTANCE_BASED, CalculationMode.NOISIEST_PLANT),
+    }
+    
+    def __init__(self, dataset_manager: DatasetManager, result_cache: Optional[ResultCache] = None,
+                 propagation_mode: str = NEAREST, extended_range: bool = False,
+                 met_category: Optional[Union[int, str]] = None,
+                 concawe_model: Optional[ConcaweModel] = None, spectral: bool = False):
         """Initialize calculator with dataset manager.
         
         Args:
             dataset_manager: Dataset manager instance.
+            result_cache: Optional cache of results for repeated requests.
+            propagation_mode: Concawe table lookup, ``"nearest"`` row as the
+                workbook does or ``"interpolated"`` in log-distance.
+            extended_range: Continue the measured Concawe table past its
+                last row to ``EXTENDED_MAX_DISTANCE`` instead of holding the
+                last row's attenuation, as the workbook does.
+            met_category: None to use the workbook's measured Concawe table;
+                otherwise propagate with the parametric Concawe model under
+                this met category (1-6), or ``"worst"`` for the worst of all
+                six at each distance. Results then carry the level under
+                every category.
+            concawe_model: Parametric model used when ``met_category`` is
+                set. If None, uses the default parameters.
+            spectral: Propagate octave-band sound power levels band by band
+                where every source in an assessment has them.
         """
         self.dataset_manager = dataset_manager
+        self.result_cache = result_cache
+        self.propagation_mode = check_propagation_mode(propagation_mode)
+        self.extended_range = extended_range
+        self.met_category = met_category = parse_met_category(met_category)
+        self.concawe_model = concawe_model or ConcaweModel()
+        self.spectral = spectral
+        if met_category is not None:
+            # Compile the model tables up front; also rejects unknown categories
+            self.concawe_model.table(met_category)
         self._tolerance_db = 0.2  # Default tolerance for calculations
+        # Distance range for threshold searches (m); tables reaching 5 km are searched to there
+        reaches_far = extended_range or met_category is not None
+        self._search_range = (1.0, float(EXTENDED_MAX_DISTANCE) if reaches_far else 1000.0)
+    
+    def settings(self) -> Dict[str, Any]:
+        """Calculation settings, as keyword arguments for another calculator.
+        
+        Used to build identically configured calculators in worker processes.
+        """
+        return {
+            "propagation_mode": self.propagation_mode,
+            "extended_range": self.extended_range,
+            "met_category": self.met_category,
+            "concawe_model": self.concawe_model,
+            "spectral": self.spectral,
+        }
+    
+    def cache_context(self, dataset) -> Dict[str, Any]:
+        """Calculator state that results depend on, for result cache keys.
+        
+        Covers the calculation settings and the contents of the propagation
+        table in use, so a shared cache never mixes configurations and
+        results go stale when ``concawe_propagation.json`` is republished.
+        """
+        table = self._propagation_table(dataset)
+        return {
+            "propagation_mode": self.propagation_mode,
+            "extended_range": self.extended_range,
+            "met_category": self.met_category,
+            "concawe_model": list(self.concawe_model.parameters()) if self.met_category is not None else None,
+            "spectral": self.spectral,
+            "propagation_table": table.fingerprint if table is not None else None,
+        }
     
     def calculate(self, request: EstimationRequest) -> EstimationResult:
         """Perform noise estimation calculation.
@@ -50,21 +122,21 @@ class NoiseCalculator:
         # Load dataset
         dataset = self.dataset_manager.load_dataset(request.dataset_version)
         
-        # Initialize trace
-        trace = CalculationTrace() if request.include_trace else None
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.key_for(request, dataset, self.cache_context(dataset))
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Calculation served from cache for request {cached.request_id}")
+                return cached
         
         try:
-            # Resolve inputs
-            resolved_inputs = self._resolve_inputs(request, dataset, trace)
+            # Resolve dataset lookups, calculate and post-process
+            shared = self._resolve_shared_inputs(request, dataset)
+            result = self._calculate_resolved(request, dataset, shared)
             
-            # Perform calculation based on assessment type
-            if request.assessment_type == AssessmentType.FULL_ESTIMATOR:
-                result = self._calculate_full_estimator(request, resolved_inputs, dataset, trace)
-            else:  # DISTANCE_BASED
-                result = self._calculate_distance_based(request, resolved_inputs, dataset, trace)
-            
-            # Apply common post-processing
-            result = self._post_process_result(result, request, resolved_inputs, dataset)
+            if cache_key is not None:
+                self.result_cache.put(cache_key, result)
             
             logger.info(f"Calculation completed for request {request_id}")
             return result
@@ -73,8 +145,272 @@ class NoiseCalculator:
             logger.error(f"Calculation failed for request {request_id}: {e}")
             raise
     
-    def _resolve_inputs(self, request: EstimationRequest, dataset, trace: Optional[CalculationTrace]) -> Dict[str, Any]:
-        """Resolve and validate all inputs."""
+    def pin_dataset_version(self, requests: List[EstimationRequest]) -> List[EstimationRequest]:
+        """Pin requests without a dataset version to the current default.
+        
+        The default is resolved once for the whole list, so requests handed
+        to workers that load datasets on their own are all calculated
+        against the version this process resolved. May load the dataset,
+        so async callers run it off the event loop.
+        
+        Raises:
+            Exception: If an unpinned request is present and no dataset loads.
+        """
+        version = None
+        pinned = []
+        for request in requests:
+            if request.dataset_version is None:
+                if version is None:
+                    version = self.dataset_manager.load_dataset().metadata.version
+                request = request.model_copy(update={"dataset_version": version})
+            pinned.append(request)
+        return pinned
+    
+    def cache_lookup(self, requests: List[EstimationRequest]) -> Tuple[List[Optional[EstimationResult]], List[Optional[Tuple[str, str]]]]:
+        """Look up a batch of requests in the result cache.
+        
+        Args:
+            requests: Estimation requests.
+            
+        Returns:
+            Tuple of (cached result or None, per request) and (cache key and
+            the dataset version it was made for, per request). Keys are None
+            without a result cache or when the dataset does not load, in
+            which case the calculation reports the error.
+        """
+        hits: List[Optional[EstimationResult]] = [None] * len(requests)
+        keys: List[Optional[Tuple[str, str]]] = [None] * len(requests)
+        if self.result_cache is None:
+            return hits, keys
+        
+        contexts: Dict[Optional[str], Any] = {}
+        for index, request in enumerate(requests):
+            if request.dataset_version not in contexts:
+                try:
+                    dataset = self.dataset_manager.load_dataset(request.dataset_version)
+                    contexts[request.dataset_version] = (dataset, self.cache_context(dataset))
+                except Exception:
+                    contexts[request.dataset_version] = None
+            resolved = contexts[request.dataset_version]
+            if resolved is None:
+                continue
+            
+            dataset, context = resolved
+            key = self.result_cache.key_for(request, dataset, context)
+            keys[index] = (key, dataset.metadata.version)
+            hits[index] = self.result_cache.get(key)
+        
+        return hits, keys
+    
+    def cache_store(self, keys: List[Optional[Tuple[str, str]]], outcomes: List[Union[EstimationResult, Exception, None]]):
+        """Store batch results under the keys from ``cache_lookup``.
+        
+        Failures are not cached, nor results calculated against another
+        dataset version than their key was made for (a promotion between
+        lookup and calculation).
+        """
+        if self.result_cache is None:
+            return
+        for key, outcome in zip(keys, outcomes):
+            if key is not None and isinstance(outcome, EstimationResult) and outcome.dataset_version == key[1]:
+                self.result_cache.put(key[0], outcome)
+    
+    def calculate_many(self, requests: Iterable[EstimationRequest], return_exceptions: bool = False) -> Iterator[Union[EstimationResult, Exception]]:
+        """Perform many noise estimation calculations as one batch.
+        
+        Requests sharing a dataset version, category, calculation mode and
+        scenario/plant selection are resolved once, and their received levels
+        are evaluated in vectorized passes over all receiver distances in the
+        group. Requests with ``include_trace`` set run through the per-request
+        path so their traces stay complete.
+        
+        The result cache is not consulted here, as batches may run in worker
+        processes without it; callers wrap batches in ``cache_lookup`` and
+        ``cache_store``.
+        
+        Args:
+            requests: Estimation requests.
+            return_exceptions: If True, a failed request yields its exception
+                in place of a result instead of raising.
+            
+        Yields:
+            One result (or exception) per request, in input order.
+        """
+        requests = list(requests)
+        outcomes: List[Union[EstimationResult, Exception, None]] = [None] * len(requests)
+        
+        # Load each referenced dataset version once
+        datasets: Dict[Optional[str], Any] = {}
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, request in enumerate(requests):
+            try:
+                if request.dataset_version not in datasets:
+                    datasets[request.dataset_version] = self.dataset_manager.load_dataset(request.dataset_version)
+            except Exception as e:
+                outcomes[index] = e
+                continue
+            
+            dataset = datasets[request.dataset_version]
+            group_key = (
+                dataset.metadata.version,
+                request.noise_category_id,
+                request.calculation_mode,
+                request.scenario_id,
+                tuple(request.plant_ids) if request.plant_ids is not None else None,
+            )
+            groups.setdefault(group_key, []).append(index)
+        
+        for indices in groups.values():
+            dataset = datasets[requests[indices[0]].dataset_version]
+            self._calculate_group(requests, indices, dataset, outcomes)
+        
+        logger.info(f"Batch calculation completed for {len(requests)} requests in {len(groups)} groups")
+        
+        for outcome in outcomes:
+            if isinstance(outcome, Exception) and not return_exceptions:
+                raise outcome
+            yield outcome
+    
+    def _calculate_group(self, requests: List[EstimationRequest], indices: List[int], dataset, outcomes: List[Any]):
+        """Calculate a group of requests that share resolved inputs."""
+        try:
+            shared = self._resolve_shared_inputs(requests[indices[0]], dataset)
+        except Exception as e:
+            for index in indices:
+                outcomes[index] = e
+            return
+        
+        # Resolve per-request inputs and bucket the vectorizable requests
+        batches: Dict[Tuple[Any, ...], List[Tuple[int, Dict[str, Any]]]] = {}
+        for index in indices:
+            request = requests[index]
+            try:
+                if request.include_trace:
+                    outcomes[index] = self._calculate_resolved(request, dataset, shared)
+                    continue
+                
+                inputs = self._resolve_inputs(request, dataset, None, shared)
+                batch_key = (request.assessment_type, request.calculation_mode, inputs["propagation_type"])
+                if batch_key[:2] not in self._VECTORIZED_MODES:
+                    outcomes[index] = self._calculate_resolved(request, dataset, shared)
+                    continue
+                
+                batches.setdefault(batch_key, []).append((index, inputs))
+            except Exception as e:
+                outcomes[index] = e
+        
+        for (assessment_type, calculation_mode, propagation_type), members in batches.items():
+            try:
+                received_levels = self._received_levels_many(
+                    assessment_type, calculation_mode, propagation_type,
+                    [inputs for _, inputs in members], dataset
+                )
+            except Exception as e:
+                for index, _ in members:
+                    outcomes[index] = e
+                continue
+            
+            for (index, inputs), received_level in zip(members, received_levels.tolist()):
+                try:
+                    distances = None
+                    if assessment_type == AssessmentType.DISTANCE_BASED:
+                        distances = DistanceResult()
+                    result = self._build_result(received_level, inputs, dataset, None, distances)
+                    outcomes[index] = self._post_process_result(result, requests[index], inputs, dataset)
+                except Exception as e:
+                    outcomes[index] = e
+    
+    def _received_levels_many(self, assessment_type: AssessmentType, calculation_mode: CalculationMode, propagation_type: PropagationType, inputs_list: List[Dict[str, Any]], dataset) -> np.ndarray:
+        """Received levels for a batch of requests sharing source and propagation."""
+        inputs = inputs_list[0]
+        
+        spectra = self._source_spectra(inputs, None)
+        if spectra is not None:
+            key = "receiver_distance" if assessment_type == AssessmentType.FULL_ESTIMATOR else "distance"
+            distances = np.array([item[key] for item in inputs_list], dtype=np.float64)
+            
+            # Sources x receivers x bands, energy-summed over sources
+            received = self.propagate_spectra(spectra[:, np.newaxis, :], distances[np.newaxis, :], propagation_type, dataset)
+            return 10 * np.log10(np.sum(10 ** (received / 10), axis=0))
+        
+        if assessment_type == AssessmentType.FULL_ESTIMATOR:
+            distances = np.array([item["receiver_distance"] for item in inputs_list], dtype=np.float64)
+            if calculation_mode == CalculationMode.SCENARIO:
+                source_level = self._calculate_scenario_level(inputs["scenario"], inputs, dataset, None)
+            else:  # INDIVIDUAL_PLANT
+                source_level = self._calculate_plants_level(inputs["plants"], inputs, dataset, None)
+            return self.propagate_many(source_level, distances, propagation_type, dataset)
+        
+        # DISTANCE_BASED
+        distances = np.array([item["distance"] for item in inputs_list], dtype=np.float64)
+        if inputs["scenario_mode"] == CalculationMode.SCENARIO:
+            scenario = inputs["scenario"]
+            swl_values = np.array(list(scenario.sound_power_levels.values()), dtype=np.float64)
+            if not len(swl_values):
+                raise ValueError(f"No sound power levels found for scenario {scenario.id}")
+            
+            # Plants x receivers matrix, energy-summed over plants
+            received = self.propagate_many(swl_values[:, np.newaxis], distances[np.newaxis, :], propagation_type, dataset)
+            return 10 * np.log10(np.sum(10 ** (received / 10), axis=0))
+        
+        # NOISIEST_PLANT
+        source_level = self._calculate_noisiest_plant_level(inputs, dataset, None)
+        return self.propagate_many(source_level, distances, propagation_type, dataset)
+    
+    def _calculate_resolved(self, request: EstimationRequest, dataset, shared: Dict[str, Any]) -> EstimationResult:
+        """Run the per-request calculation path with pre-resolved shared inputs."""
+        trace = CalculationTrace() if request.include_trace else None
+        resolved_inputs = self._resolve_inputs(request, dataset, trace, shared)
+        
+        if request.assessment_type == AssessmentType.FULL_ESTIMATOR:
+            result = self._calculate_full_estimator(request, resolved_inputs, dataset, trace)
+        else:  # DISTANCE_BASED
+            result = self._calculate_distance_based(request, resolved_inputs, dataset, trace)
+        
+        return self._post_process_result(result, request, resolved_inputs, dataset)
+    
+    def _resolve_shared_inputs(self, request: EstimationRequest, dataset) -> Dict[str, Any]:
+        """Resolve dataset lookups shared by requests with the same selections."""
+        shared = {}
+        
+        # Get noise category
+        categories = self.dataset_manager.get_noise_categories(dataset)
+        if request.noise_category_id not in categories:
+            raise ValueError(f"Noise category {request.noise_category_id} not found")
+        
+        shared["category"] = categories[request.noise_category_id]
+        
+        # Resolve scenario or plants
+        if request.calculation_mode in [CalculationMode.SCENARIO, CalculationMode.NOISIEST_PLANT]:
+            scenarios = self.dataset_manager.get_scenarios(dataset)
+            if request.scenario_id not in scenarios:
+                raise ValueError(f"Scenario {request.scenario_id} not found")
+            
+            shared["scenario"] = scenarios[request.scenario_id]
+            
+        if request.calculation_mode in [CalculationMode.INDIVIDUAL_PLANT]:
+            plants = self.dataset_manager.get_plants(dataset)
+            resolved_plants = []
+            for plant_id in request.plant_ids:
+                if plant_id not in plants:
+                    raise ValueError(f"Plant {plant_id} not found")
+                resolved_plants.append(plants[plant_id])
+            shared["plants"] = resolved_plants
+        
+        return shared
+    
+    def _resolve_inputs(self, request: EstimationRequest, dataset, trace: Optional[CalculationTrace], shared: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Resolve and validate all inputs.
+        
+        Args:
+            request: Estimation request parameters.
+            dataset: Dataset to resolve against.
+            trace: Trace to record assumptions in, if any.
+            shared: Pre-resolved output of ``_resolve_shared_inputs``.
+        """
+        if shared is None:
+            shared = self._resolve_shared_inputs(request, dataset)
+        
         resolved = {
             "assessment_type": request.assessment_type,
             "calculation_mode": request.calculation_mode,
@@ -86,12 +422,7 @@ class NoiseCalculator:
             "scenario_mode": CalculationMode.SCENARIO if request.calculation_mode in [CalculationMode.SCENARIO, CalculationMode.NOISIEST_PLANT] else CalculationMode.INDIVIDUAL_PLANT,
         }
         
-        # Get noise category
-        categories = self.dataset_manager.get_noise_categories(dataset)
-        if request.noise_category_id not in categories:
-            raise ValueError(f"Noise category {request.noise_category_id} not found")
-        
-        category = categories[request.noise_category_id]
+        category = shared["category"]
         resolved["category"] = category
         
         # Get background level
@@ -106,23 +437,11 @@ class NoiseCalculator:
         nml = category.nml_values.get(request.time_period, 50.0)  # Default fallback
         resolved["nml_level"] = nml
         
-        # Resolve scenario or plants
-        if request.calculation_mode in [CalculationMode.SCENARIO, CalculationMode.NOISIEST_PLANT]:
-            scenarios = self.dataset_manager.get_scenarios(dataset)
-            if request.scenario_id not in scenarios:
-                raise ValueError(f"Scenario {request.scenario_id} not found")
-            
-            scenario = scenarios[request.scenario_id]
-            resolved["scenario"] = scenario
-            
-        if request.calculation_mode in [CalculationMode.INDIVIDUAL_PLANT]:
-            plants = self.dataset_manager.get_plants(dataset)
-            resolved_plants = []
-            for plant_id in request.plant_ids:
-                if plant_id not in plants:
-                    raise ValueError(f"Plant {plant_id} not found")
-                resolved_plants.append(plants[plant_id])
-            resolved["plants"] = resolved_plants
+        # Scenario or plants
+        if "scenario" in shared:
+            resolved["scenario"] = shared["scenario"]
+        if "plants" in shared:
+            resolved["plants"] = shared["plants"]
         
         # Distance for full estimator
         if request.assessment_type == AssessmentType.FULL_ESTIMATOR:
@@ -144,8 +463,6 @@ class NoiseCalculator:
     def _calculate_full_estimator(self, request: EstimationRequest, inputs: Dict[str, Any], dataset, trace: Optional[CalculationTrace]) -> EstimationResult:
         """Calculate full estimator results."""
         distance = inputs["receiver_distance"]
-        background = inputs["background_level"]
-        nml = inputs["nml_level"]
         
         # Calculate source levels
         if request.calculation_mode == CalculationMode.SCENARIO:
@@ -153,8 +470,19 @@ class NoiseCalculator:
         else:  # INDIVIDUAL_PLANT
             source_level = self._calculate_plants_level(inputs["plants"], inputs, dataset, trace)
         
-        # Apply propagation
-        received_level = self._apply_propagation(source_level, distance, inputs["propagation_type"], dataset, trace)
+        # Apply propagation, band by band when the sources have spectra
+        spectra = self._source_spectra(inputs, trace)
+        if spectra is not None:
+            received_level = self._apply_spectral_propagation(spectra, distance, inputs["propagation_type"], dataset, trace)
+        else:
+            received_level = self._apply_propagation(source_level, distance, inputs["propagation_type"], dataset, trace)
+        
+        return self._build_result(received_level, inputs, dataset, trace)
+    
+    def _build_result(self, received_level: float, inputs: Dict[str, Any], dataset, trace: Optional[CalculationTrace], distances: Optional[DistanceResult] = None) -> EstimationResult:
+        """Build a result from the received level at the receiver."""
+        background = inputs["background_level"]
+        nml = inputs["nml_level"]
         
         # Calculate exceedances
         exceed_background = received_level - background
@@ -168,6 +496,12 @@ class NoiseCalculator:
             impact_band, inputs, dataset, trace
         )
         
+        # Level under every met category, when propagating with the model
+        met_levels = None
+        distance = inputs.get("receiver_distance") or inputs.get("distance")
+        if self.met_category is not None and distance:
+            met_levels = self._met_category_levels(received_level, distance, inputs["propagation_type"])
+        
         # Create result
         result = EstimationResult(
             request_id=str(uuid.uuid4()),
@@ -180,6 +514,10 @@ class NoiseCalculator:
             exceed_background_db=exceed_background,
             exceed_nml_db=exceed_nml,
             impact_band=impact_band,
+            distances=distances,
+            met_category=str(self.met_category) if met_levels is not None else None,
+            met_category_levels=met_levels,
+            worst_met_category=int(max(met_levels, key=met_levels.get)) if met_levels else None,
             standard_measures=standard_measures,
             additional_measures=additional_measures,
             trace=trace
@@ -203,10 +541,16 @@ class NoiseCalculator:
             else:  # NOISIEST_PLANT
                 # For noisiest plant mode, find the highest SWL and calculate at distance
                 source_level = self._calculate_noisiest_plant_level(inputs, dataset, trace)
-                received_level = self._apply_propagation(
-                    source_level, inputs["distance"], inputs["propagation_type"], 
-                    dataset, trace
-                )
+                spectra = self._source_spectra(inputs, trace)
+                if spectra is not None:
+                    received_level = self._apply_spectral_propagation(
+                        spectra, inputs["distance"], inputs["propagation_type"], dataset, trace
+                    )
+                else:
+                    received_level = self._apply_propagation(
+                        source_level, inputs["distance"], inputs["propagation_type"], 
+                        dataset, trace
+                    )
         else:  # FULL_ESTIMATOR
             # For full estimator, we need to find distances to thresholds
             if inputs["scenario_mode"] == CalculationMode.SCENARIO:
@@ -234,37 +578,7 @@ class NoiseCalculator:
             distance_to_highly_affected=None
         )
         
-        # Calculate exceedances at reference distance
-        exceed_background = received_level - background
-        exceed_nml = received_level - nml
-        
-        # Determine impact band
-        impact_band = self._determine_impact_band(exceed_background, exceed_nml, dataset)
-        
-        # Get mitigation measures
-        standard_measures, additional_measures = self._get_mitigation_measures(
-            impact_band, inputs, dataset, trace
-        )
-        
-        # Create result
-        result = EstimationResult(
-            request_id=str(uuid.uuid4()),
-            dataset_version=dataset.metadata.version,
-            workbook_hash=dataset.metadata.workbook_hash,
-            resolved_inputs=inputs,
-            predicted_level_db=received_level,
-            background_db=background,
-            nml_db=nml,
-            exceed_background_db=exceed_background,
-            exceed_nml_db=exceed_nml,
-            impact_band=impact_band,
-            distances=distances,
-            standard_measures=standard_measures,
-            additional_measures=additional_measures,
-            trace=trace
-        )
-        
-        return result
+        return self._build_result(received_level, inputs, dataset, trace, distances)
     
     def _calculate_scenario_level_at_distance(self, scenario: Scenario, distance: float, propagation_type: str, dataset, trace: Optional[CalculationTrace]) -> float:
         """Calculate combined level for a scenario at a specific distance."""
@@ -274,13 +588,17 @@ class NoiseCalculator:
             trace.tables_used["scenarios"] = scenario.id
             trace.intermediate_values["scenario_swl"] = scenario.sound_power_levels
         
-        # Calculate each plant's contribution at the receiver
+        # Calculate each plant's contribution at the receiver in one pass
+        spectra = self._source_spectra({"calculation_mode": CalculationMode.SCENARIO, "scenario": scenario}, trace)
+        if spectra is not None:
+            received_levels = self.propagate_spectra(spectra, distance, propagation_type, dataset)
+        else:
+            received_levels = self.propagate_many(
+                list(scenario.sound_power_levels.values()), distance, propagation_type, dataset
+            )
         linear_contributions = []
         
-        for plant_id, swl in scenario.sound_power_levels.items():
-            # Calculate received level for this plant
-            received_level = self._apply_propagation(swl, distance, propagation_type, dataset, None)
-            
+        for plant_id, received_level in zip(scenario.sound_power_levels, received_levels.tolist()):
             # Convert to linear units for summing
             linear_level = 10 ** (received_level / 10)
             linear_contributions.append(linear_level)
@@ -361,50 +679,212 @@ class NoiseCalculator:
         
         return noisiest_swl
     
-    def _apply_propagation(self, source_level: float, distance: float, propagation_type: str, dataset, trace: Optional[CalculationTrace], barrier_adjustment: float = 0) -> float:
-        """Apply propagation attenuation using Concawe model."""
-        if distance <= 0:
+    def propagate_many(self, source_levels: Union[float, np.ndarray], distances: Union[float, np.ndarray], propagation_type: Union[PropagationType, str], dataset=None, barrier_adjustment: Union[float, np.ndarray] = 0.0, mode: Optional[str] = None) -> np.ndarray:
+        """Apply Concawe propagation to many source/distance pairs at once.
+        
+        Args:
+            source_levels: Sound power level(s) in dB. Broadcast against distances.
+            distances: Receiver distance(s) in metres.
+            propagation_type: Propagation type applied to every element.
+            dataset: Dataset to use. If None, uses current.
+            barrier_adjustment: Barrier adjustment(s) in dB.
+            mode: Table lookup mode. If None, uses the calculator's.
+            
+        Returns:
+            Array of received levels in dB, one per broadcast element.
+        """
+        received_levels, _, _ = self._propagate_array(
+            source_levels, distances, propagation_type, dataset, barrier_adjustment, mode
+        )
+        return received_levels
+    
+    def propagate_spectra(self, band_levels: np.ndarray, distances: Union[float, np.ndarray], propagation_type: Union[PropagationType, str], dataset=None, barrier_adjustment: Union[float, np.ndarray] = 0.0, mode: Optional[str] = None) -> np.ndarray:
+        """Apply Concawe propagation band by band to octave-band sound power levels.
+        
+        The broadband attenuation is looked up once per distance; per-band
+        air absorption and barrier terms are then applied across the whole
+        sources x bands array before A-weighting and summing the bands.
+        
+        Args:
+            band_levels: Unweighted octave-band SWL, 63 Hz to 8 kHz on the
+                last axis. The other axes broadcast against distances.
+            distances: Receiver distance(s) in metres.
+            propagation_type: Propagation type applied to every element.
+            dataset: Dataset to use. If None, uses current.
+            barrier_adjustment: Broadband barrier adjustment(s) in dB.
+            mode: Table lookup mode. If None, uses the calculator's.
+            
+        Returns:
+            Array of A-weighted received levels in dB, one per broadcast element.
+        """
+        band_levels = check_band_levels(band_levels)
+        distances = np.asarray(distances, dtype=np.float64)
+        if np.any(distances <= 0):
             raise ValueError("Distance must be positive")
         
-        # Get Concawe attenuation data
-        concawe_data = self.dataset_manager.get_concawe_data(dataset)
+        table = self._propagation_table(dataset)
+        if table is None:
+            # Geometric spreading, in the table's SWL - 110 + A form
+            attenuation = 110 - 20 * np.log10(distances)
+        else:
+            _, attenuation = table.lookup(distances, propagation_type, mode or self.propagation_mode)
         
-        # Round distance to nearest table value
-        rounded_distance = round(distance)
+        received = propagate_bands(band_levels, attenuation, distances, barrier_adjustment)
+        return a_weighted_level(received)
+    
+    def _source_spectra(self, inputs: Dict[str, Any], trace: Optional[CalculationTrace]) -> Optional[np.ndarray]:
+        """Octave-band SWL of each source (sources x bands), or None to use broadband levels.
         
-        # Find the closest distance in the table
-        available_distances = sorted([int(d) for d in concawe_data.keys() if d is not None])
-        if not available_distances:
-            # If no Concawe data available, fall back to simple geometric spreading
-            if trace:
-                trace.warnings.append("No Concawe data available, using geometric spreading")
-            geometric_spreading = 20 * math.log10(distance)
-            return source_level - geometric_spreading + barrier_adjustment
+        Plants carry their duty cycle and usage factor adjustments, as in
+        ``_calculate_plants_level``.
+        """
+        if not self.spectral:
+            return None
+        
+        calculation_mode = inputs["calculation_mode"]
+        if calculation_mode == CalculationMode.INDIVIDUAL_PLANT:
+            plants = inputs["plants"]
+            ids = [plant.id for plant in plants]
+            bands = [plant.octave_band_levels for plant in plants]
+            adjustments = [10 * math.log10(plant.duty_cycle * plant.usage_factor) for plant in plants]
+        else:
+            scenario = inputs["scenario"]
+            ids = list(scenario.sound_power_levels)
+            if calculation_mode == CalculationMode.NOISIEST_PLANT and ids:
+                ids = [max(ids, key=scenario.sound_power_levels.get)]
+            bands = [scenario.octave_band_levels.get(plant_id) for plant_id in ids]
+            adjustments = [0.0] * len(ids)
+        
+        missing = [plant_id for plant_id, levels in zip(ids, bands) if levels is None]
+        if not ids or missing:
+            if trace and missing:
+                trace.warnings.append(f"No octave-band levels for {', '.join(missing)}, using broadband levels")
+            return None
+        
+        spectra = check_band_levels(bands) + np.array(adjustments)[:, np.newaxis]
+        if trace:
+            trace.intermediate_values["source_spectra"] = dict(zip(ids, spectra.tolist()))
+        return spectra
+    
+    def _apply_spectral_propagation(self, spectra: np.ndarray, distance: float, propagation_type: str, dataset, trace: Optional[CalculationTrace]) -> float:
+        """Received A-weighted level of several sources' spectra at one distance."""
+        received_levels = self.propagate_spectra(spectra, distance, propagation_type, dataset)
+        received_level = float(10 * np.log10(np.sum(10 ** (received_levels / 10))))
+        
+        if trace:
+            trace.intermediate_values.update({
+                "spectral_received_levels": received_levels.tolist(),
+                "received_level": received_level
+            })
+        
+        return received_level
+    
+    def met_sweep(self, source_levels: Union[float, np.ndarray], distances: Union[float, np.ndarray], propagation_type: Union[PropagationType, str], barrier_adjustment: Union[float, np.ndarray] = 0.0, mode: Optional[str] = None) -> np.ndarray:
+        """Received levels under every meteorological category of the Concawe model.
         
-        closest_distance = min(available_distances, key=lambda x: abs(x - rounded_distance))
+        Args:
+            source_levels: Sound power level(s) in dB. Broadcast against distances.
+            distances: Receiver distance(s) in metres.
+            propagation_type: Propagation type applied to every element.
+            barrier_adjustment: Barrier adjustment(s) in dB.
+            mode: Table lookup mode. If None, uses the calculator's.
+            
+        Returns:
+            Array of received levels in dB with a trailing axis over the
+            model's met categories, in ascending order.
+        """
+        source_levels = np.asarray(source_levels, dtype=np.float64)
+        distances = np.asarray(distances, dtype=np.float64)
+        if np.any(distances <= 0):
+            raise ValueError("Distance must be positive")
         
-        # Get attenuation for the propagation type
-        propagation_map = {
-            "Water": "hard",
-            "Developed settlements (urban and suburban areas)": "urban", 
-            "Rural": "rural"
+        tables = self.concawe_model.tables()
+        attenuations = np.stack([
+            tables[category].lookup(distances, propagation_type, mode or self.propagation_mode)[1]
+            for category in self.concawe_model.categories
+        ], axis=-1)
+        return (source_levels - 110 + barrier_adjustment)[..., np.newaxis] + attenuations
+    
+    def _met_category_levels(self, received_level: float, distance: float, propagation_type: Union[PropagationType, str]) -> Dict[str, float]:
+        """Received level at the receiver under each met category of the model.
+        
+        Categories differ only in an attenuation term that depends on
+        distance, which shifts every source, band and barrier case alike, so
+        each category's level is the received level moved by the difference
+        between its table and the one in use.
+        """
+        tables = self.concawe_model.tables()
+        
+        def attenuation(category):
+            return float(tables[category].lookup(distance, propagation_type, self.propagation_mode)[1])
+        
+        selected = attenuation(self.met_category)
+        return {
+            str(category): received_level + attenuation(category) - selected
+            for category in self.concawe_model.categories
         }
+    
+    def _propagation_table(self, dataset) -> Optional[PropagationTable]:
+        """Concawe table used for propagation.
+        
+        The model's table for the met category if one is set, otherwise the
+        workbook's measured table, continued to ``EXTENDED_MAX_DISTANCE``
+        when ``extended_range`` is set.
+        """
+        if self.met_category is not None:
+            return self.concawe_model.table(self.met_category)
+        table = self.dataset_manager.get_propagation_table(dataset)
+        if table is not None and self.extended_range:
+            table = table.extended(EXTENDED_MAX_DISTANCE)
+        return table
+    
+    def _propagate_array(self, source_levels, distances, propagation_type, dataset, barrier_adjustment=0.0, mode=None) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
+        """Vectorized propagation core shared by the scalar and batch paths.
+        
+        Returns:
+            Tuple of (received levels, Concawe distances used, Concawe attenuations).
+            The last two are None when falling back to geometric spreading.
+        """
+        source_levels = np.asarray(source_levels, dtype=np.float64)
+        distances = np.asarray(distances, dtype=np.float64)
+        if np.any(distances <= 0):
+            raise ValueError("Distance must be positive")
+        
+        # Get compiled Concawe attenuation table
+        table = self._propagation_table(dataset)
+        if table is None:
+            # If no Concawe data available, fall back to simple geometric spreading
+            geometric_spreading = 20 * np.log10(distances)
+            return source_levels - geometric_spreading + barrier_adjustment, None, None
         
-        prop_key = propagation_map.get(propagation_type, "rural")
-        attenuation_at_distance = concawe_data.get(str(closest_distance), {}).get(prop_key, 0)
+        # Snap to the nearest table distance, or interpolate between rows
+        used_distances, attenuations = table.lookup(distances, propagation_type, mode or self.propagation_mode)
         
         # Calculate received level using Excel formula logic:
         # Level = SWL - 110 + ConcaweAttenuation + BarrierAdjustment
         # The -110 is a reference adjustment used in the Excel workbook
-        received_level = source_level - 110 + attenuation_at_distance + barrier_adjustment
+        received_levels = source_levels - 110 + attenuations + barrier_adjustment
+        return received_levels, used_distances, attenuations
+    
+    def _apply_propagation(self, source_level: float, distance: float, propagation_type: str, dataset, trace: Optional[CalculationTrace], barrier_adjustment: float = 0) -> float:
+        """Apply propagation attenuation using Concawe model."""
+        received_levels, used_distances, attenuations = self._propagate_array(
+            source_level, distance, propagation_type, dataset, barrier_adjustment
+        )
+        received_level = float(received_levels)
         
         if trace:
-            trace.intermediate_values.update({
-                "concawe_distance_used": closest_distance,
-                "concawe_attenuation": attenuation_at_distance,
-                "barrier_adjustment": barrier_adjustment,
-                "received_level": received_level
-            })
+            if used_distances is None:
+                trace.warnings.append("No Concawe data available, using geometric spreading")
+            else:
+                trace.intermediate_values.update({
+                    "concawe_distance_used": int(used_distances) if self.propagation_mode == NEAREST else float(used_distances),
+                    "concawe_attenuation": float(attenuations),
+                    "barrier_adjustment": barrier_adjustment,
+                    "received_level": received_level
+                })
+                if self.met_category is not None:
+                    trace.intermediate_values["met_category"] = self.met_category
         
         return received_level
     
@@ -432,27 +912,17 @@ class NoiseCalculator:
             return factor * 1.5
     
     def _calculate_distances_to_thresholds(self, source_level: float, background: float, nml: float, propagation_type: PropagationType, dataset, trace: Optional[CalculationTrace]) -> DistanceResult:
-        """Calculate distances to various thresholds using goal seek/inversion."""
-        
-        def level_at_distance(d: float) -> float:
-            """Helper function to get level at a given distance."""
-            return self._apply_propagation(source_level, d, propagation_type, dataset, None)
-        
-        # Calculate distance to exceed background
-        distance_to_background = self._find_distance_for_level(
-            source_level, background, propagation_type, dataset, "background"
-        )
-        
-        # Calculate distance to NML
-        distance_to_nml = self._find_distance_for_level(
-            source_level, nml, propagation_type, dataset, "nml"
-        )
-        
-        # Calculate distance to highly affected threshold
-        # Typically defined as background + 10dB or similar
+        """Calculate distances to various thresholds using table inversion."""
+        # Highly affected threshold is typically defined as background + 10dB or similar
         highly_affected_threshold = background + 10.0
-        distance_to_highly_affected = self._find_distance_for_level(
-            source_level, highly_affected_threshold, propagation_type, dataset, "highly_affected"
+        
+        # Invert all three thresholds in a single pass
+        distance_to_background, distance_to_nml, distance_to_highly_affected = self._find_distances_for_levels(
+            source_level,
+            [background, nml, highly_affected_threshold],
+            propagation_type,
+            dataset,
+            ["background", "nml", "highly_affected"]
         )
         
         distances = DistanceResult(
@@ -471,40 +941,41 @@ class NoiseCalculator:
         return distances
     
     def _find_distance_for_level(self, source_level: float, target_level: float, propagation_type: PropagationType, dataset, target_name: str) -> Optional[float]:
-        """Find distance that results in target level using numerical methods."""
-        
-        def level_difference(d: float) -> float:
-            """Difference between actual level and target at distance d."""
-            actual_level = self._apply_propagation(source_level, d, propagation_type, dataset, None)
-            return actual_level - target_level
-        
-        # Check if target is achievable
-        level_at_1m = level_difference(1.0)
-        level_at_1000m = level_difference(1000.0)
-        
-        # If the level is already below target at 1m, distance is 1m
-        if level_at_1m <= 0:
-            return 1.0
+        """Find distance that results in target level."""
+        return self._find_distances_for_levels(
+            source_level, [target_level], propagation_type, dataset, [target_name]
+        )[0]
+    
+    def _find_distances_for_levels(self, source_level: float, target_levels: List[float], propagation_type: PropagationType, dataset, target_names: List[str]) -> List[Optional[float]]:
+        """Find distances that result in each target level by inverting the propagation curve.
         
-        # If the level is still above target at 1000m, we can't find a solution
-        if level_at_1000m > 0:
-            logger.warning(f"Cannot achieve {target_name} level of {target_level}dB at distances up to 1000m")
-            return None
+        Returns:
+            One distance per target, rounded to 0.1 m. Targets already met at the
+            start of the search range return its lower bound; targets not met
+            within the range return None.
+        """
+        min_distance, max_distance = self._search_range
+        targets = np.asarray(target_levels, dtype=np.float64)
         
-        try:
-            # Use binary search to find distance
-            result = optimize.brentq(
-                level_difference,
-                1.0,
-                1000.0,
-                xtol=0.1,  # 0.1m precision
-                rtol=0.01   # 1% relative tolerance
-            )
-            return round(result, 1)
-            
-        except (ValueError, RuntimeError) as e:
-            logger.warning(f"Failed to find distance for {target_name}: {e}")
-            return None
+        table = self._propagation_table(dataset)
+        if table is not None:
+            found = table.invert(source_level, targets, propagation_type, min_distance, max_distance,
+                                 mode=self.propagation_mode)
+        else:
+            # Geometric spreading inverts in closed form: L = SWL - 20 log10(d)
+            found = 10 ** ((source_level - targets) / 20)
+            found = np.where(found <= min_distance, min_distance, found)
+            found = np.where(found > max_distance, np.nan, found)
+        
+        results = []
+        for target_name, target_level, distance in zip(target_names, target_levels, found.tolist()):
+            if math.isnan(distance):
+                logger.warning(f"Cannot achieve {target_name} level of {target_level}dB at distances up to {max_distance:g}m")
+                results.append(None)
+            else:
+                results.append(round(distance, 1))
+        
+        return results
     
     def _determine_impact_band(self, exceed_background: float, exceed_nml: float, dataset) -> ImpactBand:
         """Determine impact band based on exceedances."""
@@ -520,66 +991,29 @@ class NoiseCalculator:
     
     def _get_mitigation_measures(self, impact_band: ImpactBand, inputs: Dict[str, Any], dataset, trace: Optional[CalculationTrace]) -> Tuple[List[MitigationMeasure], List[MitigationMeasure]]:
         """Get applicable mitigation measures."""
-        measures = self.dataset_manager.get_mitigation_measures(dataset)
-        
-        standard_measures = []
-        additional_measures = []
-        
-        for measure in measures.values():
-            # Check if measure is applicable based on impact band and other conditions
-            if self._is_measure_applicable(measure, impact_band, inputs):
-                if measure.type == "standard":
-                    standard_measures.append(measure)
-                else:
-                    additional_measures.append(measure)
+        # Trigger conditions are compiled per dataset, so selection is a
+        # handful of bitmask intersections
+        rules = self.dataset_manager.get_view(dataset).mitigation_rules
+        standard_measures, additional_measures = rules.select(impact_band, inputs)
         
         if trace:
             trace.tables_used["mitigation_measures"] = [m.id for m in standard_measures + additional_measures]
         
         return standard_measures, additional_measures
     
-    def _is_measure_applicable(self, measure: MitigationMeasure, impact_band: ImpactBand, inputs: Dict[str, Any]) -> bool:
-        """Check if a mitigation measure is applicable."""
-        # Simple implementation - in reality, this would use complex logic from the workbook
-        conditions = measure.trigger_conditions
-        
-        # Check impact band condition
-        if "impact_band" in conditions:
-            required_bands = conditions["impact_band"]
-            if isinstance(required_bands, str):
-                required_bands = [required_bands]
-            if impact_band.value not in required_bands:
-                return False
-        
-        # Check other conditions
-        for condition, value in conditions.items():
-            if condition in inputs and inputs[condition] != value:
-                return False
-        
-        return True
-    
     def _get_representative_background(self, category: NoiseCategory, time_period: TimePeriod, dataset) -> float:
         """Get representative background level for category and time period."""
         # Try to get from category first
         if time_period in category.time_periods:
             return category.time_periods[time_period]
         
-        # Fall back to background levels table
-        background_data = self.dataset_manager.get_background_levels(dataset)
-        
-        for entry in background_data:
-            if (entry.get("category") == category.id and 
-                entry.get("time_period") == time_period.value):
-                return entry.get("level", 45.0)  # Default fallback
-        
-        # Default background levels if no data found
-        defaults = {
-            TimePeriod.DAY: 45.0,
-            TimePeriod.EVENING: 40.0,
-            TimePeriod.NIGHT: 35.0,
-        }
+        # Fall back to the background index, which also holds composite periods
+        background_levels = self.dataset_manager.get_view(dataset).background_levels
+        level = background_levels.get((category.id, time_period.value))
+        if level is not None:
+            return level
         
-        return defaults.get(time_period, 40.0)
+        return DEFAULT_BACKGROUND_LEVELS.get(time_period, 40.0)
     
     def _db_sum(self, levels: List[float]) -> float:
         """Sum multiple dB levels using log-summing."""
@@ -601,6 +1035,8 @@ class NoiseCalculator:
         result.nml_db = round(result.nml_db, 1)
         result.exceed_background_db = round(result.exceed_background_db, 1)
         result.exceed_nml_db = round(result.exceed_nml_db, 1)
+        if result.met_category_levels is not None:
+            result.met_category_levels = {category: round(level, 1) for category, level in result.met_category_levels.items()}
         
         # Generate output packs if requested
         if request.output_pack.value in ["step2", "both"]:
@@ -0,0 +1,227 @@
+"""
+Parametric Concawe propagation model.
+Computes attenuation from the model's terms instead of the workbook's measured
+table, for any distance and meteorological category.
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+import logging
+import threading
+
+import numpy as np
+
+from .propagation import EXTENDED_MAX_DISTANCE, PropagationTable
+
+logger = logging.getLogger(__name__)
+
+# Concawe meteorological categories: 1 is strongly upwind / unstable, 4 is
+# neutral (no correction) and 6 strongly downwind / stable
+MET_CATEGORIES = (1, 2, 3, 4, 5, 6)
+NEUTRAL_MET_CATEGORY = 4
+WORST_CASE = "worst"
+
+# Single-figure (A-weighted) meteorological corrections in dB, approximating
+# the Concawe 500 Hz curves. Each grows from nothing at
+# MET_CORRECTION_START to its limit at MET_CORRECTION_FULL metres.
+MET_CORRECTION_LIMITS = {1: 8.0, 2: 5.0, 3: 2.0, 4: 0.0, 5: -2.0, 6: -4.0}
+MET_CORRECTION_START = 100.0
+MET_CORRECTION_FULL = 1000.0
+
+# Ground factor per Concawe table column: 0 for hard ground, 1 for fully porous
+GROUND_FACTORS = {"hard": 0.0, "urban": 0.3, "rural": 0.6}
+
+# The calculator applies SWL - 110 + A, so tables hold A = 110 - total attenuation
+WORKBOOK_REFERENCE_DB = 110.0
+
+
+def geometric_spreading(distances: np.ndarray, height_offset: float) -> np.ndarray:
+    """Spherical spreading from a point source, Concawe term K1.
+
+    Args:
+        distances: Horizontal distances in metres.
+        height_offset: Source to receiver height difference in metres; sets
+            the slant distance, so the term stays finite at 0 m.
+
+    Returns:
+        Attenuation in dB, ``20 log10(r) + 11``.
+    """
+    slant = np.hypot(distances, height_offset)
+    return 20 * np.log10(slant) + 11
+
+
+def air_absorption(distances: np.ndarray, coefficient: float) -> np.ndarray:
+    """Atmospheric absorption, Concawe term K2, in dB.
+
+    Args:
+        distances: Distances in metres.
+        coefficient: Absorption in dB per kilometre.
+    """
+    return coefficient * np.asarray(distances, dtype=np.float64) / 1000
+
+
+def ground_attenuation(distances: np.ndarray, ground_factors: Sequence[float], mean_height: float) -> np.ndarray:
+    """Ground attenuation, Concawe term K3, one column per ground factor.
+
+    Concawe gives ground attenuation as per-band curves; as a single
+    A-weighted figure this uses the ISO 9613-2 porous ground expression,
+    ``4.8 - (2 h / d)(17 + 300 / d)`` (never negative), scaled by the
+    ground factor.
+
+    Args:
+        distances: Distances in metres.
+        ground_factors: Ground factor of each column, 0 (hard) to 1 (porous).
+        mean_height: Mean height of the propagation path in metres.
+
+    Returns:
+        Attenuation in dB, shape (len(distances), len(ground_factors)).
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        porous = 4.8 - (2 * mean_height / distances) * (17 + 300 / distances)
+    porous = np.where(distances > 0, np.maximum(porous, 0.0), 0.0)
+    return porous[:, np.newaxis] * np.asarray(ground_factors, dtype=np.float64)
+
+
+def met_correction(distances: np.ndarray, limits: Sequence[float]) -> np.ndarray:
+    """Meteorological correction, Concawe term K4, one column per category.
+
+    Args:
+        distances: Distances in metres.
+        limits: Correction of each category at full range, in dB.
+
+    Returns:
+        Correction in dB, shape (len(distances), len(limits)); positive
+        values add attenuation.
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        growth = np.log10(np.maximum(distances, 0) / MET_CORRECTION_START) / np.log10(MET_CORRECTION_FULL / MET_CORRECTION_START)
+    growth = np.clip(growth, 0.0, 1.0)
+    return growth[:, np.newaxis] * np.asarray(limits, dtype=np.float64)
+
+
+def parse_met_category(value: Optional[Union[int, str]]) -> Optional[Union[int, str]]:
+    """Met category from configuration: 1-6, ``"worst"``, or None/empty for the workbook table."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str) and value.strip().lower() == WORST_CASE:
+        return WORST_CASE
+    try:
+        category = int(value)
+    except (TypeError, ValueError):
+        category = None
+    if category not in MET_CATEGORIES:
+        raise ValueError(f"Unknown met category {value!r}; expected 1-6 or {WORST_CASE!r}")
+    return category
+
+
+# Compiled tables shared by every model with the same parameters
+_table_cache: Dict[Tuple, Dict[Union[int, str], PropagationTable]] = {}
+_table_cache_lock = threading.Lock()
+
+
+class ConcaweModel:
+    """Concawe attenuation computed from the model terms K1 to K4.
+
+    Defaults reproduce the workbook's measured table to within about 2.5 dB
+    over its 0-96 m range under neutral weather (category 4), while
+    reaching any distance and category.
+    """
+
+    def __init__(self, height_offset: float = 7.0, air_absorption: float = 2.0, mean_height: float = 1.5,
+                 ground_factors: Optional[Dict[str, float]] = None, met_corrections: Optional[Dict[int, float]] = None):
+        """Initialize model parameters.
+
+        Args:
+            height_offset: Source to receiver height difference in metres.
+            air_absorption: Atmospheric absorption in dB per kilometre.
+            mean_height: Mean height of the propagation path in metres.
+            ground_factors: Ground factor per Concawe table column.
+            met_corrections: Full-range correction in dB per met category.
+        """
+        self.height_offset = float(height_offset)
+        self.air_absorption = float(air_absorption)
+        self.mean_height = float(mean_height)
+        self.ground_factors = dict(GROUND_FACTORS if ground_factors is None else ground_factors)
+        self.met_corrections = dict(MET_CORRECTION_LIMITS if met_corrections is None else met_corrections)
+
+        unknown = set(self.met_corrections) - set(MET_CATEGORIES)
+        if unknown:
+            raise ValueError(f"Unknown met categories: {sorted(unknown)}")
+
+    @property
+    def keys(self) -> list:
+        """Propagation keys, in table column order."""
+        return list(self.ground_factors)
+
+    @property
+    def categories(self) -> list:
+        """Met categories modelled, in ascending order."""
+        return sorted(self.met_corrections)
+
+    def parameters(self) -> Tuple:
+        """Hashable form of the parameters, used to key compiled tables."""
+        return (
+            self.height_offset, self.air_absorption, self.mean_height,
+            tuple(self.ground_factors.items()), tuple(sorted(self.met_corrections.items())),
+        )
+
+    def attenuation(self, distances: Union[float, Iterable[float]]) -> np.ndarray:
+        """Table attenuation for every distance, propagation key and met category.
+
+        Args:
+            distances: Distance or distances in metres.
+
+        Returns:
+            Array of shape (distances, keys, categories) holding
+            ``110 - (K1 + K2 + K3 + K4)``, the value the calculator adds to
+            ``SWL - 110``.
+        """
+        distances = np.atleast_1d(np.asarray(distances, dtype=np.float64))
+        if np.any(distances < 0):
+            raise ValueError("Distance must not be negative")
+
+        spreading = geometric_spreading(distances, self.height_offset) + air_absorption(distances, self.air_absorption)
+        ground = ground_attenuation(distances, list(self.ground_factors.values()), self.mean_height)
+        met = met_correction(distances, [self.met_corrections[c] for c in self.categories])
+
+        total = spreading[:, np.newaxis, np.newaxis] + ground[:, :, np.newaxis] + met[:, np.newaxis, :]
+        return WORKBOOK_REFERENCE_DB - total
+
+    def tables(self, max_distance: int = EXTENDED_MAX_DISTANCE) -> Dict[Union[int, str], PropagationTable]:
+        """Whole-metre tables from 0 m to ``max_distance``, compiled once per parameters.
+
+        Returns:
+            Met category -> table, plus ``"worst"``: the least attenuation
+            over all categories at each distance.
+        """
+        cache_key = (self.parameters(), int(max_distance))
+        tables = _table_cache.get(cache_key)
+        if tables is not None:
+            return tables
+
+        distances = np.arange(0, int(max_distance) + 1, dtype=np.int64)
+        attenuation = self.attenuation(distances)
+        source = f"Concawe model to {int(max_distance)} m"
+
+        # One evaluation over distance x key x category, split per category
+        tables = {
+            category: PropagationTable(distances.copy(), self.keys, np.ascontiguousarray(attenuation[:, :, i]),
+                                       f"{source}, met category {category}")
+            for i, category in enumerate(self.categories)
+        }
+        tables[WORST_CASE] = PropagationTable(distances.copy(), self.keys, attenuation.max(axis=2),
+                                              f"{source}, worst met category")
+
+        with _table_cache_lock:
+            tables = _table_cache.setdefault(cache_key, tables)
+        logger.info(f"Compiled Concawe model tables to {int(max_distance)} m")
+        return tables
+
+    def table(self, met_category: Union[int, str] = NEUTRAL_MET_CATEGORY,
+              max_distance: int = EXTENDED_MAX_DISTANCE) -> PropagationTable:
+        """Compiled table for one met category, or ``"worst"`` for the worst case."""
+        tables = self.tables(max_distance)
+        if met_category not in tables:
+            raise ValueError(f"Unknown met category {met_category!r}; expected one of {', '.join(map(str, tables))}")
+        return tables[met_category]
@@ -3,13 +3,25 @@ Dataset management for the noise estimator system.
 Handles loading, versioning, and accessing extracted workbook data.
 """
 
+import enum
 import json
 import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Mapping, Optional, Any, Tuple, Union
 import logging
+import sys
+import threading
+import time
+import types
 
+import numpy as np
+
+from .binary import BINARY_FILENAME, load_if_current, source_stamp, write_dataset_binary
+from .manifest import MANIFEST_FILENAME, read_manifest, scan_manifest, write_manifest
+from .propagation import PropagationTable
+from .views import DatasetView
 from ..models.schemas import (
     ExtractedDataset,
     DatasetMetadata,
@@ -22,37 +34,218 @@ from ..models.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Seconds before a default version that failed to load is tried again
+PROMOTION_RETRY_INTERVAL = 30.0
+
+
+def estimate_size(obj: Any, sample_limit: int = 512) -> int:
+    """Estimate the memory held by an object graph, in bytes.
+    
+    Walks containers, model fields and object attributes, counting each
+    object once. NumPy arrays count their buffers. Sequences longer than
+    ``sample_limit`` are estimated from an evenly spaced sample of their
+    items, so large tables cost milliseconds rather than seconds.
+    """
+    return _estimate_size(obj, set(), sample_limit)
+
+
+def _estimate_size(obj: Any, seen: set, sample_limit: int) -> int:
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        
+        # Shared definitions, not owned by the dataset
+        if isinstance(item, (type, types.ModuleType, types.FunctionType, enum.Enum)):
+            continue
+        if isinstance(item, np.ndarray):
+            total += sys.getsizeof(item) + (item.nbytes if item.base is None else 0)
+            continue
+        
+        total += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(item, Mapping):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)) and len(item) > sample_limit:
+            step = len(item) / sample_limit
+            sample = [item[int(i * step)] for i in range(sample_limit)]
+            sampled = sum(_estimate_size(element, seen, sample_limit) for element in sample)
+            total += int(sampled * len(item) / sample_limit)
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            attributes = getattr(item, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return total
+
+
+class DatasetSnapshot:
+    """A loaded dataset version with its prebuilt view.
+    
+    Snapshots are never modified once published. Requests hold a reference
+    to the snapshot they started with, so swapping in a new version never
+    changes data under an in-flight calculation, and the old snapshot is
+    freed once the last of them finishes.
+    """
+    
+    __slots__ = ("version", "dataset", "view", "loaded_at", "size_bytes")
+    
+    def __init__(self, dataset: ExtractedDataset, view: Optional[DatasetView]):
+        self.version = dataset.metadata.version
+        self.dataset = dataset
+        self.view = view
+        self.loaded_at = time.time()
+        self.size_bytes = estimate_size((dataset, view))
+
 
 class DatasetManager:
-    """Manages dataset loading, versioning, and access."""
+    """Manages dataset loading, versioning, and access.
     
-    def __init__(self, dataset_dir: Optional[Union[str, Path]] = None):
+    Loaded versions are published as immutable snapshots in a registry that
+    readers access without locking; only loading takes a (per-version)
+    lock. When the default version changes, the previous default keeps
+    serving requests while the new one is prepared in the background, then
+    the pointer is swapped in one assignment.
+    """
+    
+    def __init__(self, dataset_dir: Optional[Union[str, Path]] = None, manifest_check_interval: float = 1.0,
+                 max_cache_bytes: Optional[int] = None):
         """Initialize dataset manager.
         
         Args:
             dataset_dir: Directory containing datasets. Defaults to 'datasets/'.
+            manifest_check_interval: Minimum seconds between checks of the
+                version manifest for changes.
+            max_cache_bytes: Estimated memory budget for resident versions.
+                Least recently used versions are evicted beyond it; the
+                default version is never evicted. None means unbounded.
         """
         self.dataset_dir = Path(dataset_dir) if dataset_dir else Path("datasets")
+        self.manifest_check_interval = manifest_check_interval
+        self.max_cache_bytes = max_cache_bytes
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_stat: Optional[Tuple[int, int, int]] = None
+        self._manifest_checked = 0.0
         self._current_dataset: Optional[ExtractedDataset] = None
-        self._dataset_cache: Dict[str, ExtractedDataset] = {}
+        # Replaced, never mutated, so readers need no lock
+        self._snapshots: Dict[str, DatasetSnapshot] = {}
+        self._default: Optional[DatasetSnapshot] = None
+        self._registry_lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._promotions: Dict[str, Future] = {}
+        self._failed_promotions: Dict[str, float] = {}
+        self._promotion_pool: Optional[ThreadPoolExecutor] = None
+        self._promotion_listeners: List[Callable[[DatasetSnapshot], None]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+        # Written without locking from the read path, so counts are best effort
+        self._last_used: Dict[str, float] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        # Views built after loading for resident snapshots whose own view failed
+        self._view_cache: Dict[str, DatasetView] = {}
+        self._concawe_file_table: Optional[Tuple[Tuple[int, int], Optional[PropagationTable]]] = None
+        self._propagation_cache: Dict[str, Optional[PropagationTable]] = {}
     
-    def list_datasets(self) -> List[str]:
-        """List available dataset versions."""
-        if not self.dataset_dir.exists():
-            return []
+    def get_manifest(self, refresh: bool = False) -> Dict[str, Any]:
+        """Get the version manifest, re-reading it if the file has changed.
+        
+        The file's mtime is checked at most once per
+        ``manifest_check_interval``. If there is no manifest (or it is
+        unreadable) one is built by scanning the directory and saved.
         
-        datasets = []
-        for item in self.dataset_dir.iterdir():
-            if item.is_dir() and (item / "dataset.json").exists():
-                datasets.append(item.name)
+        Args:
+            refresh: Check the file now regardless of the interval.
+            
+        Returns:
+            Manifest with ``versions``, ``latest`` and ``active`` keys.
+        """
+        now = time.monotonic()
+        if not refresh and self._manifest is not None and now - self._manifest_checked < self.manifest_check_interval:
+            return self._manifest
+        self._manifest_checked = now
+        
+        try:
+            signature = self._manifest_signature()
+        except OSError:
+            return self.rebuild_manifest()
+        
+        if self._manifest is None or signature != self._manifest_stat:
+            try:
+                self._manifest = read_manifest(self.dataset_dir)
+                self._manifest_stat = signature
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read dataset manifest, rebuilding: {e}")
+                return self.rebuild_manifest()
+        
+        return self._manifest
+    
+    def rebuild_manifest(self) -> Dict[str, Any]:
+        """Rescan the dataset directory and rewrite the manifest.
+        
+        Needed only when version folders are added or removed by hand;
+        the extractor keeps the manifest up to date itself.
+        """
+        manifest = scan_manifest(self.dataset_dir, known=self._manifest)
+        self._manifest = manifest
+        self._manifest_stat = None
+        self._manifest_checked = time.monotonic()
+        
+        if self.dataset_dir.exists():
+            try:
+                write_manifest(self.dataset_dir, manifest)
+                self._manifest_stat = self._manifest_signature()
+            except OSError as e:
+                logger.debug(f"Could not write dataset manifest: {e}")
+        
+        return manifest
+    
+    def _manifest_signature(self) -> Tuple[int, int, int]:
+        # Replaced atomically, so a new inode also marks a change where
+        # mtime resolution is coarse
+        stat = (self.dataset_dir / MANIFEST_FILENAME).stat()
+        return stat.st_mtime_ns, stat.st_ino, stat.st_size
+    
+    def default_version(self) -> Optional[str]:
+        """Version used when none is requested: the active one, else the latest."""
+        manifest = self.get_manifest()
+        return manifest.get("active") or manifest.get("latest")
+    
+    def set_active_version(self, version: Optional[str]):
+        """Pin the default version, or unpin it with None.
+        
+        Raises:
+            FileNotFoundError: If the version is not in the manifest.
+        """
+        manifest = dict(self.get_manifest(refresh=True))
+        if version is not None and version not in manifest["versions"]:
+            raise FileNotFoundError(f"Dataset {version} not found")
         
-        return sorted(datasets, reverse=True)
+        manifest["active"] = version
+        write_manifest(self.dataset_dir, manifest)
+        self.get_manifest(refresh=True)
+    
+    def list_datasets(self) -> List[str]:
+        """List available dataset versions."""
+        return sorted(self.get_manifest()["versions"], reverse=True)
     
     def load_dataset(self, version: Optional[str] = None) -> ExtractedDataset:
         """Load a specific dataset version.
         
         Args:
-            version: Dataset version to load. If None, loads latest.
+            version: Dataset version to load. If None, loads the default
+                (active, else latest) version from the manifest. While a new
+                default is being prepared, the previous one is returned.
             
         Returns:
             Loaded dataset.
@@ -61,33 +254,248 @@ class DatasetManager:
             FileNotFoundError: If dataset not found.
         """
         if version is None:
-            versions = self.list_datasets()
-            if not versions:
-                raise FileNotFoundError("No datasets found")
-            version = versions[0]
+            return self._load_default().dataset
+        
+        snapshot = self._snapshots.get(version)
+        if snapshot is None:
+            snapshot = self._prepare(version)
+        else:
+            self._touch(version)
+        return snapshot.dataset
+    
+    def _touch(self, version: str):
+        self._last_used[version] = time.monotonic()
+        self._cache_hits += 1
+    
+    def _load_default(self) -> DatasetSnapshot:
+        version = self.default_version()
+        if version is None:
+            raise FileNotFoundError("No datasets found")
+        
+        current = self._default
+        if current is not None and current.version == version:
+            self._cache_hits += 1
+            return current
+        
+        snapshot = self._snapshots.get(version)
+        if snapshot is not None:
+            self._touch(version)
+        else:
+            if current is not None:
+                # Keep serving the previous default until the new one is ready
+                self.promote(version)
+                return current
+            snapshot = self._prepare(version)
+        
+        self._default = snapshot
+        return snapshot
+    
+    def _prepare(self, version: str) -> DatasetSnapshot:
+        """Load a version and publish its snapshot, once per version."""
+        with self._registry_lock:
+            lock = self._load_locks.setdefault(version, threading.Lock())
+        
+        with lock:
+            snapshot = self._snapshots.get(version)
+            if snapshot is not None:
+                self._touch(version)
+                return snapshot
+            
+            self._cache_misses += 1
+            snapshot = DatasetSnapshot(*self._read_dataset(version))
+            self._warm_propagation(snapshot.dataset)
+            with self._registry_lock:
+                self._snapshots = {**self._snapshots, version: snapshot}
+                self._last_used[version] = time.monotonic()
+                self._evict(keep=version)
+            self._current_dataset = snapshot.dataset
+            
+            logger.info(f"Loaded dataset {version} with {snapshot.dataset.metadata.total_tables} tables "
+                        f"(~{snapshot.size_bytes / 1e6:.1f} MB)")
+            return snapshot
+    
+    def _evict(self, keep: str):
+        """Evict least recently used versions until within the budget.
+        
+        Called with the registry lock held. The default version and ``keep``
+        are pinned; evicted snapshots stay valid for requests holding them.
+        """
+        if self.max_cache_bytes is None:
+            return
         
-        # Check cache first
-        if version in self._dataset_cache:
-            return self._dataset_cache[version]
+        pinned = {keep}
+        if self._default is not None:
+            pinned.add(self._default.version)
         
-        dataset_path = self.dataset_dir / version / "dataset.json"
+        snapshots = dict(self._snapshots)
+        total = sum(snapshot.size_bytes for snapshot in snapshots.values())
+        candidates = sorted(
+            (version for version in snapshots if version not in pinned),
+            key=lambda version: self._last_used.get(version, 0.0)
+        )
+        for version in candidates:
+            if total <= self.max_cache_bytes:
+                break
+            total -= snapshots.pop(version).size_bytes
+            self._last_used.pop(version, None)
+            self._view_cache.pop(version, None)
+            self._propagation_cache.pop(version, None)
+            self._cache_evictions += 1
+            logger.info(f"Evicted dataset {version} from cache")
+        
+        if total > self.max_cache_bytes:
+            logger.warning(f"Pinned datasets use ~{total / 1e6:.1f} MB, over the "
+                           f"{self.max_cache_bytes / 1e6:.1f} MB dataset cache budget")
+        self._snapshots = snapshots
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Resident versions, estimated memory and hit rate of the dataset cache."""
+        snapshots = self._snapshots
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "resident_versions": sorted(snapshots, reverse=True),
+            "resident_bytes": sum(snapshot.size_bytes for snapshot in snapshots.values()),
+            "max_bytes": self.max_cache_bytes,
+            "pinned_version": self._default.version if self._default is not None else None,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "evictions": self._cache_evictions,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+        }
+    
+    def _read_dataset(self, version: str) -> Tuple[ExtractedDataset, Optional[DatasetView]]:
+        version_dir = self.dataset_dir / version
+        dataset_path = version_dir / "dataset.json"
         if not dataset_path.exists():
             raise FileNotFoundError(f"Dataset {version} not found at {dataset_path}")
         
         try:
-            with open(dataset_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            dataset = ExtractedDataset(**data)
-            self._dataset_cache[version] = dataset
-            self._current_dataset = dataset
+            # The compiled artifact is hash-checked, so its rows skip validation
+            content = dataset_path.read_bytes()
+            source = source_stamp(content)
+            dataset = load_if_current(version_dir, source)
+            if dataset is None:
+                data = json.loads(content)
+                dataset = ExtractedDataset(**data)
+                self._compile_binary(version_dir, data, source)
+        except Exception as e:
+            logger.error(f"Failed to load dataset {version}: {e}")
+            raise
+        
+        # Materialize the indexed view up front so requests never build it
+        try:
+            view = DatasetView(dataset)
+        except Exception as e:
+            logger.warning(f"Could not build indexed view for dataset {version}: {e}")
+            view = None
+        
+        return dataset, view
+    
+    def _warm_propagation(self, dataset: ExtractedDataset):
+        try:
+            self.get_propagation_table(dataset)
+        except Exception as e:
+            logger.warning(f"Could not compile propagation table for dataset {dataset.metadata.version}: {e}")
+    
+    def promote(self, version: str) -> Future:
+        """Make a version the default, preparing it in the background.
+        
+        Requests for the default version keep getting the previous snapshot
+        until the new one is fully loaded and indexed. Concurrent calls for
+        the same version share one preparation.
+        
+        Returns:
+            Future resolving to the promoted snapshot.
+        """
+        with self._registry_lock:
+            pending = self._promotions.get(version)
+            if pending is not None:
+                return pending
             
-            logger.info(f"Loaded dataset {version} with {dataset.metadata.total_tables} tables")
-            return dataset
+            failed_at = self._failed_promotions.get(version)
+            if failed_at is not None and time.monotonic() - failed_at < PROMOTION_RETRY_INTERVAL:
+                future: Future = Future()
+                future.set_exception(RuntimeError(f"Dataset {version} failed to load recently"))
+                return future
             
+            if self._promotion_pool is None:
+                self._promotion_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataset-promotion")
+            future = self._promotion_pool.submit(self._promote, version)
+            self._promotions[version] = future
+            return future
+    
+    def _promote(self, version: str) -> DatasetSnapshot:
+        try:
+            snapshot = self._snapshots.get(version) or self._prepare(version)
         except Exception as e:
-            logger.error(f"Failed to load dataset {version}: {e}")
+            logger.error(f"Promotion of dataset {version} failed, keeping {self._default and self._default.version}: {e}")
+            with self._registry_lock:
+                self._failed_promotions[version] = time.monotonic()
+                self._promotions.pop(version, None)
             raise
+        
+        previous = self._default
+        self._default = snapshot
+        self._current_dataset = snapshot.dataset
+        with self._registry_lock:
+            self._failed_promotions.pop(version, None)
+            self._promotions.pop(version, None)
+        
+        logger.info(f"Promoted dataset {version} (was {previous.version if previous else None})")
+        for listener in list(self._promotion_listeners):
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.warning(f"Dataset promotion listener failed: {e}")
+        return snapshot
+    
+    def add_promotion_listener(self, listener: Callable[[DatasetSnapshot], None]):
+        """Call ``listener`` with each snapshot promoted to default."""
+        self._promotion_listeners.append(listener)
+    
+    def start_watching(self, interval: float = 30.0):
+        """Watch the manifest and promote a new default version when it appears.
+        
+        Args:
+            interval: Seconds between manifest checks.
+        """
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="dataset-watcher", daemon=True
+        )
+        self._watcher.start()
+    
+    def stop_watching(self):
+        """Stop the manifest watcher, if running."""
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+    
+    def _watch(self, interval: float):
+        while not self._watcher_stop.wait(interval):
+            try:
+                self.get_manifest(refresh=True)
+                version = self.default_version()
+                if version is not None and (self._default is None or self._default.version != version):
+                    self.promote(version)
+            except Exception as e:
+                logger.warning(f"Dataset watch check failed: {e}")
+    
+    def _compile_binary(self, version_dir: Path, data: Dict[str, Any], source: Dict[str, Any]):
+        """Write the binary artifact for a dataset loaded from JSON, if possible.
+        
+        Extraction normally writes the artifact; this only fills in for
+        datasets published without one. Failures (such as a read-only
+        dataset directory) never fail the load.
+        """
+        try:
+            write_dataset_binary(data, version_dir / BINARY_FILENAME, source=source)
+        except Exception as e:
+            logger.warning(f"Could not write binary dataset for {version_dir.name}: {e}")
     
     def get_current_dataset(self) -> Optional[ExtractedDataset]:
         """Get currently loaded dataset."""
@@ -115,69 +523,53 @@ class DatasetManager:
         
         return ds.tables[table_name]
     
-    def get_noise_categories(self, dataset: Optional[ExtractedDataset] = None) -> Dict[str, NoiseCategory]:
-        """Get noise categories from dataset."""
-        try:
-            categories_data = self.get_table("noise_categories", dataset)
-            categories = {}
-            
-            for cat_data in categories_data:
-                category = NoiseCategory(**cat_data)
-                categories[category.id] = category
-            
-            return categories
+    def get_view(self, dataset: Optional[ExtractedDataset] = None) -> DatasetView:
+        """Get the indexed view of a dataset, building it on first use.
+        
+        Args:
+            dataset: Dataset to use. If None, uses current.
             
-        except KeyError:
-            logger.warning("No noise_categories table found in dataset")
-            return {}
+        Returns:
+            Immutable indexed view. Views are cached only alongside a
+            resident snapshot, so eviction frees them with it; a dataset
+            that is no longer resident (held by an in-flight request) gets
+            an uncached view.
+        """
+        ds = dataset or self._current_dataset
+        if not ds:
+            raise ValueError("No dataset loaded")
+        
+        snapshot = self._snapshots.get(ds.metadata.version)
+        if snapshot is None or snapshot.dataset is not ds:
+            return DatasetView(ds)
+        if snapshot.view is not None:
+            return snapshot.view
+        
+        view = self._view_cache.get(snapshot.version)
+        if view is None or view.dataset is not ds:
+            view = DatasetView(ds)
+            with self._registry_lock:
+                # Only cache for a snapshot that was not evicted meanwhile
+                if self._snapshots.get(snapshot.version) is snapshot:
+                    self._view_cache[snapshot.version] = view
+        
+        return view
+    
+    def get_noise_categories(self, dataset: Optional[ExtractedDataset] = None) -> Mapping[str, NoiseCategory]:
+        """Get noise categories from dataset."""
+        return self.get_view(dataset).noise_categories
     
-    def get_scenarios(self, dataset: Optional[ExtractedDataset] = None) -> Dict[str, Scenario]:
+    def get_scenarios(self, dataset: Optional[ExtractedDataset] = None) -> Mapping[str, Scenario]:
         """Get scenarios from dataset."""
-        try:
-            scenarios_data = self.get_table("scenarios", dataset)
-            scenarios = {}
-            
-            for scen_data in scenarios_data:
-                scenario = Scenario(**scen_data)
-                scenarios[scenario.id] = scenario
-            
-            return scenarios
-            
-        except KeyError:
-            logger.warning("No scenarios table found in dataset")
-            return {}
+        return self.get_view(dataset).scenarios
     
-    def get_plants(self, dataset: Optional[ExtractedDataset] = None) -> Dict[str, Plant]:
+    def get_plants(self, dataset: Optional[ExtractedDataset] = None) -> Mapping[str, Plant]:
         """Get plants from dataset."""
-        try:
-            plants_data = self.get_table("plants", dataset)
-            plants = {}
-            
-            for plant_data in plants_data:
-                plant = Plant(**plant_data)
-                plants[plant.id] = plant
-            
-            return plants
-            
-        except KeyError:
-            logger.warning("No plants table found in dataset")
-            return {}
+        return self.get_view(dataset).plants
     
-    def get_mitigation_measures(self, dataset: Optional[ExtractedDataset] = None) -> Dict[str, MitigationMeasure]:
+    def get_mitigation_measures(self, dataset: Optional[ExtractedDataset] = None) -> Mapping[str, MitigationMeasure]:
         """Get mitigation measures from dataset."""
-        try:
-            measures_data = self.get_table("mitigation_measures", dataset)
-            measures = {}
-            
-            for measure_data in measures_data:
-                measure = MitigationMeasure(**measure_data)
-                measures[measure.id] = measure
-            
-            return measures
-            
-        except KeyError:
-            logger.warning("No mitigation_measures table found in dataset")
-            return {}
+        return self.get_view(dataset).mitigation_measures
     
     def get_concawe_data(self, dataset: Optional[Any] = None) -> Dict[str, Any]:
         """Get Concawe propagation attenuation data."""
@@ -202,6 +594,50 @@ class DatasetManager:
         else:
             return {}
     
+    def get_propagation_table(self, dataset: Optional[Any] = None) -> Optional[PropagationTable]:
+        """Get the compiled Concawe propagation table.
+        
+        The separate ``concawe_propagation.json`` file is compiled once and
+        recompiled only when its mtime or size changes. Tables embedded in a
+        dataset are compiled once per dataset version.
+        
+        Returns:
+            Compiled table, or None if no Concawe data is available.
+        """
+        if dataset is None:
+            dataset = self._current_dataset
+        
+        concawe_file = self.dataset_dir / "concawe_propagation.json"
+        try:
+            stat = concawe_file.stat()
+        except OSError:
+            stat = None
+        
+        if stat is not None:
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            if self._concawe_file_table is None or self._concawe_file_table[0] != file_key:
+                with open(concawe_file, 'r') as f:
+                    concawe_dataset = json.load(f)
+                table = PropagationTable.from_concawe_data(
+                    concawe_dataset.get("concawe_attenuation", {}), source=str(concawe_file)
+                )
+                self._concawe_file_table = (file_key, table)
+                logger.info(f"Compiled Concawe propagation table from {concawe_file}")
+            return self._concawe_file_table[1]
+        
+        # Fall back to data in main dataset
+        if hasattr(dataset, 'tables'):
+            cache_key = dataset.metadata.version
+            if cache_key not in self._propagation_cache:
+                self._propagation_cache[cache_key] = PropagationTable.from_concawe_data(
+                    dataset.tables.get("concawe_attenuation", {}), source=f"dataset {cache_key}"
+                )
+            return self._propagation_cache[cache_key]
+        elif isinstance(dataset, dict):
+            return PropagationTable.from_concawe_data(dataset.get("concawe_attenuation", {}))
+        else:
+            return None
+    
     def get_background_levels(self, dataset: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get background level data."""
         try:
@@ -292,6 +728,15 @@ class DatasetManager:
             }
     
     def clear_cache(self):
-        """Clear dataset cache."""
-        self._dataset_cache.clear()
+        """Clear dataset cache.
+        
+        In-flight requests keep the snapshots they already hold.
+        """
+        with self._registry_lock:
+            self._snapshots = {}
+            self._default = None
+            self._last_used.clear()
+        self._view_cache.clear()
+        self._propagation_cache.clear()
+        self._concawe_file_table = None
         self._current_dataset = None
@@ -0,0 +1,887 @@
+"""
+Workbook formula engine.
+Compiles the Excel formulas extracted into ``docs/workbook_logic.json`` into
+vectorized NumPy evaluators, so the workbook's own calculation chain can be
+run for thousands of input rows at once without Excel.
+"""
+
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+import json
+import logging
+import math
+import re
+
+import numpy as np
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from .propagation import PropagationTable
+
+logger = logging.getLogger(__name__)
+
+# A compiled formula: cell values so far -> value of the formula. Values are
+# 1-D arrays of length 1 (the same for every row) or of the row count, and
+# ranges are (rows, columns, 1 or row count) arrays.
+Evaluator = Callable[[Dict[str, np.ndarray]], np.ndarray]
+
+BLANK = np.array([None], dtype=object)
+
+_CELL = r"\$?([A-Za-z]{1,3})\$?(\d+)"
+_SHEET = r"(?:'((?:[^']|'')+)'|([A-Za-z_][\w\.]*))!"
+_TOKEN_PATTERNS = [
+    ("space", re.compile(r"\s+")),
+    ("string", re.compile(r'"((?:[^"]|"")*)"')),
+    ("ref", re.compile(rf"(?:{_SHEET})?{_CELL}(?::{_CELL})?(?![\w\(\[!])")),
+    ("number", re.compile(r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")),
+    ("function", re.compile(r"([A-Za-z_][\w\.]*)\s*\(")),
+    ("table", re.compile(r"([A-Za-z_\\][\w\.]*)\[")),
+    ("name", re.compile(r"[A-Za-z_][\w\.]*")),
+    ("error", re.compile(r"#(?:N/A|REF!|VALUE!|DIV/0!|NAME\?|NUM!|NULL!)")),
+    ("op", re.compile(r"<=|>=|<>|[-+*/^&=<>(),%]")),
+]
+
+# Binary operator precedence, lowest first; ^ is left-associative in Excel
+_PRECEDENCE = {"=": 1, "<>": 1, "<": 1, ">": 1, "<=": 1, ">=": 1, "&": 2, "+": 3, "-": 3, "*": 4, "/": 4, "^": 5}
+
+
+class FormulaError(ValueError):
+    """A formula could not be parsed, compiled or ordered."""
+
+
+def cell_key(sheet: str, row: int, column: int) -> str:
+    """Canonical cell name, e.g. ``Estimator (Scenario)!G28``."""
+    return f"{sheet}!{get_column_letter(column)}{row}"
+
+
+def parse_cell(text: str, sheet: Optional[str] = None) -> Tuple[str, int, int]:
+    """Split a cell reference into (sheet, row, column).
+
+    Args:
+        text: Reference such as ``G28``, ``$G$28`` or ``'Sheet name'!G28``.
+        sheet: Sheet of references without one.
+    """
+    match = re.fullmatch(rf"\s*(?:{_SHEET})?{_CELL}\s*", text)
+    if match is None:
+        # Canonical names are not quoted, so sheet names may hold anything
+        name, _, cell = text.rpartition("!")
+        match = re.fullmatch(_CELL, cell.strip())
+        if not name or match is None:
+            raise FormulaError(f"Not a cell reference: {text!r}")
+        return name, int(match.group(2)), column_index_from_string(match.group(1).upper())
+    quoted, bare, column, row = match.groups()
+    name = quoted.replace("''", "'") if quoted else bare or sheet
+    if name is None:
+        raise FormulaError(f"No sheet given for {text!r}")
+    return name, int(row), column_index_from_string(column.upper())
+
+
+def _tokenize(formula: str) -> List[Tuple[str, Any]]:
+    text = formula[1:] if formula.startswith("=") else formula
+    tokens = []
+    position = 0
+    while position < len(text):
+        for kind, pattern in _TOKEN_PATTERNS:
+            match = pattern.match(text, position)
+            if match is None:
+                continue
+            if kind == "table":
+                # Structured reference: the table name then balanced brackets
+                depth, end = 0, match.end() - 1
+                while end < len(text):
+                    depth += {"[": 1, "]": -1}.get(text[end], 0)
+                    end += 1
+                    if depth == 0:
+                        break
+                if depth:
+                    raise FormulaError(f"Unbalanced brackets in {formula!r}")
+                tokens.append(("table", (match.group(1), text[match.end():end - 1])))
+                position = end
+                break
+            if kind != "space":
+                tokens.append((kind, match))
+            position = match.end()
+            break
+        else:
+            raise FormulaError(f"Unexpected {text[position:position + 10]!r} in {formula!r}")
+    return tokens
+
+
+class _Parser:
+    """Precedence-climbing parser from formula tokens to tuple syntax trees."""
+
+    def __init__(self, formula: str, sheet: str):
+        self.formula = formula
+        self.sheet = sheet
+        self.tokens = _tokenize(formula)
+        self.position = 0
+
+    def parse(self) -> tuple:
+        node = self.expression(0)
+        if self.position != len(self.tokens):
+            raise FormulaError(f"Unexpected trailing input in {self.formula!r}")
+        return node
+
+    def peek(self) -> Tuple[Optional[str], Any]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def is_op(self, *ops: str) -> bool:
+        kind, token = self.peek()
+        return kind == "op" and token.group(0) in ops
+
+    def expect(self, op: str):
+        if not self.is_op(op):
+            raise FormulaError(f"Expected {op!r} in {self.formula!r}")
+        self.position += 1
+
+    def expression(self, min_precedence: int) -> tuple:
+        node = self.unary()
+        while True:
+            kind, token = self.peek()
+            op = token.group(0) if kind == "op" else None
+            precedence = _PRECEDENCE.get(op, 0)
+            if precedence <= min_precedence:
+                return node
+            self.position += 1
+            node = ("op", op, node, self.expression(precedence))
+
+    def unary(self) -> tuple:
+        if self.is_op("-", "+"):
+            op = self.tokens[self.position][1].group(0)
+            self.position += 1
+            operand = self.unary()
+            return ("neg", operand) if op == "-" else operand
+        node = self.primary()
+        while self.is_op("%"):
+            self.position += 1
+            node = ("op", "/", node, ("const", 100.0))
+        return node
+
+    def primary(self) -> tuple:
+        kind, token = self.peek()
+        if kind is None:
+            raise FormulaError(f"Unexpected end of {self.formula!r}")
+        self.position += 1
+
+        if kind == "number":
+            return ("const", float(token.group(0)))
+        if kind == "string":
+            return ("const", token.group(1).replace('""', '"'))
+        if kind == "error":
+            return ("const", math.nan)
+        if kind == "table":
+            return ("table",) + token
+        if kind == "name":
+            name = token.group(0).upper()
+            if name in ("TRUE", "FALSE"):
+                return ("const", name == "TRUE")
+            raise FormulaError(f"Unsupported name {token.group(0)!r} in {self.formula!r}")
+        if kind == "ref":
+            quoted, bare, column, row, last_column, last_row = token.groups()
+            sheet = quoted.replace("''", "'") if quoted else bare or self.sheet
+            first = (int(row), column_index_from_string(column.upper()))
+            if last_column is None:
+                return ("cell", cell_key(sheet, *first))
+            last = (int(last_row), column_index_from_string(last_column.upper()))
+            return ("range", sheet, min(first[0], last[0]), min(first[1], last[1]),
+                    max(first[0], last[0]), max(first[1], last[1]))
+        if kind == "function":
+            name = token.group(1).upper()
+            args = []
+            if not self.is_op(")"):
+                while True:
+                    args.append(self.expression(0))
+                    if not self.is_op(","):
+                        break
+                    self.position += 1
+            self.expect(")")
+            return ("call", name, args)
+        if token.group(0) == "(":
+            node = self.expression(0)
+            self.expect(")")
+            return node
+        raise FormulaError(f"Unexpected {token.group(0)!r} in {self.formula!r}")
+
+
+def parse_formula(formula: str, sheet: str) -> tuple:
+    """Parse an Excel formula into a syntax tree.
+
+    Args:
+        formula: Formula text, with or without the leading ``=``.
+        sheet: Sheet holding the formula, for references without one.
+
+    Returns:
+        Nested tuples: ``("const", value)``, ``("cell", key)``,
+        ``("range", sheet, first_row, first_col, last_row, last_col)``,
+        ``("table", name, spec)``, ``("call", name, args)``,
+        ``("neg", operand)`` or ``("op", op, left, right)``.
+    """
+    return _Parser(formula, sheet).parse()
+
+
+class TableSpec:
+    """Excel table (ListObject) that structured references such as
+    ``conc_scen[[Hard]:[Rural]]`` resolve to.
+
+    The workbook logic holds no table definitions, so they are supplied by
+    the caller: either as constant rows, or as the block of a sheet holding
+    the data rows, whose cells may themselves be formulas.
+    """
+
+    def __init__(self, columns: Sequence[Any], rows: Optional[Sequence[Sequence[Any]]] = None,
+                 sheet: Optional[str] = None, data_range: Optional[str] = None):
+        """Initialize a table.
+
+        Args:
+            columns: Column headers, in order.
+            rows: Constant data rows.
+            sheet: Sheet holding the data rows, when not constant.
+            data_range: Block of ``sheet`` holding the data rows, e.g.
+                ``"C21:L35"``; the header row is just above it.
+        """
+        if (rows is None) == (data_range is None):
+            raise ValueError("Give either constant rows or a sheet data range")
+        self.columns = [str(column) for column in columns]
+        self.sheet = sheet
+        self.rows = rows
+        self.data_range = data_range
+        self._column_index = {column.lower(): i for i, column in enumerate(self.columns)}
+
+    @classmethod
+    def from_propagation_table(cls, table: PropagationTable) -> "TableSpec":
+        """The workbook's ``conc_scen`` table from a compiled Concawe table."""
+        keys = ["hard", "urban", "rural"]
+        columns = [table.attenuation[:, table.keys.index(key)] if key in table.keys
+                   else np.zeros(len(table)) for key in keys]
+        rows = [[int(distance)] + [float(column[i]) for column in columns]
+                for i, distance in enumerate(table.distances)]
+        return cls(["m", "Hard", "Urban", "Rural"], rows=rows)
+
+    def column(self, name: str) -> int:
+        """0-based index of a column."""
+        index = self._column_index.get(name.strip().lower())
+        if index is None:
+            raise FormulaError(f"Table has no column {name!r}")
+        return index
+
+
+def _as_array(value: Any) -> np.ndarray:
+    """One cell value, or one per row, as a 1-D array."""
+    if isinstance(value, np.ndarray) and value.ndim == 1 and value.dtype.kind in "fbO":
+        return value
+    array = np.asarray(value)
+    if array.ndim == 0:
+        array = array.reshape(1)
+    if array.dtype.kind in "iu":
+        return array.astype(np.float64)
+    if array.dtype.kind not in "fb":
+        return array.astype(object)
+    return array
+
+
+def _is_numeric(value: np.ndarray) -> bool:
+    return value.dtype.kind in "fb"
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return 0.0
+    if isinstance(value, (bool, int, float, np.number, np.bool_)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return math.nan
+    return math.nan
+
+
+_to_float_ufunc = np.frompyfunc(_to_float, 1, 1)
+
+
+def _number(value: np.ndarray) -> np.ndarray:
+    """Numeric view of values; text that is not a number is an error (NaN)."""
+    if _is_numeric(value):
+        return value.astype(np.float64, copy=False)
+    return _to_float_ufunc(value).astype(np.float64)
+
+
+def _truth_value(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.upper() == "TRUE"
+    number = _to_float(value)
+    return not math.isnan(number) and number != 0
+
+
+_truth_ufunc = np.frompyfunc(_truth_value, 1, 1)
+
+
+def _truth(value: np.ndarray) -> np.ndarray:
+    """Logical view of values; errors are false."""
+    if value.dtype.kind == "b":
+        return value
+    if value.dtype.kind == "f":
+        return np.nan_to_num(value, nan=0.0) != 0
+    return _truth_ufunc(value).astype(bool)
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (float, np.floating)):
+        return f"{value:.15g}"
+    return str(value)
+
+
+def _rank(value: Any) -> Tuple[int, Any]:
+    # Excel orders numbers before text before logical values; text compares
+    # case-insensitively
+    if isinstance(value, (bool, np.bool_)):
+        return 2, bool(value)
+    if isinstance(value, str):
+        return 1, value.casefold()
+    return 0, float(value)
+
+
+def _compare_values(op: str) -> Callable[[Any, Any], bool]:
+    def compare(a: Any, b: Any) -> bool:
+        # A blank cell takes the type of what it is compared with
+        if a is None:
+            a = "" if isinstance(b, str) else False if isinstance(b, (bool, np.bool_)) else 0.0
+        if b is None:
+            b = "" if isinstance(a, str) else False if isinstance(a, (bool, np.bool_)) else 0.0
+        if isinstance(a, float) and math.isnan(a) or isinstance(b, float) and math.isnan(b):
+            return False
+        left, right = _rank(a), _rank(b)
+        return {
+            "=": left == right, "<>": left != right, "<": left < right,
+            ">": left > right, "<=": left <= right, ">=": left >= right,
+        }[op]
+    return np.frompyfunc(compare, 2, 1)
+
+
+_COMPARATORS = {op: _compare_values(op) for op in ("=", "<>", "<", ">", "<=", ">=")}
+_NUMERIC_COMPARATORS = {
+    "=": np.equal, "<>": np.not_equal, "<": np.less,
+    ">": np.greater, "<=": np.less_equal, ">=": np.greater_equal,
+}
+
+
+def _compare(op: str, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if _is_numeric(a) and _is_numeric(b):
+        with np.errstate(invalid="ignore"):
+            return _NUMERIC_COMPARATORS[op](a.astype(np.float64), b.astype(np.float64))
+    return _COMPARATORS[op](a.astype(object), b.astype(object)).astype(bool)
+
+
+def _where(condition: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if a.dtype == b.dtype or _is_numeric(a) and _is_numeric(b):
+        return np.where(condition, a, b)
+    return np.where(condition, a.astype(object), b.astype(object))
+
+
+def _is_error(value: np.ndarray) -> np.ndarray:
+    if value.dtype.kind == "f":
+        return np.isnan(value)
+    if value.dtype.kind == "b":
+        return np.zeros(value.shape, dtype=bool)
+    return np.array([isinstance(item, float) and math.isnan(item) for item in value.ravel()],
+                    dtype=bool).reshape(value.shape)
+
+
+def _finite(value: np.ndarray) -> np.ndarray:
+    # Division by zero and overflow are errors in Excel
+    return np.where(np.isfinite(value), value, np.nan)
+
+
+def _arithmetic(op: str, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if op == "&":
+        return np.frompyfunc(lambda x, y: _text(x) + _text(y), 2, 1)(a.astype(object), b.astype(object))
+    if op in _NUMERIC_COMPARATORS:
+        return _compare(op, a, b)
+    x, y = _number(a), _number(b)
+    with np.errstate(all="ignore"):
+        if op == "+":
+            return x + y
+        if op == "-":
+            return x - y
+        if op == "*":
+            return x * y
+        if op == "/":
+            return _finite(x / y)
+        return _finite(np.power(x, y))
+
+
+def _round(x: np.ndarray, digits: np.ndarray, mode: str = "half") -> np.ndarray:
+    """Excel rounding: halves and ROUNDUP go away from zero."""
+    scale = np.power(10.0, np.trunc(digits))
+    # Trim binary noise such as 2.675 * 100 = 267.49999999999997
+    scaled = np.round(np.abs(x) * scale, 9)
+    if mode == "half":
+        rounded = np.floor(scaled + 0.5)
+    elif mode == "up":
+        rounded = np.ceil(scaled)
+    else:
+        rounded = np.floor(scaled)
+    return np.sign(x) * rounded / scale
+
+
+def _static_int(value: np.ndarray, name: str) -> int:
+    numbers = _number(value)
+    if numbers.size == 0 or np.any(numbers != numbers.flat[0]) or np.isnan(numbers.flat[0]):
+        raise FormulaError(f"{name} must be the same number for every row")
+    return int(numbers.flat[0])
+
+
+def _vector(grid: np.ndarray, name: str) -> np.ndarray:
+    """One-row or one-column range as a (cells, rows) array."""
+    if grid.ndim != 3 or (grid.shape[0] != 1 and grid.shape[1] != 1):
+        raise FormulaError(f"{name} needs a one-row or one-column range")
+    return grid.reshape(grid.shape[0] * grid.shape[1], grid.shape[2])
+
+
+def _match_key(value: Any) -> Any:
+    if value is None or isinstance(value, float) and math.isnan(value):
+        return None
+    rank, key = _rank(value)
+    return rank, key
+
+
+def _match_exact(lookup: np.ndarray, vector: np.ndarray) -> np.ndarray:
+    """Exact MATCH in a range that is the same for every row.
+
+    Numbers use a sorted search and anything else a dict of first
+    positions, instead of comparing every row with every cell.
+    """
+    if _is_numeric(lookup) and _is_numeric(vector):
+        values = vector.astype(np.float64)
+        order = np.argsort(values, kind="stable")
+        ordered = values[order]
+        position = np.clip(np.searchsorted(ordered, lookup, side="left"), 0, len(ordered) - 1)
+        found = ordered[position] == lookup
+        return np.where(found, order[position] + 1.0, np.nan)
+
+    positions: Dict[Any, float] = {}
+    for i, value in enumerate(vector):
+        key = _match_key(value)
+        if key is not None:
+            positions.setdefault(key, i + 1.0)
+    return np.array([positions.get(_match_key(value), math.nan) for value in lookup], dtype=np.float64)
+
+
+def _match(lookup: np.ndarray, grid: np.ndarray, match_type: int = 1) -> np.ndarray:
+    """Excel MATCH, for one lookup value per row.
+
+    Approximate matches count the cells at or below (type 1) or at or above
+    (type -1) the lookup value, which is what Excel's binary search finds
+    on the sorted ranges it requires.
+    """
+    vector = _vector(grid, "MATCH")
+    if match_type == 0 and vector.shape[1] == 1:
+        return _match_exact(lookup, vector[:, 0])
+    if match_type == 0:
+        hits = _compare("=", vector, lookup[np.newaxis, :])
+        found = hits.any(axis=0)
+        position = hits.argmax(axis=0) + 1.0
+    else:
+        hits = _compare("<=" if match_type > 0 else ">=", vector, lookup[np.newaxis, :])
+        position = hits.sum(axis=0).astype(np.float64)
+        found = position > 0
+    return np.where(found, position, np.nan)
+
+
+def _index(grid: np.ndarray, row: np.ndarray, column: Optional[np.ndarray] = None) -> np.ndarray:
+    """Excel INDEX of one cell per row; out-of-range positions are errors."""
+    if grid.ndim != 3:
+        raise FormulaError("INDEX needs a range")
+    rows, columns, depth = grid.shape
+    row = _number(row)
+    if column is None:
+        if rows == 1 and columns > 1:
+            row, column = np.ones(1), row
+        elif columns == 1:
+            column = np.ones(1)
+        else:
+            raise FormulaError("INDEX of a block needs a row and a column")
+    column = _number(column)
+
+    size = max(len(row), len(column), depth)
+    row = np.broadcast_to(np.nan_to_num(row, nan=-1.0), size)
+    column = np.broadcast_to(np.nan_to_num(column, nan=-1.0), size)
+    valid = (row >= 1) & (row <= rows) & (column >= 1) & (column <= columns)
+    r = np.where(valid, row, 1).astype(np.int64) - 1
+    c = np.where(valid, column, 1).astype(np.int64) - 1
+    k = np.arange(size) if depth > 1 else np.zeros(size, dtype=np.int64)
+
+    values = grid[r, c, k]
+    if values.dtype.kind == "b":
+        values = values.astype(object)
+    if values.dtype.kind == "f":
+        return np.where(valid, values, np.nan)
+    return np.where(valid, values, np.array(math.nan, dtype=object))
+
+
+def _cell_number(value: Any) -> float:
+    # Functions over ranges skip text, logical values and blanks
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_)):
+        return float(value)
+    return math.nan
+
+
+_cell_number_ufunc = np.frompyfunc(_cell_number, 1, 1)
+
+
+def _grid_numbers(grid: np.ndarray) -> np.ndarray:
+    """Numbers of a range as (cells, rows), NaN where a cell holds no number."""
+    flat = grid.reshape(grid.shape[0] * grid.shape[1], grid.shape[2])
+    if flat.dtype.kind == "f":
+        return flat
+    return _cell_number_ufunc(flat).astype(np.float64)
+
+
+def _aggregate(name: str, args: List[np.ndarray]) -> np.ndarray:
+    parts = []
+    for arg in args:
+        parts.extend(_grid_numbers(arg) if arg.ndim == 3 else _number(arg)[np.newaxis, :])
+    size = max(len(part) for part in parts)
+    values = np.stack([np.broadcast_to(part, size) for part in parts])
+    present = ~np.isnan(values)
+    if name == "SUM":
+        return np.where(present, values, 0.0).sum(axis=0)
+    if name == "AVERAGE":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return _finite(np.where(present, values, 0.0).sum(axis=0) / present.sum(axis=0))
+    extreme = np.where(present, values, np.inf if name == "MIN" else -np.inf)
+    result = extreme.min(axis=0) if name == "MIN" else extreme.max(axis=0)
+    return np.where(present.any(axis=0), result, 0.0)
+
+
+def _call(name: str, args: List[np.ndarray]) -> np.ndarray:
+    """Evaluate a worksheet function over evaluated arguments."""
+    if name == "IF":
+        if len(args) not in (2, 3):
+            raise FormulaError("IF takes 2 or 3 arguments")
+        otherwise = args[2] if len(args) == 3 else np.array([False])
+        return _where(_truth(args[0]), args[1], otherwise)
+    if name == "IFERROR":
+        return _where(_is_error(args[0]), args[1], args[0])
+    if name in ("AND", "OR"):
+        truths = [_truth(arg.reshape(-1, arg.shape[-1]) if arg.ndim == 3 else arg[np.newaxis, :]) for arg in args]
+        reduce = np.all if name == "AND" else np.any
+        size = max(truth.shape[1] for truth in truths)
+        return reduce(np.concatenate([np.broadcast_to(truth, (len(truth), size)) for truth in truths]), axis=0)
+    if name == "NOT":
+        return ~_truth(args[0])
+    if name in ("ROUND", "ROUNDUP", "ROUNDDOWN"):
+        mode = {"ROUND": "half", "ROUNDUP": "up", "ROUNDDOWN": "down"}[name]
+        return _round(_number(args[0]), _number(args[1]) if len(args) > 1 else np.zeros(1), mode)
+    if name in ("CEILING", "FLOOR"):
+        x = _number(args[0])
+        significance = _number(args[1]) if len(args) > 1 else np.ones(1)
+        step = np.ceil if name == "CEILING" else np.floor
+        with np.errstate(all="ignore"):
+            result = np.where(significance == 0, 0.0, step(x / significance) * significance) + 0.0
+        # The sign of a non-zero significance has to match a positive number
+        return np.where((x > 0) & (significance < 0), np.nan, result)
+    if name in ("LOG10", "LN", "SQRT", "EXP", "ABS", "INT"):
+        function = {"LOG10": np.log10, "LN": np.log, "SQRT": np.sqrt, "EXP": np.exp,
+                    "ABS": np.abs, "INT": np.floor}[name]
+        with np.errstate(all="ignore"):
+            return _finite(function(_number(args[0])))
+    if name == "LOG":
+        base = _number(args[1]) if len(args) > 1 else np.array([10.0])
+        with np.errstate(all="ignore"):
+            return _finite(np.log(_number(args[0])) / np.log(base))
+    if name == "POWER":
+        return _arithmetic("^", args[0], args[1])
+    if name == "PI":
+        return np.array([math.pi])
+    if name in ("SUM", "MIN", "MAX", "AVERAGE"):
+        return _aggregate(name, args)
+    if name == "MATCH":
+        match_type = _static_int(args[2], "MATCH type") if len(args) > 2 else 1
+        return _match(args[0], args[1], match_type)
+    if name == "INDEX":
+        return _index(*args[:3])
+    if name == "VLOOKUP":
+        approximate = bool(_truth(args[3]).all()) if len(args) > 3 else True
+        row = _match(args[0], args[1][:, :1, :], 1 if approximate else 0)
+        return _index(args[1], row, args[2])
+    raise FormulaError(f"Unsupported function {name}")
+
+
+class FormulaModel:
+    """Workbook formulas compiled into a dependency graph of vectorized evaluators.
+
+    Each formula cell is compiled once into a closure over NumPy operations.
+    Evaluating a set of output cells runs, in dependency order, only the
+    formulas they depend on, with one value per input row in every array.
+    Errors (``#N/A``, ``#VALUE!``, ...) evaluate to NaN.
+    """
+
+    def __init__(self, formulas: Dict[str, str], tables: Optional[Dict[str, TableSpec]] = None,
+                 constants: Optional[Dict[str, Any]] = None):
+        """Compile formulas.
+
+        Args:
+            formulas: Cell name (``Sheet!A1``) -> formula text.
+            tables: Tables that structured references resolve to, by name.
+            constants: Non-formula cell values, by cell name. Cells with
+                neither a formula nor a value are blank.
+        """
+        self.tables = {name.lower(): table for name, table in (tables or {}).items()}
+        self.constants = {self._canonical(key): _as_array(value) for key, value in (constants or {}).items()}
+        self.errors: Dict[str, str] = {}
+        self._evaluators: Dict[str, Evaluator] = {}
+        self._dependencies: Dict[str, Set[str]] = {}
+        self._plans: Dict[Tuple[Tuple[str, ...], frozenset], List[str]] = {}
+
+        for name, formula in formulas.items():
+            key = self._canonical(name)
+            try:
+                tree = parse_formula(formula, parse_cell(key)[0])
+                self._evaluators[key], self._dependencies[key] = self._compile(tree)
+            except FormulaError as e:
+                self.errors[key] = str(e)
+        if self.errors:
+            logger.info(f"{len(self.errors)} of {len(formulas)} formulas could not be compiled")
+
+    @classmethod
+    def from_logic(cls, logic: Union[str, Path, Dict[str, Any]], sheets: Optional[Iterable[str]] = None,
+                   tables: Optional[Dict[str, TableSpec]] = None,
+                   constants: Optional[Dict[str, Any]] = None) -> "FormulaModel":
+        """Compile the formulas of ``extract_workbook_logic.py`` output.
+
+        Tables and constants recorded in the logic are used unless given.
+
+        Args:
+            logic: Path to ``workbook_logic.json``, or its parsed content.
+            sheets: Sheets whose formulas to compile; all by default.
+            tables: Tables that structured references resolve to.
+            constants: Non-formula cell values, by cell name.
+        """
+        if not isinstance(logic, dict):
+            with open(logic, 'r', encoding='utf-8') as f:
+                logic = json.load(f)
+        wanted = set(sheets) if sheets is not None else None
+
+        all_tables = {
+            name: TableSpec(table["columns"], sheet=table["sheet"], data_range=table["data_range"])
+            for name, table in logic.get("tables", {}).items()
+        }
+        all_tables.update(tables or {})
+        all_constants = dict(logic.get("constants", {}))
+        all_constants.update(constants or {})
+
+        formulas = {}
+        for sheet_name, sheet in logic.get("sheets", {}).items():
+            if wanted is not None and sheet_name not in wanted:
+                continue
+            for cell, entry in sheet.get("formulas", {}).items():
+                if entry.get("formula"):
+                    formulas[f"{sheet_name}!{cell}"] = entry["formula"]
+        return cls(formulas, all_tables, all_constants)
+
+    @staticmethod
+    def _canonical(name: str) -> str:
+        return cell_key(*parse_cell(name))
+
+    @property
+    def cells(self) -> List[str]:
+        """Formula cells that compiled."""
+        return list(self._evaluators)
+
+    @property
+    def inputs(self) -> List[str]:
+        """Non-formula cells read by any compiled formula, sorted."""
+        return sorted(set().union(*self._dependencies.values()) - self._evaluators.keys())
+
+    def dependencies(self, cell: str) -> Set[str]:
+        """Cells a formula cell reads directly."""
+        return set(self._dependencies.get(self._canonical(cell), ()))
+
+    def plan(self, outputs: Iterable[str], given: Iterable[str] = ()) -> List[str]:
+        """Formula cells to evaluate for some outputs, in dependency order.
+
+        Args:
+            outputs: Cells wanted.
+            given: Cells whose values are supplied, so their formulas and
+                what only they depend on are not evaluated.
+
+        Raises:
+            FormulaError: A needed formula did not compile or is part of a
+                circular reference.
+        """
+        outputs = tuple(self._canonical(cell) for cell in outputs)
+        given = frozenset(cell for cell in map(self._canonical, given) if cell in self._evaluators)
+        cache_key = (outputs, given)
+        order = self._plans.get(cache_key)
+        if order is not None:
+            return order
+
+        graph: Dict[str, Set[str]] = {}
+        pending = [cell for cell in outputs if cell not in given]
+        while pending:
+            cell = pending.pop()
+            if cell in graph or cell in given:
+                continue
+            if cell in self.errors:
+                raise FormulaError(f"{cell} is needed but did not compile: {self.errors[cell]}")
+            if cell not in self._evaluators:
+                continue
+            graph[cell] = {dependency for dependency in self._dependencies[cell]
+                           if dependency in self._evaluators and dependency not in given}
+            pending.extend(graph[cell])
+            pending.extend(dependency for dependency in self._dependencies[cell]
+                           if dependency in self.errors and dependency not in given)
+
+        try:
+            order = list(TopologicalSorter(graph).static_order())
+        except CycleError as e:
+            raise FormulaError(f"Circular reference: {' -> '.join(e.args[1])}")
+        self._plans[cache_key] = order
+        return order
+
+    def inputs_for(self, outputs: Iterable[str]) -> List[str]:
+        """Non-formula cells that some outputs depend on, sorted."""
+        inputs = set()
+        for cell in self.plan(outputs):
+            inputs.update(dependency for dependency in self._dependencies[cell] if dependency not in self._evaluators)
+        inputs.update(self._canonical(cell) for cell in outputs if self._canonical(cell) not in self._evaluators)
+        return sorted(inputs)
+
+    def evaluate(self, inputs: Dict[str, Any], outputs: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Evaluate output cells for many input rows at once.
+
+        Args:
+            inputs: Cell name -> value, or a sequence of one value per row.
+                Inputs given for formula cells replace their formulas.
+            outputs: Cells to return.
+
+        Returns:
+            Cell name, as given in ``outputs`` -> array of one value per row.
+        """
+        outputs = list(outputs)
+        values = dict(self.constants)
+        values.update({self._canonical(cell): _as_array(value) for cell, value in inputs.items()})
+
+        lengths = {len(value) for value in values.values() if len(value) != 1}
+        if len(lengths) > 1:
+            raise ValueError(f"Inputs have different row counts: {sorted(lengths)}")
+        size = lengths.pop() if lengths else 1
+
+        for cell in self.plan(outputs, given=values.keys()):
+            values[cell] = self._evaluators[cell](values)
+
+        return {
+            cell: np.broadcast_to(values.get(self._canonical(cell), BLANK), size).copy()
+            for cell in outputs
+        }
+
+    def _compile(self, tree: tuple) -> Tuple[Evaluator, Set[str]]:
+        """Compile a syntax tree into an evaluator and the cells it reads."""
+        kind = tree[0]
+
+        if kind == "const":
+            value = _as_array(tree[1])
+            return (lambda values: value), set()
+
+        if kind == "cell":
+            key = tree[1]
+            return (lambda values: values.get(key, BLANK)), {key}
+
+        if kind == "range":
+            return self._compile_range(*tree[1:])
+
+        if kind == "table":
+            return self._compile_table(tree[1], tree[2])
+
+        if kind == "neg":
+            operand, dependencies = self._compile(tree[1])
+            return (lambda values: -_number(operand(values))), dependencies
+
+        if kind == "op":
+            op = tree[1]
+            left, left_dependencies = self._compile(tree[2])
+            right, right_dependencies = self._compile(tree[3])
+            return (lambda values: _arithmetic(op, left(values), right(values))), left_dependencies | right_dependencies
+
+        name, compiled = tree[1], [self._compile(arg) for arg in tree[2]]
+        evaluators = [evaluator for evaluator, _ in compiled]
+        dependencies = set().union(*(deps for _, deps in compiled)) if compiled else set()
+        # Fail at compile time rather than per evaluation
+        if name not in _FUNCTIONS:
+            raise FormulaError(f"Unsupported function {name}")
+        return (lambda values: _call(name, [evaluator(values) for evaluator in evaluators])), dependencies
+
+    def _compile_range(self, sheet: str, first_row: int, first_col: int, last_row: int, last_col: int) -> Tuple[Evaluator, Set[str]]:
+        keys = [[cell_key(sheet, row, col) for col in range(first_col, last_col + 1)]
+                for row in range(first_row, last_row + 1)]
+        # Not a cell name, so it can hold the grid once built for an evaluation
+        range_key = f"{keys[0][0]}:{keys[-1][-1]}"
+
+        def evaluate(values: Dict[str, np.ndarray]) -> np.ndarray:
+            grid = values.get(range_key)
+            if grid is not None:
+                return grid
+            cells = [[values.get(key, BLANK) for key in row] for row in keys]
+            depth = max(len(cell) for row in cells for cell in row)
+            numeric = all(_is_numeric(cell) for row in cells for cell in row)
+            grid = np.empty((len(keys), len(keys[0]), depth), dtype=np.float64 if numeric else object)
+            for i, row in enumerate(cells):
+                for j, cell in enumerate(row):
+                    grid[i, j, :] = cell
+            values[range_key] = grid
+            return grid
+
+        return evaluate, {key for row in keys for key in row}
+
+    def _compile_table(self, name: str, spec: str) -> Tuple[Evaluator, Set[str]]:
+        """Compile a structured reference such as ``Table[[#Headers],[A]:[B]]``."""
+        table = self.tables.get(name.lower())
+        if table is None:
+            raise FormulaError(f"Unknown table {name!r}")
+
+        area, columns = "data", (0, len(table.columns) - 1)
+        items = re.findall(r"\[([^\[\]]*)\]", spec) if "[" in spec else ([spec] if spec.strip() else [])
+        named = [item for item in items if not item.startswith("#")]
+        for item in items:
+            if item.startswith("#"):
+                area = item[1:].strip().lower()
+        if named:
+            columns = (table.column(named[0]), table.column(named[-1]))
+        if area not in ("data", "headers", "all"):
+            raise FormulaError(f"Unsupported structured reference {name}[{spec}]")
+
+        first, last = columns
+        headers = np.array(table.columns[first:last + 1], dtype=object).reshape(1, -1, 1)
+        if area == "headers":
+            return (lambda values: headers), set()
+
+        if table.rows is not None:
+            data = np.array([[row[col] if col < len(row) else None for col in range(first, last + 1)]
+                             for row in table.rows], dtype=object)
+            data = data.reshape(len(table.rows), last - first + 1, 1)
+            if all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in data.ravel()):
+                data = data.astype(np.float64)
+            if area == "all":
+                data = np.concatenate([headers, data.astype(object)])
+            return (lambda values: data), set()
+
+        if area == "all":
+            raise FormulaError(f"Unsupported structured reference {name}[{spec}] on a sheet table")
+        first_row_col = re.fullmatch(rf"{_CELL}:{_CELL}", table.data_range.replace("$", ""))
+        if first_row_col is None:
+            raise FormulaError(f"Bad data range {table.data_range!r} for table {name!r}")
+        start_col, start_row, _, end_row = first_row_col.groups()
+        start_col = column_index_from_string(start_col.upper())
+        return self._compile_range(table.sheet, int(start_row), start_col + first, int(end_row), start_col + last)
+
+
+_FUNCTIONS = {
+    "IF", "IFERROR", "AND", "OR", "NOT", "ROUND", "ROUNDUP", "ROUNDDOWN", "CEILING", "FLOOR",
+    "LOG10", "LN", "SQRT", "EXP", "ABS", "INT", "LOG", "POWER", "PI", "SUM", "MIN", "MAX",
+    "AVERAGE", "MATCH", "INDEX", "VLOOKUP",
+}
@@ -0,0 +1,123 @@
+"""
+Dataset version manifest.
+Records the available dataset versions and the default-version pointers so they can be resolved without scanning.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_FORMAT = 1
+
+
+def empty_manifest() -> Dict[str, Any]:
+    """Manifest with no versions."""
+    return {"format": MANIFEST_FORMAT, "latest": None, "active": None, "versions": {}}
+
+
+def manifest_entry(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Manifest entry for a dataset, from its metadata."""
+    return {
+        "workbook_name": metadata.get("workbook_name"),
+        "workbook_hash": metadata.get("workbook_hash"),
+        "extraction_timestamp": str(metadata.get("extraction_timestamp")),
+        "total_tables": metadata.get("total_tables"),
+    }
+
+
+def read_manifest(dataset_dir: Union[str, Path]) -> Dict[str, Any]:
+    """Read the manifest of a dataset directory.
+
+    Raises:
+        FileNotFoundError: If there is no manifest.
+        ValueError: If the manifest is not valid.
+    """
+    path = Path(dataset_dir) / MANIFEST_FILENAME
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("versions"), dict):
+        raise ValueError(f"Invalid dataset manifest {path}")
+    return manifest
+
+
+def write_manifest(dataset_dir: Union[str, Path], manifest: Dict[str, Any]) -> Path:
+    """Write a manifest atomically, recomputing its latest pointer.
+
+    The file is written beside the target and renamed over it, so readers
+    never see a partial manifest.
+    """
+    path = Path(dataset_dir) / MANIFEST_FILENAME
+    manifest["format"] = MANIFEST_FORMAT
+    manifest["latest"] = max(manifest["versions"]) if manifest["versions"] else None
+    if manifest.get("active") not in manifest["versions"]:
+        manifest["active"] = None
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def register_version(dataset_dir: Union[str, Path], version: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Add or update a version in a directory's manifest.
+
+    Returns:
+        The updated manifest.
+    """
+    try:
+        manifest = read_manifest(dataset_dir)
+    except (FileNotFoundError, ValueError):
+        manifest = scan_manifest(dataset_dir)
+
+    manifest["versions"][version] = manifest_entry(metadata)
+    write_manifest(dataset_dir, manifest)
+    logger.info(f"Registered dataset {version} in manifest")
+    return manifest
+
+
+def scan_manifest(dataset_dir: Union[str, Path], known: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build a manifest by scanning a dataset directory.
+
+    Args:
+        dataset_dir: Directory containing one folder per version.
+        known: Existing manifest whose entries are reused for versions
+            still present, so only new versions are read.
+
+    Returns:
+        The manifest; not written.
+    """
+    dataset_dir = Path(dataset_dir)
+    manifest = empty_manifest()
+    known_versions = (known or {}).get("versions", {})
+    manifest["active"] = (known or {}).get("active")
+
+    if not dataset_dir.exists():
+        return manifest
+
+    for item in dataset_dir.iterdir():
+        dataset_path = item / "dataset.json"
+        if not item.is_dir() or not dataset_path.exists():
+            continue
+
+        entry = known_versions.get(item.name)
+        if entry is None:
+            try:
+                with open(dataset_path, 'r', encoding='utf-8') as f:
+                    entry = manifest_entry(json.load(f).get("metadata", {}))
+            except Exception as e:
+                logger.warning(f"Could not read metadata for dataset {item.name}: {e}")
+                entry = manifest_entry({})
+        manifest["versions"][item.name] = entry
+
+    versions = manifest["versions"]
+    manifest["latest"] = max(versions) if versions else None
+    if manifest["active"] not in versions:
+        manifest["active"] = None
+    return manifest
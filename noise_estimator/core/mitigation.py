@@ -0,0 +1,138 @@
+"""
+Compiled mitigation-measure rules.
+Turns measure trigger conditions into bitmasks so selection is a set intersection.
+"""
+
+from enum import Enum
+from typing import Any, Dict, List, Sequence, Tuple
+import logging
+
+from ..models.schemas import MitigationMeasure, ImpactBand
+
+logger = logging.getLogger(__name__)
+
+
+def _rule_value(value: Any) -> Any:
+    """Normalize a condition or input value for hashed comparison.
+
+    String/number enums compare equal to their values but hash by name, so
+    they are reduced to their values before being used as keys.
+    """
+    if isinstance(value, Enum) and isinstance(value, (str, int, float)):
+        return value.value
+    return value
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class MitigationRuleIndex:
+    """Trigger conditions of a set of measures compiled into bitmasks.
+
+    Bit ``i`` of every mask stands for ``measures[i]``. A measure is selected
+    when its impact band condition admits the band and, for every other
+    condition key present in the inputs, the input equals the condition
+    value. Condition keys missing from the inputs are ignored.
+    """
+
+    def __init__(self, measures: Sequence[MitigationMeasure]):
+        """Compile the rules.
+
+        Args:
+            measures: Measures in table order.
+        """
+        self.measures: Tuple[MitigationMeasure, ...] = tuple(measures)
+
+        self._all = (1 << len(self.measures)) - 1
+        self._standard = 0
+        self._band_masks: Dict[ImpactBand, int] = {band: 0 for band in ImpactBand}
+        # Condition key -> measures that have the key
+        self._key_masks: Dict[str, int] = {}
+        # Condition key -> condition value -> measures requiring that value
+        self._value_masks: Dict[str, Dict[Any, int]] = {}
+        # Condition key -> [(bit, value)] for values that cannot be hashed
+        self._unhashable: Dict[str, List[Tuple[int, Any]]] = {}
+
+        for i, measure in enumerate(self.measures):
+            bit = 1 << i
+            if measure.type == "standard":
+                self._standard |= bit
+
+            conditions = measure.trigger_conditions
+            for band in ImpactBand:
+                if self._admits_band(conditions, band):
+                    self._band_masks[band] |= bit
+
+            for key, value in conditions.items():
+                self._key_masks[key] = self._key_masks.get(key, 0) | bit
+                value = _rule_value(value)
+                if _is_hashable(value):
+                    values = self._value_masks.setdefault(key, {})
+                    values[value] = values.get(value, 0) | bit
+                else:
+                    self._unhashable.setdefault(key, []).append((bit, value))
+
+    @staticmethod
+    def _admits_band(conditions: Dict[str, Any], impact_band: ImpactBand) -> bool:
+        if "impact_band" not in conditions:
+            return True
+        required_bands = conditions["impact_band"]
+        if isinstance(required_bands, str):
+            required_bands = [required_bands]
+        return impact_band.value in required_bands
+
+    def _matching(self, key: str, value: Any) -> int:
+        """Measures with condition ``key`` whose value equals ``value``."""
+        value = _rule_value(value)
+        if _is_hashable(value):
+            mask = self._value_masks.get(key, {}).get(value, 0)
+        else:
+            mask = 0
+            for condition_value, bits in self._value_masks.get(key, {}).items():
+                if not value != condition_value:
+                    mask |= bits
+        for bit, condition_value in self._unhashable.get(key, ()):
+            if not value != condition_value:
+                mask |= bit
+        return mask
+
+    def select_mask(self, impact_band: ImpactBand, inputs: Dict[str, Any]) -> int:
+        """Bitmask of measures applicable to an impact band and inputs."""
+        mask = self._band_masks.get(impact_band, 0)
+        for key, key_mask in self._key_masks.items():
+            if not mask:
+                break
+            if key in inputs:
+                # Measures without the key pass; those with it must match
+                mask &= (self._all & ~key_mask) | self._matching(key, inputs[key])
+        return mask
+
+    def measures_for_mask(self, mask: int) -> List[MitigationMeasure]:
+        """Measures whose bits are set, in table order."""
+        measures = []
+        while mask:
+            low = mask & -mask
+            measures.append(self.measures[low.bit_length() - 1])
+            mask ^= low
+        return measures
+
+    def select(self, impact_band: ImpactBand, inputs: Dict[str, Any]) -> Tuple[List[MitigationMeasure], List[MitigationMeasure]]:
+        """Select applicable measures.
+
+        Args:
+            impact_band: Impact band of the result.
+            inputs: Resolved calculation inputs.
+
+        Returns:
+            Tuple of (standard measures, additional measures) in table order.
+        """
+        mask = self.select_mask(impact_band, inputs)
+        return (
+            self.measures_for_mask(mask & self._standard),
+            self.measures_for_mask(mask & ~self._standard),
+        )
@@ -0,0 +1,366 @@
+"""
+Compiled Concawe propagation tables.
+Turns the raw distance -> attenuation mapping into NumPy arrays for fast lookups.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+import hashlib
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Workbook propagation settings mapped onto Concawe table columns.
+# Anything not listed falls back to the rural column, as in the workbook.
+CONCAWE_PROPAGATION_KEYS = {
+    "Water": "hard",
+    "Developed settlements (urban and suburban areas)": "urban",
+    "Rural": "rural",
+}
+DEFAULT_PROPAGATION_KEY = "rural"
+
+# Lookup modes: snap to the nearest whole-metre table row, as the workbook
+# does, or interpolate linearly in log-distance between rows
+NEAREST = "nearest"
+INTERPOLATED = "interpolated"
+PROPAGATION_MODES = (NEAREST, INTERPOLATED)
+
+# The measured table only reaches ~100 m; it is continued to this distance
+# (metres), with the ground term fitted over this far share of the table
+EXTENDED_MAX_DISTANCE = 5000
+GROUND_FIT_FRACTION = 0.5
+
+
+def resolve_propagation_key(propagation_type: Any) -> str:
+    """Map a propagation type onto the Concawe table column it uses."""
+    return CONCAWE_PROPAGATION_KEYS.get(propagation_type, DEFAULT_PROPAGATION_KEY)
+
+
+def check_propagation_mode(mode: str) -> str:
+    """Validate a lookup mode name."""
+    if mode not in PROPAGATION_MODES:
+        raise ValueError(f"Unknown propagation mode {mode!r}; expected one of {', '.join(PROPAGATION_MODES)}")
+    return mode
+
+
+class PropagationTable:
+    """Concawe attenuation table compiled into NumPy arrays.
+
+    Distances are held in a sorted integer array and attenuations in a
+    (distance x propagation key) matrix, so lookups are a ``searchsorted``
+    instead of a sort and linear scan per call. Lookups either snap to the
+    nearest row or interpolate in log-distance between rows; past the last
+    row the attenuation stays at its value there, as in the workbook, unless
+    the table was continued with ``extended``.
+    """
+
+    def __init__(self, distances: np.ndarray, keys: List[str], attenuation: np.ndarray, source: Optional[str] = None,
+                 measured_max_distance: Optional[int] = None, ground_terms: Optional[np.ndarray] = None):
+        """Initialize table from pre-built arrays.
+
+        Args:
+            distances: Sorted table distances in metres.
+            keys: Propagation keys, one per attenuation column.
+            attenuation: Attenuation matrix of shape (len(distances), len(keys)).
+            source: Description of where the table was compiled from.
+            measured_max_distance: Last distance of the measured data, when
+                the table was extended beyond it.
+            ground_terms: Ground term (dB per decade of distance) of each
+                column used for the extension.
+        """
+        self.distances = distances
+        self.keys = list(keys)
+        self.attenuation = attenuation
+        self.source = source
+        self.measured_max_distance = int(distances[-1]) if measured_max_distance is None else measured_max_distance
+        self.ground_terms = ground_terms
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+        self._curve_cache: Dict[Tuple[str, float, float], Tuple[int, int, np.ndarray]] = {}
+        self._interpolation_cache: Dict[Tuple[str, float, float], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._extended_cache: Dict[int, "PropagationTable"] = {}
+        self._fingerprint: Optional[str] = None
+
+        # Log-distance interpolation runs over the rows beyond 0 m
+        self._first_positive = int(np.searchsorted(distances, 0, side="right"))
+        self._log_distances = np.log10(distances[self._first_positive:].astype(np.float64))
+
+        # Tables are shared between requests, so guard against accidental mutation
+        self.distances.setflags(write=False)
+        self.attenuation.setflags(write=False)
+        self._log_distances.setflags(write=False)
+
+    @classmethod
+    def from_concawe_data(cls, concawe_data: Dict[str, Any], source: Optional[str] = None,
+                          extend_to: Optional[float] = None) -> Optional["PropagationTable"]:
+        """Compile a table from the ``concawe_attenuation`` mapping.
+
+        Args:
+            concawe_data: Mapping of distance -> {propagation key: attenuation}.
+            source: Description of where the data came from.
+            extend_to: Continue the table to this distance; see ``extended``.
+
+        Returns:
+            Compiled table, or None if the mapping holds no distances.
+        """
+        rows: Dict[int, Dict[str, Any]] = {}
+        for distance, values in concawe_data.items():
+            if distance is None:
+                continue
+            rows[int(distance)] = values if isinstance(values, dict) else {}
+
+        if not rows:
+            return None
+
+        distances = np.array(sorted(rows), dtype=np.int64)
+        keys: List[str] = []
+        for values in rows.values():
+            for key in values:
+                if key not in keys:
+                    keys.append(key)
+
+        # Missing entries read as 0 dB, matching the original dict lookups
+        attenuation = np.zeros((len(distances), len(keys)), dtype=np.float64)
+        for i, distance in enumerate(distances):
+            values = rows[int(distance)]
+            for j, key in enumerate(keys):
+                value = values.get(key, 0)
+                attenuation[i, j] = float(value) if value is not None else 0.0
+
+        table = cls(distances, keys, attenuation, source)
+        return table.extended(extend_to) if extend_to is not None else table
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    @property
+    def max_distance(self) -> int:
+        """Last table distance in metres."""
+        return int(self.distances[-1])
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the table contents, computed once.
+
+        Tables are read-only, so this identifies the attenuation a result
+        was calculated with, e.g. across recompiles of a republished file.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            digest.update(",".join(self.keys).encode("utf-8"))
+            digest.update(np.ascontiguousarray(self.distances, dtype=np.int64).tobytes())
+            digest.update(np.ascontiguousarray(self.attenuation, dtype=np.float64).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def extended(self, max_distance: float = EXTENDED_MAX_DISTANCE) -> "PropagationTable":
+        """Continue the table to a longer distance.
+
+        Past the last measured row, attenuation falls with geometric
+        spreading (20 dB per decade of distance) plus a ground term per
+        column, fitted in log-distance over the far end of the measured
+        rows. The continuation is precomputed at whole metres, so both
+        lookup modes and the inversion work on it unchanged. Each extension
+        is built once per table and reused.
+
+        Returns:
+            Extended table, or this table if it already reaches
+            ``max_distance`` or has too few rows to fit.
+        """
+        end = int(math.ceil(max_distance))
+        table = self._extended_cache.get(end)
+        if table is None:
+            table = self._extended_cache.setdefault(end, self._extend(end))
+        return table
+
+    def _extend(self, end: int) -> "PropagationTable":
+        last = self.max_distance
+        fit = (self.distances > 0) & (self.distances >= last * (1 - GROUND_FIT_FRACTION))
+        if end <= last or last <= 0 or np.count_nonzero(fit) < 2:
+            return self
+
+        slopes = np.polyfit(np.log10(self.distances[fit].astype(np.float64)), self.attenuation[fit], 1)[0]
+        # The received level never rises with distance
+        slopes = np.minimum(slopes, 0.0)
+        ground_terms = slopes + 20.0
+
+        extra = np.arange(last + 1, end + 1, dtype=self.distances.dtype)
+        decades = np.log10(extra / last)[:, np.newaxis]
+        continuation = self.attenuation[-1] + (ground_terms - 20.0) * decades
+
+        ground_terms.setflags(write=False)
+        return PropagationTable(
+            np.concatenate([self.distances, extra]), self.keys,
+            np.vstack([self.attenuation, continuation]), self.source,
+            measured_max_distance=last, ground_terms=ground_terms
+        )
+
+    def nearest_index(self, distances: Union[float, np.ndarray]) -> np.ndarray:
+        """Index of the nearest table distance for each requested distance.
+
+        Distances are rounded to whole metres first (round-half-even, like the
+        built-in ``round``). Ties between two table rows go to the shorter
+        distance.
+        """
+        rounded = np.round(np.asarray(distances, dtype=np.float64))
+        table = self.distances
+
+        upper = np.clip(np.searchsorted(table, rounded, side="left"), 0, len(table) - 1)
+        lower = np.clip(upper - 1, 0, len(table) - 1)
+        use_lower = np.abs(rounded - table[lower]) <= np.abs(table[upper] - rounded)
+        return np.where(use_lower, lower, upper)
+
+    def lookup(self, distances: Union[float, np.ndarray], propagation_type: Any,
+               mode: str = NEAREST) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up attenuation for one or more distances.
+
+        Args:
+            distances: Distance or array of distances in metres.
+            propagation_type: Propagation type or workbook setting name.
+            mode: ``"nearest"`` table row, or ``"interpolated"`` between rows.
+
+        Returns:
+            Tuple of (table distances used, attenuation values). Interpolated
+            lookups use the distances themselves, limited to the table.
+        """
+        column = self._key_index.get(resolve_propagation_key(propagation_type))
+        if check_propagation_mode(mode) == INTERPOLATED:
+            distances = np.asarray(distances, dtype=np.float64)
+            if column is None or self._first_positive == len(self):
+                attenuation = np.zeros(distances.shape, dtype=np.float64)
+            else:
+                attenuation = self._interpolate(distances, column)
+            low = self.distances[min(self._first_positive, len(self) - 1)]
+            return np.clip(distances, low, self.distances[-1]), attenuation
+
+        index = self.nearest_index(distances)
+        if column is None:
+            attenuation = np.zeros(index.shape, dtype=np.float64)
+        else:
+            attenuation = self.attenuation[index, column]
+        return self.distances[index], attenuation
+
+    def _interpolate(self, distances: np.ndarray, column: int) -> np.ndarray:
+        """Attenuation interpolated linearly in log10 distance.
+
+        Distances short of the first row beyond 0 m take its value.
+        """
+        first = self._first_positive
+        log_distances = np.log10(np.maximum(distances, self.distances[first]))
+        return np.interp(log_distances, self._log_distances, self.attenuation[first:, column])
+
+    def attenuation_curve(self, propagation_type: Any, min_distance: float, max_distance: float) -> Tuple[int, int, np.ndarray]:
+        """Monotone attenuation curve used to invert the table.
+
+        Returns:
+            Tuple of (index of ``min_distance``, index of ``max_distance``,
+            running minimum of attenuation from ``min_distance`` onwards).
+        """
+        cache_key = (resolve_propagation_key(propagation_type), float(min_distance), float(max_distance))
+        curve = self._curve_cache.get(cache_key)
+        if curve is None:
+            start, stop = (int(i) for i in self.nearest_index(np.array([min_distance, max_distance])))
+            _, attenuation = self.lookup(self.distances[start:stop + 1], propagation_type)
+            running_min = np.minimum.accumulate(attenuation)
+            running_min.setflags(write=False)
+            curve = (start, stop, running_min)
+            self._curve_cache[cache_key] = curve
+        return curve
+
+    def interpolation_curve(self, propagation_type: Any, min_distance: float,
+                            max_distance: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Piecewise log-linear attenuation curve used to invert interpolated lookups.
+
+        Returns:
+            Tuple of (log10 of the curve's distances: ``min_distance``, the
+            table rows between, ``max_distance``; attenuation at each;
+            running minimum of that attenuation).
+        """
+        cache_key = (resolve_propagation_key(propagation_type), float(min_distance), float(max_distance))
+        curve = self._interpolation_cache.get(cache_key)
+        if curve is None:
+            inner = self.distances[(self.distances > min_distance) & (self.distances < max_distance)]
+            points = np.concatenate([[min_distance], inner, [max_distance]]).astype(np.float64)
+            _, attenuation = self.lookup(points, propagation_type, INTERPOLATED)
+            running_min = np.minimum.accumulate(attenuation)
+            curve = (np.log10(points), attenuation, running_min)
+            for array in curve:
+                array.setflags(write=False)
+            self._interpolation_cache[cache_key] = curve
+        return curve
+
+    def invert(self, source_level: float, target_levels: Union[float, np.ndarray], propagation_type: Any,
+               min_distance: float = 1.0, max_distance: float = 1000.0, barrier_adjustment: float = 0.0,
+               mode: str = NEAREST) -> np.ndarray:
+        """Find the distance at which the received level drops to each target.
+
+        With nearest-row lookups the received level is a step function of
+        distance, so the answer is the exact edge of the first table step at
+        or below the target; interpolated, it is piecewise linear in
+        log-distance and the crossing is solved within its segment. Either
+        way it is a binary search over a cached curve rather than an
+        iterative root-find, so long search ranges stay cheap.
+
+        Args:
+            source_level: Sound power level in dB.
+            target_levels: Target received level(s) in dB.
+            propagation_type: Propagation type or workbook setting name.
+            min_distance: Shortest distance considered, returned when the
+                target is already met there.
+            max_distance: Longest distance considered.
+            barrier_adjustment: Barrier adjustment in dB.
+            mode: Lookup mode the distances must agree with.
+    
+        Returns:
+            Array of distances in metres, NaN where the target is not met
+            within ``max_distance``.
+        """
+        targets = np.asarray(target_levels, dtype=np.float64)
+        if check_propagation_mode(mode) == INTERPOLATED:
+            return self._invert_interpolated(source_level, targets, propagation_type,
+                                             min_distance, max_distance, barrier_adjustment)
+        start, stop, curve = self.attenuation_curve(propagation_type, min_distance, max_distance)
+        _, (attenuation_at_min, attenuation_at_max) = self.lookup(
+            np.array([min_distance, max_distance]), propagation_type
+        )
+
+        # Same arithmetic as the forward path, so boundaries agree exactly
+        level_at_min = source_level - 110 + attenuation_at_min + barrier_adjustment
+        level_at_max = source_level - 110 + attenuation_at_max + barrier_adjustment
+        curve_levels = source_level - 110 + curve + barrier_adjustment
+        met_at_min = level_at_min <= targets
+        unreachable = level_at_max > targets
+
+        # First step whose level is at or below the target
+        step = start + np.searchsorted(-curve_levels, -targets, side="left")
+        step = np.clip(step, start + 1, stop)
+
+        # Distances snap to the nearest whole metre and then the nearest table
+        # row (ties to the shorter row), so a step starts half a metre below
+        # the first whole metre that snaps onto it.
+        midpoint = (self.distances[step - 1] + self.distances[step]) / 2
+        edge = np.floor(midpoint) + 0.5
+
+        result = np.where(met_at_min, min_distance, edge)
+        return np.where(~met_at_min & unreachable, np.nan, result)
+
+    def _invert_interpolated(self, source_level: float, targets: np.ndarray, propagation_type: Any,
+                             min_distance: float, max_distance: float, barrier_adjustment: float) -> np.ndarray:
+        log_points, attenuation, running_min = self.interpolation_curve(propagation_type, min_distance, max_distance)
+
+        # Same arithmetic as the forward path, so boundaries agree exactly
+        levels = source_level - 110 + attenuation + barrier_adjustment
+        curve_levels = source_level - 110 + running_min + barrier_adjustment
+        met_at_min = curve_levels[0] <= targets
+        unreachable = curve_levels[-1] > targets
+
+        # First curve point at or below the target; the one before is above it
+        step = np.clip(np.searchsorted(-curve_levels, -targets, side="left"), 1, len(levels) - 1)
+        above, below = levels[step - 1], levels[step]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.clip((above - targets) / (above - below), 0.0, 1.0)
+        log_distance = log_points[step - 1] + fraction * (log_points[step] - log_points[step - 1])
+
+        result = np.where(met_at_min, min_distance, 10 ** log_distance)
+        return np.where(~met_at_min & unreachable, np.nan, result)
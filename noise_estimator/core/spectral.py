@@ -0,0 +1,100 @@
+"""
+Octave-band spectral propagation.
+Applies propagation and barrier terms per octave band, then A-weights and
+energy-sums the bands into a single level.
+"""
+
+from typing import Sequence, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Octave band centre frequencies (Hz) carried by spectral sound power levels
+OCTAVE_BANDS = (63, 125, 250, 500, 1000, 2000, 4000, 8000)
+
+# A-weighting at each band centre, IEC 61672-1
+A_WEIGHTING = np.array([-26.2, -16.1, -8.6, -3.2, 0.0, 1.2, 1.0, -1.1])
+A_WEIGHTING.setflags(write=False)
+
+# Atmospheric absorption at each band (dB/km), ISO 9613-1 at 10 degC and 70 % humidity
+BAND_AIR_ABSORPTION = np.array([0.1, 0.4, 1.0, 1.9, 3.7, 9.7, 32.8, 117.0])
+BAND_AIR_ABSORPTION.setflags(write=False)
+
+# Broadband attenuation tables and barrier adjustments stand for this band
+REFERENCE_BAND = 500
+
+# Barrier insertion loss per band relative to the reference band, from
+# Maekawa's 10 log10(3 + 20 N) with a Fresnel number of 1 at 500 Hz
+BARRIER_BAND_FACTORS = 10 * np.log10(3 + 20 * np.array(OCTAVE_BANDS) / REFERENCE_BAND) / (10 * np.log10(23))
+BARRIER_BAND_FACTORS.setflags(write=False)
+MAX_BARRIER_ATTENUATION = 20.0
+
+
+def check_band_levels(levels: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+    """Validate octave-band levels, one per band in ``OCTAVE_BANDS`` on the last axis.
+
+    Returns:
+        Levels as a float array.
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    if levels.ndim == 0 or levels.shape[-1] != len(OCTAVE_BANDS):
+        raise ValueError(f"Expected {len(OCTAVE_BANDS)} octave-band levels (63 Hz to 8 kHz), got shape {levels.shape}")
+    return levels
+
+
+def a_weighted_level(band_levels: np.ndarray) -> np.ndarray:
+    """Energy sum of A-weighted bands over the last axis, in dB(A)."""
+    band_levels = check_band_levels(band_levels)
+    return 10 * np.log10(np.sum(10 ** ((band_levels + A_WEIGHTING) / 10), axis=-1))
+
+
+def band_air_correction(distances: np.ndarray) -> np.ndarray:
+    """Per-band air absorption relative to the reference band.
+
+    Broadband tables already hold the reference band's absorption, so
+    only the difference is applied: higher bands lose more, lower less.
+
+    Returns:
+        Correction in dB with a trailing band axis; add to band levels.
+    """
+    reference = BAND_AIR_ABSORPTION[OCTAVE_BANDS.index(REFERENCE_BAND)]
+    distances = np.asarray(distances, dtype=np.float64)
+    return -(BAND_AIR_ABSORPTION - reference) * distances[..., np.newaxis] / 1000
+
+
+def band_barrier_adjustment(barrier_adjustment: Union[float, np.ndarray]) -> np.ndarray:
+    """Spread a broadband barrier adjustment over the bands.
+
+    Low bands diffract round the barrier more readily than high ones, so
+    the adjustment is scaled per band and capped at
+    ``MAX_BARRIER_ATTENUATION``.
+
+    Returns:
+        Adjustment in dB with a trailing band axis.
+    """
+    barrier_adjustment = np.asarray(barrier_adjustment, dtype=np.float64)
+    adjusted = barrier_adjustment[..., np.newaxis] * BARRIER_BAND_FACTORS
+    return np.where(adjusted < 0, np.maximum(adjusted, -MAX_BARRIER_ATTENUATION), adjusted)
+
+
+def propagate_bands(band_levels: np.ndarray, attenuation: np.ndarray, distances: np.ndarray,
+                    barrier_adjustment: Union[float, np.ndarray] = 0.0) -> np.ndarray:
+    """Received octave-band levels, per band, before A-weighting.
+
+    Args:
+        band_levels: Octave-band sound power levels, bands on the last axis.
+        attenuation: Broadband table attenuation for each distance.
+        distances: Receiver distances in metres, broadcast against
+            ``band_levels`` without its band axis.
+        barrier_adjustment: Broadband barrier adjustment(s) in dB.
+
+    Returns:
+        Received levels in dB, bands on the last axis.
+    """
+    band_levels = check_band_levels(band_levels)
+    attenuation = np.asarray(attenuation, dtype=np.float64)[..., np.newaxis]
+    return (band_levels - 110 + attenuation + band_air_correction(distances)
+            + band_barrier_adjustment(barrier_adjustment))
+
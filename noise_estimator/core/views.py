@@ -0,0 +1,124 @@
+"""
+Indexed, pre-materialized views over loaded datasets.
+Built once per dataset so per-request lookups never re-parse table rows.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+import logging
+import math
+
+from ..models.schemas import (
+    ExtractedDataset,
+    NoiseCategory,
+    Scenario,
+    Plant,
+    MitigationMeasure,
+    TimePeriod,
+)
+
+from .mitigation import MitigationRuleIndex
+
+logger = logging.getLogger(__name__)
+
+# Level used by the workbook when a background row has no level
+DEFAULT_BACKGROUND_ROW_LEVEL = 45.0
+
+# Background levels used when neither the category nor the table has data
+DEFAULT_BACKGROUND_LEVELS = {
+    TimePeriod.DAY: 45.0,
+    TimePeriod.EVENING: 40.0,
+    TimePeriod.NIGHT: 35.0,
+}
+
+# Composite periods and the single periods they span
+COMPOSITE_PERIODS = {
+    TimePeriod.DAY_EVENING: (TimePeriod.DAY, TimePeriod.EVENING),
+    TimePeriod.EVENING_NIGHT: (TimePeriod.EVENING, TimePeriod.NIGHT),
+    TimePeriod.DAY_EVENING_NIGHT: (TimePeriod.DAY, TimePeriod.EVENING, TimePeriod.NIGHT),
+}
+
+
+def energy_average(levels) -> float:
+    """Energy (logarithmic) average of dB levels."""
+    levels = list(levels)
+    return 10 * math.log10(sum(10 ** (level / 10) for level in levels) / len(levels))
+
+
+DEFAULT_BACKGROUND_LEVELS.update({
+    composite: energy_average(DEFAULT_BACKGROUND_LEVELS[period] for period in periods)
+    for composite, periods in COMPOSITE_PERIODS.items()
+})
+
+
+class DatasetView:
+    """Immutable, indexed view of a dataset.
+
+    Holds id -> model maps for every entity table, a (category, time period)
+    background index and the mitigation rule index.
+    Maps are exposed read-only because views are shared between requests.
+    """
+
+    def __init__(self, dataset: ExtractedDataset):
+        """Build the view.
+
+        Args:
+            dataset: Dataset to index.
+        """
+        self.dataset = dataset
+        self.version = dataset.metadata.version
+
+        self.noise_categories: Mapping[str, NoiseCategory] = self._build_models("noise_categories", NoiseCategory)
+        self.scenarios: Mapping[str, Scenario] = self._build_models("scenarios", Scenario)
+        self.plants: Mapping[str, Plant] = self._build_models("plants", Plant)
+        self.mitigation_measures: Mapping[str, MitigationMeasure] = self._build_models("mitigation_measures", MitigationMeasure)
+
+        self.background_levels: Mapping[Tuple[str, str], float] = self._build_background_index()
+        self.mitigation_rules = MitigationRuleIndex(list(self.mitigation_measures.values()))
+
+    def _build_models(self, table_name: str, model_class) -> Mapping[str, Any]:
+        """Build an id -> model map from a table, keeping the last row per id."""
+        rows = self.dataset.tables.get(table_name)
+        if rows is None:
+            logger.warning(f"No {table_name} table found in dataset")
+            return MappingProxyType({})
+
+        models = {}
+        for row in rows:
+            model = model_class(**row)
+            models[model.id] = model
+
+        return MappingProxyType(models)
+
+    def _build_background_index(self) -> Mapping[Tuple[str, str], float]:
+        """Index background levels by (category id, time period), first row wins.
+
+        Composite periods without a row of their own are filled in with the
+        energy average of their single periods, each resolved the same way a
+        request would resolve it (category, then table row, then default).
+        """
+        index: Dict[Tuple[str, str], float] = {}
+
+        for entry in self.dataset.tables.get("background_levels") or []:
+            if not isinstance(entry, dict):
+                continue
+            key = (entry.get("category"), entry.get("time_period"))
+            level = entry.get("level", DEFAULT_BACKGROUND_ROW_LEVEL)
+            if key not in index and level is not None:
+                index[key] = level
+
+        category_ids = set(self.noise_categories) | {category_id for category_id, _ in index}
+        for category_id in category_ids:
+            category = self.noise_categories.get(category_id)
+            for composite, periods in COMPOSITE_PERIODS.items():
+                if (category_id, composite.value) in index:
+                    continue
+                components = []
+                for period in periods:
+                    if category is not None and period in category.time_periods:
+                        components.append(category.time_periods[period])
+                    else:
+                        components.append(index.get((category_id, period.value), DEFAULT_BACKGROUND_LEVELS[period]))
+                index[(category_id, composite.value)] = energy_average(components)
+
+        return MappingProxyType(index)
@@ -0,0 +1,39 @@
+"""
+Process-pool worker entry points.
+Each worker process builds its own calculator once and reuses it for every task.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+from .calculator import NoiseCalculator
+from .dataset import DatasetManager
+from ..models.schemas import EstimationRequest, EstimationResult
+
+# Calculator owned by this worker process
+_worker_calculator: Optional[NoiseCalculator] = None
+
+
+def init_worker(dataset_dir: str, settings: Optional[Dict[str, Any]] = None):
+    """Build the calculator for a worker process.
+
+    Args:
+        dataset_dir: Dataset directory of the parent calculator.
+        settings: The parent calculator's ``NoiseCalculator.settings()``.
+    """
+    global _worker_calculator
+    _worker_calculator = NoiseCalculator(DatasetManager(dataset_dir), **(settings or {}))
+
+
+def calculate_many(calculator: NoiseCalculator, requests: List[EstimationRequest]) -> List[Union[EstimationResult, Exception]]:
+    """Batch-calculate requests, returning failures in place of results."""
+    return list(calculator.calculate_many(requests, return_exceptions=True))
+
+
+def calculate_in_worker(request: EstimationRequest) -> EstimationResult:
+    """Calculate one request in a worker process."""
+    return _worker_calculator.calculate(request)
+
+
+def calculate_many_in_worker(requests: List[EstimationRequest]) -> List[Union[EstimationResult, Exception]]:
+    """Batch-calculate requests in a worker process."""
+    return calculate_many(_worker_calculator, requests)
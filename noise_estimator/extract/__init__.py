@@ -2,6 +2,15 @@
 Dataset extraction module.
 """
 
+from .artifacts import ArtifactContext, ArtifactHandler, default_handlers
 from .dataset_extractor import DatasetExtractor
+from .pipeline import publish_artifacts, run_pipeline
 
-__all__ = ["DatasetExtractor"]
+__all__ = [
+    "ArtifactContext",
+    "ArtifactHandler",
+    "DatasetExtractor",
+    "default_handlers",
+    "publish_artifacts",
+    "run_pipeline",
+]
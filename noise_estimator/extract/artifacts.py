@@ -0,0 +1,314 @@
+"""
+Artifact handlers for the extraction pipeline.
+
+Each handler builds one output file, such as a frontend catalogue or the
+Concawe table the backend loads, from the sheets read in the extractor's
+single pass over the workbook.
+"""
+
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from .catalog import (
+    ASSESSMENT_TYPES,
+    CALCULATION_MODES,
+    DEFAULT_PLANTS,
+    DEFAULT_WORK_TYPES,
+    ENVIRONMENT_APPROACHES,
+    PROPAGATION_TYPES,
+    TIME_PERIODS,
+    TIPS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Where published copies of an artifact go
+FRONTEND = "frontend"
+DATASETS = "datasets"
+
+SCENARIO_SHEET = "Distance Based (Scenario)"
+CONCAWE_SHEET = "conc_scen"
+
+
+class ArtifactContext:
+    """What a handler can see of an extraction."""
+
+    def __init__(self, grids: Dict[str, Any], metadata: Dict[str, Any], tables: Dict[str, Any]):
+        """Initialize context.
+
+        Args:
+            grids: Sheet name -> grid of the cells read from that sheet.
+            metadata: Metadata of the dataset being extracted.
+            tables: Tables extracted into the dataset.
+        """
+        self._grids = grids
+        self.metadata = metadata
+        self.tables = tables
+
+    def grid(self, sheet_name: str) -> Optional[Any]:
+        """Cells read from a sheet, or None if the workbook has no such sheet."""
+        return self._grids.get(sheet_name)
+
+
+class ArtifactHandler:
+    """Builds one artifact file.
+
+    ``sheets`` maps each sheet the handler reads to the last row and column
+    it needs; the extractor reads those cells in the same pass as the
+    dataset tables.
+    """
+
+    name: str = ""
+    filename: str = ""
+    target: str = FRONTEND
+    sheets: Dict[str, Tuple[int, int]] = {}
+
+    def build(self, context: ArtifactContext) -> Optional[Any]:
+        """Build the artifact content.
+
+        Returns:
+            JSON-serializable content, or None if there is nothing to write.
+        """
+        raise NotImplementedError
+
+
+class PlantsArtifact(ArtifactHandler):
+    """Plant catalogue for the frontend wizard."""
+
+    name = "plants"
+    filename = "plants.json"
+
+    def build(self, context: ArtifactContext) -> Optional[Any]:
+        return deepcopy(DEFAULT_PLANTS)
+
+
+class ScenariosArtifact(ArtifactHandler):
+    """Work scenarios for the frontend wizard.
+
+    Scenario rows of the distance-based scenario sheet come first, followed
+    by the built-in work types, without repeating a name.
+    """
+
+    name = "scenarios"
+    filename = "scenarios.json"
+    sheets = {SCENARIO_SHEET: (199, 10)}
+
+    first_row = 10
+    skip_terms = ['noise', 'level', 'dB', 'is there', 'receiver', 'description',
+                  'propagation', 'developed', 'undeveloped', 'residential', 'non-residential',
+                  'classroom', 'hospital', 'commercial', 'industrial']
+    # Columns D-J hold plant sound power levels
+    equipment_columns = {
+        4: 'excavator',
+        5: 'truck',
+        6: 'paver',
+        7: 'roller',
+        8: 'breaker',
+        9: 'saw',
+        10: 'generator'
+    }
+
+    def build(self, context: ArtifactContext) -> Optional[Any]:
+        scenarios = []
+
+        grid = context.grid(SCENARIO_SHEET)
+        if grid is not None:
+            last_row = min(grid.max_row, self.sheets[SCENARIO_SHEET][0])
+            for row in range(self.first_row, last_row + 1):
+                scenario = self._scenario(grid, row)
+                if scenario is not None:
+                    scenarios.append(scenario)
+
+        scenarios.extend(deepcopy(DEFAULT_WORK_TYPES))
+
+        # Remove duplicates based on name
+        seen = set()
+        unique_scenarios = []
+        for scenario in scenarios:
+            key = scenario['name'].lower()
+            if key not in seen:
+                seen.add(key)
+                unique_scenarios.append(scenario)
+
+        return unique_scenarios
+
+    def _scenario(self, grid, row: int) -> Optional[Dict[str, Any]]:
+        """Scenario described by a sheet row, if it is one."""
+        value = grid.value(row, 2)
+        if not value or not isinstance(value, str):
+            return None
+
+        value = value.strip()
+        if any(term in value.lower() for term in self.skip_terms):
+            return None
+        if len(value) <= 3 or value.startswith(('(', '-', '•')):
+            return None
+
+        description = grid.value(row, 3)
+        description = description.strip() if description and isinstance(description, str) else ''
+
+        sound_levels = {}
+        for col, equipment in self.equipment_columns.items():
+            level = grid.value(row, col)
+            # Reasonable sound power range
+            if isinstance(level, (int, float)) and 50 < level < 150:
+                sound_levels[equipment] = level
+
+        if not sound_levels and len(value) <= 5:
+            return None
+
+        scenario_id = value.lower().replace(' ', '_').replace('-', '_').replace('/', '_')
+        scenario_id = ''.join(c for c in scenario_id if c.isalnum() or c == '_')
+
+        return {
+            'id': scenario_id,
+            'name': value,
+            'description': description or f'{value} - Construction activity',
+            'sound_power_levels': sound_levels or {'excavator': 105.0},  # Default if not found
+            'propagation_type': 'rural'  # Default
+        }
+
+
+class WizardDataArtifact(ArtifactHandler):
+    """Definitions and guidance text for the frontend wizard."""
+
+    name = "wizard_data"
+    filename = "wizard-data.json"
+    sheets = {
+        'Doc control & definitions': (49, 3),
+        'Representative Noise Environ.': (49, 3),
+        SCENARIO_SHEET: (99, 3),
+        'Standard Measures': (99, 4),
+        'Additional Measures': (99, 4),
+        'Factsheet (maintenance)': (99, 4),
+        'Distance Based Summary': (49, 3),
+    }
+
+    first_row = 10
+
+    def build(self, context: ArtifactContext) -> Optional[Any]:
+        guidance = {
+            "assessment_types": deepcopy(ASSESSMENT_TYPES),
+            "calculation_modes": deepcopy(CALCULATION_MODES),
+            "environment_approaches": deepcopy(ENVIRONMENT_APPROACHES),
+            "time_periods": deepcopy(TIME_PERIODS),
+            "propagation_types": deepcopy(PROPAGATION_TYPES),
+            "noise_categories": {},
+            "scenarios": {},
+            "mitigation_measures": {
+                "standard": [],
+                "additional": []
+            },
+            "notifications": {},
+            "work_hours": {},
+            "compliance": {}
+        }
+        data = {
+            "definitions": {},
+            "guidance": guidance,
+            "images": {},
+            "tips": list(TIPS),
+            "examples": []
+        }
+
+        for term, definition in self._rows(context, 'Doc control & definitions', 3):
+            if isinstance(term, str) and isinstance(definition, str):
+                data["definitions"][term.strip()] = definition.strip()
+
+        for category_id, description in self._rows(context, 'Representative Noise Environ.', 3):
+            guidance["noise_categories"][str(category_id)] = {
+                "description": str(description),
+                "examples": []
+            }
+
+        for scenario_name, description in self._rows(context, SCENARIO_SHEET, 3):
+            guidance["scenarios"][str(scenario_name)] = {
+                "description": str(description),
+                "typical_activities": []
+            }
+
+        for sheet_name, kind in (('Standard Measures', "standard"), ('Additional Measures', "additional")):
+            for measure, description, reduction in self._rows(context, sheet_name, 4):
+                guidance["mitigation_measures"][kind].append({
+                    "title": str(measure),
+                    "description": str(description),
+                    "reduction": reduction or 0
+                })
+
+        # Notification method, timing, description
+        for method, timing, description in self._rows(context, 'Factsheet (maintenance)', 4, key_column=2, value_column=4):
+            guidance["notifications"][str(method)] = {
+                "description": str(description),
+                "timing": timing or ""
+            }
+
+        for period, restriction in self._rows(context, 'Distance Based Summary', 3):
+            guidance["work_hours"][str(period)] = str(restriction)
+
+        return data
+
+    def _rows(self, context: ArtifactContext, sheet_name: str, last_column: int,
+              key_column: int = 2, value_column: int = 3):
+        """Cells from column B to ``last_column`` of rows with a key and a value."""
+        grid = context.grid(sheet_name)
+        if grid is None:
+            return
+
+        last_row = self.sheets[sheet_name][0]
+        for row in range(self.first_row, last_row + 1):
+            if grid.value(row, key_column) and grid.value(row, value_column):
+                yield tuple(grid.value(row, col) for col in range(2, last_column + 1))
+
+
+class ConcaweArtifact(ArtifactHandler):
+    """Concawe attenuation by distance and propagation type, for the backend."""
+
+    name = "concawe_propagation"
+    filename = "concawe_propagation.json"
+    target = DATASETS
+    sheets = {CONCAWE_SHEET: (99, 19)}
+
+    def build(self, context: ArtifactContext) -> Optional[Any]:
+        grid = context.grid(CONCAWE_SHEET)
+        if grid is None:
+            return None
+
+        # Rows with more than two values; the first is the header
+        last_row, last_column = self.sheets[CONCAWE_SHEET]
+        rows = []
+        for row in range(2, min(grid.max_row, last_row) + 1):
+            values = [grid.value(row, col) for col in range(1, min(grid.max_column, last_column) + 1)]
+            if len([value for value in values if value is not None]) > 2:
+                rows.append(values)
+
+        concawe_table = {}
+        for values in rows[1:]:
+            if len(values) < 5 or not isinstance(values[1], (int, float)):
+                continue
+            hard, urban, rural = (float(value) if value is not None else None for value in values[2:5])
+            concawe_table[int(values[1])] = {
+                "hard": hard,
+                "urban": urban,
+                "rural": rural
+            }
+
+        if not concawe_table:
+            logger.warning(f"No Concawe attenuation rows found in sheet {CONCAWE_SHEET}")
+            return None
+
+        return {
+            "metadata": {
+                "name": "Concawe Propagation Table",
+                "version": context.metadata["version"],
+                "description": "Distance-based attenuation values from Concawe model",
+                "source": context.metadata["workbook_name"],
+                "workbook_hash": context.metadata["workbook_hash"]
+            },
+            "concawe_attenuation": concawe_table
+        }
+
+
+def default_handlers() -> List[ArtifactHandler]:
+    """Handlers for every artifact the backend and frontend load."""
+    return [PlantsArtifact(), ScenariosArtifact(), WizardDataArtifact(), ConcaweArtifact()]
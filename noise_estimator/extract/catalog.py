@@ -0,0 +1,501 @@
+"""
+Built-in catalogues for the frontend artifacts.
+
+The workbook does not hold these in a tabular form, so the extraction
+pipeline ships them alongside what it reads from the sheets.
+"""
+
+# Construction equipment with typical sound power levels
+DEFAULT_PLANTS = [
+    {
+        "id": "excavator",
+        "name": "Excavator",
+        "description": "Heavy excavator for earthmoving",
+        "sound_power_level": 105.0,
+        "duty_cycle": 0.5,
+        "usage_factor": 0.8,
+        "category": "Earthmoving"
+    },
+    {
+        "id": "truck",
+        "name": "Dump Truck",
+        "description": "Heavy dump truck for material transport",
+        "sound_power_level": 102.0,
+        "duty_cycle": 0.3,
+        "usage_factor": 0.7,
+        "category": "Transport"
+    },
+    {
+        "id": "paver",
+        "name": "Asphalt Paver",
+        "description": "Asphalt laying machine",
+        "sound_power_level": 108.0,
+        "duty_cycle": 0.8,
+        "usage_factor": 0.9,
+        "category": "Paving"
+    },
+    {
+        "id": "roller",
+        "name": "Road Roller",
+        "description": "Compaction roller for asphalt/base",
+        "sound_power_level": 100.0,
+        "duty_cycle": 0.7,
+        "usage_factor": 0.8,
+        "category": "Compaction"
+    },
+    {
+        "id": "breaker",
+        "name": "Hydraulic Breaker",
+        "description": "Rock/concrete breaker attachment",
+        "sound_power_level": 115.0,
+        "duty_cycle": 0.4,
+        "usage_factor": 0.6,
+        "category": "Demolition"
+    },
+    {
+        "id": "generator",
+        "name": "Generator",
+        "description": "Diesel generator for power supply",
+        "sound_power_level": 108.0,
+        "duty_cycle": 0.8,
+        "usage_factor": 0.9,
+        "category": "Power"
+    },
+    {
+        "id": "compressor",
+        "name": "Air Compressor",
+        "description": "Air compressor for pneumatic tools",
+        "sound_power_level": 105.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Power"
+    },
+    {
+        "id": "drill_rig",
+        "name": "Drill Rig",
+        "description": "Drilling rig for core sampling/boring",
+        "sound_power_level": 110.0,
+        "duty_cycle": 0.5,
+        "usage_factor": 0.7,
+        "category": "Drilling"
+    },
+    {
+        "id": "concrete_mixer",
+        "name": "Concrete Mixer",
+        "description": "Concrete mixing truck or batch plant",
+        "sound_power_level": 100.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Concrete"
+    },
+    {
+        "id": "pump",
+        "name": "Concrete Pump",
+        "description": "Concrete pumping equipment",
+        "sound_power_level": 95.0,
+        "duty_cycle": 0.5,
+        "usage_factor": 0.7,
+        "category": "Concrete"
+    },
+    {
+        "id": "vibrator",
+        "name": "Concrete Vibrator",
+        "description": "Concrete consolidation vibrator",
+        "sound_power_level": 95.0,
+        "duty_cycle": 0.4,
+        "usage_factor": 0.6,
+        "category": "Concrete"
+    },
+    {
+        "id": "chainsaw",
+        "name": "Chainsaw",
+        "description": "Petrol chainsaw for tree felling",
+        "sound_power_level": 110.0,
+        "duty_cycle": 0.3,
+        "usage_factor": 0.5,
+        "category": "Vegetation"
+    },
+    {
+        "id": "chipper",
+        "name": "Wood Chipper",
+        "description": "Wood chipping machine",
+        "sound_power_level": 100.0,
+        "duty_cycle": 0.5,
+        "usage_factor": 0.7,
+        "category": "Vegetation"
+    },
+    {
+        "id": "mower",
+        "name": "Ride-on Mower",
+        "description": "Large ride-on lawn mower",
+        "sound_power_level": 90.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Vegetation"
+    },
+    {
+        "id": "blower",
+        "name": "Leaf Blower",
+        "description": "Industrial leaf blower",
+        "sound_power_level": 85.0,
+        "duty_cycle": 0.4,
+        "usage_factor": 0.6,
+        "category": "Vegetation"
+    },
+    {
+        "id": "compactor",
+        "name": "Plate Compactor",
+        "description": "Vibratory plate compactor",
+        "sound_power_level": 100.0,
+        "duty_cycle": 0.5,
+        "usage_factor": 0.7,
+        "category": "Compaction"
+    },
+    {
+        "id": "auger",
+        "name": "Auger",
+        "description": "Post hole auger",
+        "sound_power_level": 95.0,
+        "duty_cycle": 0.4,
+        "usage_factor": 0.6,
+        "category": "Drilling"
+    },
+    {
+        "id": "vehicle",
+        "name": "Service Vehicle",
+        "description": "Light service vehicle/ute",
+        "sound_power_level": 85.0,
+        "duty_cycle": 0.3,
+        "usage_factor": 0.5,
+        "category": "Transport"
+    },
+    {
+        "id": "heater",
+        "name": "Line Heater",
+        "description": "Thermoplastic line marking heater",
+        "sound_power_level": 90.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Marking"
+    },
+    {
+        "id": "saw",
+        "name": "Concrete Saw",
+        "description": "Concrete cutting saw",
+        "sound_power_level": 105.0,
+        "duty_cycle": 0.4,
+        "usage_factor": 0.6,
+        "category": "Cutting"
+    },
+    {
+        "id": "jackhammer",
+        "name": "Jackhammer",
+        "description": "Hand-held jackhammer",
+        "sound_power_level": 115.0,
+        "duty_cycle": 0.3,
+        "usage_factor": 0.5,
+        "category": "Demolition"
+    },
+    {
+        "id": "scraper",
+        "name": "Scraper",
+        "description": "Motor scraper for earthmoving",
+        "sound_power_level": 110.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Earthmoving"
+    },
+    {
+        "id": "grader",
+        "name": "Motor Grader",
+        "description": "Road grader for leveling",
+        "sound_power_level": 105.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Earthmoving"
+    },
+    {
+        "id": "loader",
+        "name": "Wheel Loader",
+        "description": "Wheel loader for material handling",
+        "sound_power_level": 105.0,
+        "duty_cycle": 0.5,
+        "usage_factor": 0.7,
+        "category": "Material Handling"
+    },
+    {
+        "id": "dozer",
+        "name": "Bulldozer",
+        "description": "Crawler bulldozer for pushing",
+        "sound_power_level": 108.0,
+        "duty_cycle": 0.6,
+        "usage_factor": 0.8,
+        "category": "Earthmoving"
+    },
+    {
+        "id": "light_tower",
+        "name": "Light Tower",
+        "description": "Mobile light tower with generator",
+        "sound_power_level": 95.0,
+        "duty_cycle": 0.8,
+        "usage_factor": 0.9,
+        "category": "Lighting"
+    }
+]
+
+# Common work types added after the scenarios found in the workbook
+DEFAULT_WORK_TYPES = [
+    {
+        "id": "road_works",
+        "name": "General Road Works",
+        "description": "General road maintenance and construction activities",
+        "sound_power_levels": {
+            "excavator": 105.0,
+            "truck": 102.0,
+            "roller": 100.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "bridge_works",
+        "name": "Bridge Works",
+        "description": "Bridge construction and maintenance activities",
+        "sound_power_levels": {
+            "excavator": 105.0,
+            "breaker": 115.0,
+            "generator": 108.0
+        },
+        "propagation_type": "rural"
+    },
+    {
+        "id": "drilling",
+        "name": "Drilling Operations",
+        "description": "Drilling and core sampling activities",
+        "sound_power_levels": {
+            "drill_rig": 110.0,
+            "compressor": 105.0,
+            "generator": 108.0
+        },
+        "propagation_type": "rural"
+    },
+    {
+        "id": "concrete_works",
+        "name": "Concrete Works",
+        "description": "Concrete pouring and finishing activities",
+        "sound_power_levels": {
+            "concrete_mixer": 100.0,
+            "pump": 95.0,
+            "vibrator": 95.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "demolition",
+        "name": "Demolition Works",
+        "description": "Building and structure demolition activities",
+        "sound_power_levels": {
+            "breaker": 115.0,
+            "excavator": 110.0,
+            "truck": 102.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "landscaping",
+        "name": "Landscaping Works",
+        "description": "Landscaping and earthmoving activities",
+        "sound_power_levels": {
+            "excavator": 100.0,
+            "mower": 90.0,
+            "blower": 85.0
+        },
+        "propagation_type": "rural"
+    },
+    {
+        "id": "utility_installation",
+        "name": "Utility Installation",
+        "description": "Water, sewer, and gas line installation",
+        "sound_power_levels": {
+            "excavator": 105.0,
+            "compactor": 100.0,
+            "generator": 95.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "paving_asphalt",
+        "name": "Asphalt Paving",
+        "description": "Hot mix asphalt laying and compaction",
+        "sound_power_levels": {
+            "paver": 108.0,
+            "roller": 100.0,
+            "truck": 102.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "line_marking",
+        "name": "Line Marking",
+        "description": "Road line marking and signage installation",
+        "sound_power_levels": {
+            "vehicle": 85.0,
+            "heater": 90.0,
+            "generator": 95.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "tree_removal",
+        "name": "Tree Removal",
+        "description": "Tree felling and vegetation clearance",
+        "sound_power_levels": {
+            "chipper": 100.0,
+            "chainsaw": 110.0,
+            "truck": 102.0
+        },
+        "propagation_type": "rural"
+    },
+    {
+        "id": "signage_installation",
+        "name": "Signage Installation",
+        "description": "Road signs and traffic signal installation",
+        "sound_power_levels": {
+            "vehicle": 85.0,
+            "auger": 95.0,
+            "generator": 90.0
+        },
+        "propagation_type": "urban"
+    },
+    {
+        "id": "stormwater_works",
+        "name": "Stormwater Drainage Works",
+        "description": "Drainage installation and maintenance",
+        "sound_power_levels": {
+            "excavator": 105.0,
+            "pump": 95.0,
+            "compactor": 100.0
+        },
+        "propagation_type": "urban"
+    }
+]
+
+# Wizard guidance text
+ASSESSMENT_TYPES = {
+    "distance_based": {
+        "title": "Distance Based Assessment",
+        "description": "Calculate noise levels at a specific distance from the source. This is the most common assessment type for determining if noise levels at nearby properties will exceed criteria.",
+        "when_to_use": "Use when you need to know the noise level at a specific location (e.g., a residential property) at a known distance from the work site.",
+        "steps": [
+            "Select the work scenario or plant",
+            "Enter the distance to the receiver",
+            "Choose the time period",
+            "Review results and mitigation measures"
+        ]
+    },
+    "full_estimator": {
+        "title": "Full Estimator Assessment",
+        "description": "Comprehensive assessment that calculates affected distances and provides detailed analysis including respite periods and notification requirements.",
+        "when_to_use": "Use for detailed project planning, when you need to determine the full extent of noise impact and all compliance requirements.",
+        "steps": [
+            "Select the work scenario or plant",
+            "Specify the work location",
+            "Choose time periods for work",
+            "Review comprehensive results including notifications and compliance"
+        ]
+    }
+}
+
+CALCULATION_MODES = {
+    "scenario": {
+        "title": "Scenario-based Calculation",
+        "description": "Uses predefined work scenarios (e.g., excavation, paving) with typical equipment combinations.",
+        "when_to_use": "Use when your work matches one of the standard scenarios. This provides the most accurate results for common construction activities."
+    },
+    "noisiest_plant": {
+        "title": "Noisiest Plant Calculation",
+        "description": "Identifies and uses the noisiest piece of equipment from your selected scenario.",
+        "when_to_use": "Use when you want a conservative estimate based on the single noisiest piece of equipment."
+    },
+    "individual_plant": {
+        "title": "Individual Plant Selection",
+        "description": "Allows you to select specific pieces of equipment for custom scenarios.",
+        "when_to_use": "Use when your work involves a specific combination of equipment that doesn't match standard scenarios."
+    }
+}
+
+ENVIRONMENT_APPROACHES = {
+    "representative_noise_environment": {
+        "title": "Representative Noise Environment",
+        "description": "Uses predefined background noise levels based on the noise category (R1, U2, etc.).",
+        "when_to_use": "Use for most assessments where you don't have measured background noise levels."
+    },
+    "user_supplied_background_level": {
+        "title": "User Supplied Background Level",
+        "description": "Allows you to enter a measured or known background noise level.",
+        "when_to_use": "Use when you have actual measurements of background noise at the site."
+    }
+}
+
+TIME_PERIODS = {
+    "day": {
+        "title": "Daytime (7am - 6pm)",
+        "description": "Standard daytime work hours. Most construction activities occur during this period.",
+        "restrictions": "Monday to Saturday only. No work on Sundays or public holidays (except emergency works).",
+        "typical_background": "45 dB for R1 (Rural Residential), 55 dB for U2 (Urban Industrial)"
+    },
+    "evening": {
+        "title": "Evening (6pm - 10pm)",
+        "description": "Evening work hours with additional restrictions.",
+        "restrictions": "Maximum 3 consecutive days, EPA approval required for noisy work.",
+        "typical_background": "40 dB for R1 (Rural Residential), 50 dB for U2 (Urban Industrial)"
+    },
+    "night": {
+        "title": "Nighttime (10pm - 7am)",
+        "description": "Night work hours with the strictest requirements.",
+        "restrictions": "Emergency works only, maximum 2 consecutive nights, requires EPA Section 115 approval.",
+        "typical_background": "35 dB for R1 (Rural Residential), 45 dB for U2 (Urban Industrial)"
+    }
+}
+
+PROPAGATION_TYPES = {
+    "rural": {
+        "title": "Rural",
+        "description": "Open country environment with minimal obstacles. Noise propagates with minimal attenuation.",
+        "characteristics": "Flat or gently rolling terrain, scattered vegetation, no buildings",
+        "example": "Open farmland, rural road works"
+    },
+    "urban": {
+        "title": "Urban",
+        "description": "Built-up environment with buildings and obstacles that affect noise propagation.",
+        "characteristics": "Buildings, streets, urban infrastructure, reflective surfaces",
+        "example": "City streets, suburban areas"
+    },
+    "hard_ground": {
+        "title": "Hard Ground",
+        "description": "Solid, reflective ground surface that provides less noise attenuation.",
+        "characteristics": "Concrete, asphalt, compacted earth, rock",
+        "example": "Paved areas, concrete pads, hard-standing"
+    },
+    "soft_ground": {
+        "title": "Soft Ground",
+        "description": "Porous ground surface that provides additional noise attenuation.",
+        "characteristics": "Grass, soil, sand, vegetation",
+        "example": "Parks, gardens, unpaved areas"
+    },
+    "mixed": {
+        "title": "Mixed",
+        "description": "Combination of different ground types and environments.",
+        "characteristics": "Variable terrain with both hard and soft surfaces",
+        "example": "Suburban areas with gardens and driveways"
+    }
+}
+
+TIPS = [
+    "Always measure background noise at the most sensitive receiver location",
+    "Consider the worst-case scenario when planning work hours",
+    "Implement mitigation measures before considering out-of-hours work",
+    "Keep records of all notifications and complaints",
+    "Use noise monitoring for high-impact projects",
+    "Consider the cumulative impact of multiple noise sources",
+    "Plan respite periods for extended out-of-hours work"
+]
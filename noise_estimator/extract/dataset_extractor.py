@@ -3,7 +3,8 @@ Dataset extraction module for reading Excel workbooks and converting to JSON dat
 """
 
 import json
-import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
@@ -11,19 +12,155 @@ import logging
 
 try:
     from openpyxl import load_workbook
-    from openpyxl.utils import range_boundaries
+    from openpyxl.utils import get_column_letter, range_boundaries
 except ImportError:
     raise ImportError("openpyxl is required for dataset extraction")
 
+from .artifacts import ArtifactContext, ArtifactHandler
+from .range_map import (
+    RANGE_MAP_FILENAME, RangeMap, defined_name_ranges, earlier_candidates, normalize_name, read_workbook_map
+)
+from .sheet_cache import CACHE_FILENAME, SheetCache, hash_file, sheet_fingerprints
+from ..core.binary import BINARY_FILENAME, source_stamp, write_dataset_binary
+from ..core.manifest import register_version
+
 logger = logging.getLogger(__name__)
 
+# Table detection window: header rows and columns searched, and data rows
+# read below a header
+HEADER_SCAN_ROWS = 49
+HEADER_SCAN_COLUMNS = 19
+DATA_SCAN_ROWS = 100
+
+# A block of a sheet: first row, first column, last row, last column
+Window = Tuple[int, int, int, int]
+DETECTION_WINDOW: Window = (1, 1, HEADER_SCAN_ROWS + DATA_SCAN_ROWS, HEADER_SCAN_COLUMNS)
+
+
+def _union(a: Window, b: Window) -> Window:
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def _covers(outer: Window, inner: Window) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and outer[2] >= inner[2] and outer[3] >= inner[3]
+
+
+class SheetGrid:
+    """Cell values of a window of a worksheet.
+    
+    Read in one streaming ``iter_rows`` pass: in read-only mode every
+    ``ws.cell()`` call re-parses the sheet XML, so random access is avoided.
+    """
+    
+    def __init__(self, rows: List[Tuple[Any, ...]], max_row: int, max_column: int,
+                 min_row: int = 1, min_column: int = 1):
+        self.rows = rows
+        self.max_row = max_row
+        self.max_column = max_column
+        self.min_row = min_row
+        self.min_column = min_column
+    
+    @classmethod
+    def from_worksheet(cls, ws, window: Window = DETECTION_WINDOW) -> "SheetGrid":
+        """Read a window of a worksheet.
+        
+        Args:
+            ws: Read-only worksheet.
+            window: Block to read; the table detection window by default.
+        """
+        min_row, min_column, max_row, max_column = window
+        max_row = min(ws.max_row or max_row, max_row)
+        max_column = min(ws.max_column or max_column, max_column)
+        rows = []
+        if max_row >= min_row and max_column >= min_column:
+            rows = [
+                tuple(row)
+                for row in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_column,
+                                        max_col=max_column, values_only=True)
+            ]
+        return cls(rows, max_row, max_column, min_row, min_column)
+    
+    def value(self, row: int, column: int) -> Any:
+        """Value at 1-based sheet (row, column), or None outside the window."""
+        row -= self.min_row
+        column -= self.min_column
+        if row < 0 or column < 0 or row >= len(self.rows):
+            return None
+        values = self.rows[row]
+        return values[column] if column < len(values) else None
+
+
+def _open_workbook(workbook_path: Union[str, Path]):
+    return load_workbook(workbook_path, read_only=True, data_only=True, keep_links=False)
+
+
+def _read_sheets_open(workbook, windows: Dict[str, Window]) -> Dict[str, Tuple[Union[SheetGrid, Exception], float]]:
+    """Read the grids of some sheets of an open workbook.
+    
+    Args:
+        workbook: Read-only workbook.
+        windows: Sheet name -> block to read.
+    
+    Returns:
+        Sheet name -> (grid, or the error reading it; seconds taken).
+    """
+    results = {}
+    for sheet_name, window in windows.items():
+        started = time.perf_counter()
+        try:
+            grid: Union[SheetGrid, Exception] = SheetGrid.from_worksheet(workbook[sheet_name], window)
+        except Exception as e:
+            grid = e
+        results[sheet_name] = (grid, time.perf_counter() - started)
+    return results
+
+
+def _read_sheets(workbook_path: str, windows: Dict[str, Window]) -> Dict[str, Tuple[Union[SheetGrid, Exception], float]]:
+    """Worker task: read some sheets through a private read-only workbook handle."""
+    workbook = _open_workbook(workbook_path)
+    try:
+        return _read_sheets_open(workbook, windows)
+    finally:
+        workbook.close()
+
 
 class DatasetExtractor:
     """Extracts data from Excel workbooks and converts to JSON datasets."""
     
-    def __init__(self):
+    def __init__(self, workers: int = 1, use_sheet_cache: bool = True,
+                 artifacts: Optional[List[ArtifactHandler]] = None, use_range_map: bool = True,
+                 workbook_map: Optional[Union[str, Path]] = None):
+        """Initialize extractor.
+        
+        Args:
+            workers: Processes reading sheets in parallel. The default, 1,
+                reads every sheet in this process; each worker reopens the
+                workbook, so more only pays off on workbooks with many
+                large sheets.
+            use_sheet_cache: Reuse sheets unchanged since an earlier
+                extraction into the same output directory.
+            artifacts: Handlers building further output files from the
+                same pass over the workbook. They are written to the
+                version's ``artifacts`` directory.
+            use_range_map: Read tables from the ranges found by earlier
+                extractions into the same output directory, where the
+                sheets are unchanged, instead of searching for them.
+            workbook_map: Structure map written by ``workbook_mapper.py``;
+                its tables are tried first when it was made from the same
+                workbook.
+        """
         self.workbook = None
         self.defined_names = {}
+        self.workers = max(workers or 1, 1)
+        self.use_sheet_cache = use_sheet_cache
+        self.artifacts = list(artifacts or [])
+        self.use_range_map = use_range_map
+        self.workbook_map = workbook_map
+        self._sheet_grids: Dict[str, SheetGrid] = {}
+        self._grid_windows: Dict[str, Window] = {}
+        self._table_sources: Dict[str, str] = {}
+        self._sheet_errors: Dict[str, Exception] = {}
+        self._sheet_timings: Dict[str, Dict[str, float]] = {}
     
     def extract_dataset(self, workbook_path: Union[str, Path], output_dir: Union[str, Path]) -> str:
         """Extract dataset from Excel workbook.
@@ -42,17 +179,13 @@ class DatasetExtractor:
             raise FileNotFoundError(f"Workbook not found: {workbook_path}")
         
         # Calculate workbook hash
-        with open(workbook_path, 'rb') as f:
-            workbook_hash = hashlib.sha256(f.read()).hexdigest()
+        workbook_hash = hash_file(workbook_path)
         
         # Load workbook
         logger.info(f"Loading workbook: {workbook_path}")
-        self.workbook = load_workbook(
-            workbook_path, 
-            read_only=True, 
-            data_only=True, 
-            keep_links=False
-        )
+        started = time.perf_counter()
+        self.workbook = _open_workbook(workbook_path)
+        timings = {"workbook_load_seconds": time.perf_counter() - started}
         
         # Extract defined names
         self._extract_defined_names()
@@ -64,9 +197,24 @@ class DatasetExtractor:
         # Define extraction mappings
         extraction_plan = self._get_extraction_plan()
         
+        # Locate tables from defined names and earlier extractions, so only
+        # the remaining ones are searched for
+        fingerprints = sheet_fingerprints(workbook_path, self.workbook)
+        range_map = RangeMap(output_dir / RANGE_MAP_FILENAME) if self.use_range_map else None
+        locations = self._locate_tables(extraction_plan, workbook_hash, fingerprints, range_map)
+        
+        # Read every sheet the plan or an artifact can use up front, in parallel
+        started = time.perf_counter()
+        sheet_cache = SheetCache(output_dir / CACHE_FILENAME) if self.use_sheet_cache else None
+        windows = self._sheet_windows(extraction_plan, locations)
+        self._read_sheet_grids(workbook_path, windows, fingerprints, sheet_cache)
+        timings["sheet_read_seconds"] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        failed = set()
         for table_name, extraction_config in extraction_plan.items():
             try:
-                table_data, metadata = self._extract_table(extraction_config)
+                table_data, metadata = self._extract_table(table_name, extraction_config, locations.get(table_name))
                 if table_data:
                     tables[table_name] = table_data
                     table_metadata[table_name] = metadata
@@ -76,8 +224,13 @@ class DatasetExtractor:
                     
             except Exception as e:
                 logger.error(f"Failed to extract {table_name}: {e}")
+                failed.add(table_name)
                 continue
         
+        timings["table_detection_seconds"] = time.perf_counter() - started
+        timings["sheets"] = self._sheet_timings
+        range_entries = self._range_map_entries(extraction_plan, fingerprints, table_metadata, failed)
+        
         # Create dataset metadata
         version = self._generate_version(workbook_hash)
         dataset_metadata = {
@@ -100,18 +253,37 @@ class DatasetExtractor:
         version_dir = output_dir / version
         version_dir.mkdir(parents=True, exist_ok=True)
         
+        started = time.perf_counter()
+        artifacts, artifact_issues = self._write_artifacts(version_dir, dataset_metadata, tables)
+        timings["artifacts_seconds"] = time.perf_counter() - started
+        
         dataset_file = version_dir / "dataset.json"
-        with open(dataset_file, 'w', encoding='utf-8') as f:
-            json.dump(dataset, f, indent=2, default=str)
+        content = json.dumps(dataset, indent=2, default=str).encode("utf-8")
+        dataset_file.write_bytes(content)
+        
+        # Compiled companion that DatasetManager loads in preference to the JSON
+        write_dataset_binary(dataset, version_dir / BINARY_FILENAME, source=source_stamp(content))
         
         # Save extraction report
         report_file = version_dir / "extraction_report.json"
         extraction_report = self._create_extraction_report(dataset_metadata, table_metadata)
+        extraction_report["artifacts"] = artifacts
+        extraction_report["extraction_issues"].extend(artifact_issues)
+        extraction_report["timings"] = timings
         with open(report_file, 'w', encoding='utf-8') as f:
             json.dump(extraction_report, f, indent=2, default=str)
         
         self.workbook.close()
         
+        # Publish last, once the version's files are complete
+        register_version(output_dir, version, dataset_metadata)
+        
+        if range_map is not None:
+            try:
+                range_map.save(workbook_hash, range_entries)
+            except OSError as e:
+                logger.warning(f"Could not save range map: {e}")
+        
         logger.info(f"Dataset extracted to {dataset_file}")
         return version
     
@@ -119,7 +291,11 @@ class DatasetExtractor:
         """Extract defined names from workbook."""
         self.defined_names = {}
         
-        for name in self.workbook.defined_names.definedName:
+        defined_names = self.workbook.defined_names
+        # openpyxl 3.1 made this a dict of name -> DefinedName
+        names = defined_names.values() if hasattr(defined_names, "values") else defined_names.definedName
+        
+        for name in names:
             try:
                 self.defined_names[name.name] = {
                     "attr_text": name.attr_text,
@@ -174,26 +350,48 @@ class DatasetExtractor:
             }
         }
     
-    def _extract_table(self, config: Dict[str, Any]) -> Tuple[List[Any], Dict[str, Any]]:
-        """Extract a specific table based on configuration."""
+    def _extract_table(self, table_name: str, config: Dict[str, Any],
+                       location: Optional[Dict[str, Any]] = None) -> Tuple[List[Any], Dict[str, Any]]:
+        """Extract a specific table based on configuration.
+        
+        A table with a known location is read from there; the sheets
+        matching the plan are searched only when it has none, or the
+        location no longer holds the table.
+        """
         sheet_patterns = config["sheet_patterns"]
         required_columns = config["required_columns"]
         data_type = config["data_type"]
         
+        if location is not None:
+            self._table_sources[table_name] = location["source"]
+            if location["sheet"] is None:
+                # No matching sheet held it, and none has changed since
+                return [], {}
+            
+            extracted = self._extract_located_table(location, required_columns)
+            if extracted is not None:
+                return extracted
+            logger.info(f"{table_name} not found at its {location['source']} location "
+                        f"in {location['sheet']}; searching")
+        
+        self._table_sources[table_name] = "detected"
+        
         # Find matching sheets
         matching_sheets = self._find_matching_sheets(sheet_patterns)
         
         for sheet_name in matching_sheets:
+            started = None
             try:
-                ws = self.workbook[sheet_name]
+                grid = self._sheet_grid(sheet_name)
                 
                 # Detect tables in the sheet
-                tables = self._detect_tables(ws, required_columns)
+                started = time.perf_counter()
+                tables = self._detect_tables(grid, required_columns)
                 
                 if tables:
                     # Use the first suitable table found
                     table = tables[0]
-                    data = self._extract_table_data(ws, table, required_columns)
+                    data = self._extract_table_data(grid, table, required_columns)
                     
                     metadata = {
                         "sheet_name": sheet_name,
@@ -208,6 +406,9 @@ class DatasetExtractor:
             except Exception as e:
                 logger.warning(f"Failed to extract from sheet {sheet_name}: {e}")
                 continue
+            finally:
+                if started is not None:
+                    self._sheet_timings[sheet_name]["detect_seconds"] += time.perf_counter() - started
         
         return [], {}
     
@@ -223,17 +424,295 @@ class DatasetExtractor:
         
         return matching
     
-    def _detect_tables(self, ws, required_columns: List[str]) -> List[Dict[str, Any]]:
+    def _locate_tables(self, extraction_plan: Dict[str, Dict[str, Any]], workbook_hash: str,
+                       fingerprints: Dict[str, str], range_map: Optional[RangeMap]) -> Dict[str, Dict[str, Any]]:
+        """Find where tables are without reading any sheet.
+        
+        In order of preference: a defined name matching the table name, the
+        range map of earlier extractions where the sheets are unchanged, and
+        the tables recorded in the workbook map. Every location is checked
+        against the table's required columns when it is read.
+        
+        Returns:
+            Table name -> location: ``sheet`` (None when the table is known
+            to be missing), ``header_row``, ``start_col``, ``end_col``,
+            ``last_row`` (None to count data rows as detection does) and
+            ``source``.
+        """
+        named_ranges = defined_name_ranges(self.workbook)
+        mapped_tables = read_workbook_map(self.workbook_map, workbook_hash) if self.workbook_map else {}
+        
+        locations = {}
+        for table_name, config in extraction_plan.items():
+            candidates = self._find_matching_sheets(config["sheet_patterns"])
+            
+            named = named_ranges.get(normalize_name(table_name))
+            if named is not None:
+                locations[table_name] = self._range_location(*named, source="defined_name")
+                continue
+            
+            entry = range_map.lookup(table_name, config, workbook_hash, fingerprints, candidates) if range_map else None
+            if entry is not None:
+                if entry["sheet"] is None:
+                    locations[table_name] = {"sheet": None, "source": entry["source"]}
+                else:
+                    locations[table_name] = self._range_location(entry["sheet"], entry["range"], entry["source"])
+                continue
+            
+            for sheet_name in candidates:
+                mapped = next((
+                    table for table in mapped_tables.get(sheet_name, [])
+                    if self._matches_required_columns(
+                        [str(header).strip() for header in table.get("headers", []) if header is not None],
+                        config["required_columns"]
+                    )
+                ), None)
+                if mapped is not None:
+                    locations[table_name] = {
+                        "sheet": sheet_name,
+                        "header_row": mapped["header_row"],
+                        "start_col": mapped["start_col"],
+                        "end_col": mapped["end_col"],
+                        "last_row": None,
+                        "source": "workbook_map"
+                    }
+                    break
+        
+        logger.info(f"Located {len(locations)} of {len(extraction_plan)} tables without searching")
+        return locations
+    
+    def _range_location(self, sheet_name: str, cell_range: str, source: str) -> Dict[str, Any]:
+        """Location of a table whose header is the first row of a range."""
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        return {
+            "sheet": sheet_name,
+            "header_row": min_row,
+            "start_col": min_col,
+            "end_col": max_col,
+            "last_row": max_row,
+            "source": source
+        }
+    
+    def _location_window(self, location: Dict[str, Any]) -> Window:
+        """Block of the sheet holding a located table."""
+        last_row = location["last_row"] or location["header_row"] + DATA_SCAN_ROWS
+        return (location["header_row"], location["start_col"], last_row, location["end_col"])
+    
+    def _sheet_windows(self, extraction_plan: Dict[str, Dict[str, Any]],
+                       locations: Dict[str, Dict[str, Any]]) -> Dict[str, Window]:
+        """Block to read from each sheet, in workbook order.
+        
+        Located tables need only their own range. Sheets that may hold a
+        table still to be searched for need the table detection window, and
+        artifact handlers add the top-left blocks they read.
+        """
+        needed: Dict[str, Window] = {}
+        
+        def need(sheet_name: str, window: Window):
+            needed[sheet_name] = _union(needed[sheet_name], window) if sheet_name in needed else window
+        
+        for table_name, config in extraction_plan.items():
+            location = locations.get(table_name)
+            if location is None:
+                for sheet_name in self._find_matching_sheets(config["sheet_patterns"]):
+                    need(sheet_name, DETECTION_WINDOW)
+            elif location["sheet"] is not None and location["sheet"] in self.workbook.sheetnames:
+                need(location["sheet"], self._location_window(location))
+        
+        for handler in self.artifacts:
+            for sheet_name, (rows, columns) in handler.sheets.items():
+                need(sheet_name, (1, 1, rows, columns))
+        
+        return {sheet_name: needed[sheet_name] for sheet_name in self.workbook.sheetnames if sheet_name in needed}
+    
+    def _read_sheet_grids(self, workbook_path: Path, windows: Dict[str, Window],
+                          fingerprints: Dict[str, str], sheet_cache: Optional[SheetCache] = None):
+        """Read a block of each sheet the plan or an artifact handler needs.
+        
+        Sheets with a cached grid covering the block, under their current
+        fingerprint, are taken from ``sheet_cache``. The rest are dealt
+        round-robin, in workbook order, to up to ``workers`` processes that
+        each open the workbook read-only. Table extraction runs afterwards
+        over the collected grids in plan order, so the output does not
+        depend on which worker read what, or whether a sheet came from the
+        cache.
+        """
+        self._sheet_grids = {}
+        self._grid_windows = {}
+        self._sheet_errors = {}
+        self._sheet_timings = {}
+        
+        if sheet_cache is not None:
+            for sheet_name, window in windows.items():
+                cached = sheet_cache.get(fingerprints[sheet_name]) if sheet_name in fingerprints else None
+                if cached is None:
+                    continue
+                cached_window = cached.pop("window")
+                if _covers(cached_window, window):
+                    self._sheet_grids[sheet_name] = SheetGrid(**cached)
+                    self._grid_windows[sheet_name] = cached_window
+                    self._sheet_timings[sheet_name] = {"read_seconds": 0.0, "detect_seconds": 0.0, "cached": True}
+        
+        to_read = [sheet_name for sheet_name in windows if sheet_name not in self._sheet_grids]
+        workers = min(self.workers, len(to_read))
+        
+        if workers <= 1:
+            results = [_read_sheets_open(self.workbook, {name: windows[name] for name in to_read})]
+        else:
+            subsets = [{name: windows[name] for name in to_read[i::workers]} for i in range(workers)]
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_read_sheets, [str(workbook_path)] * workers, subsets))
+            except Exception as e:
+                logger.warning(f"Parallel sheet reading failed, reading sequentially: {e}")
+                results = [_read_sheets_open(self.workbook, {name: windows[name] for name in to_read})]
+        
+        for result in results:
+            for sheet_name, (grid, seconds) in result.items():
+                if isinstance(grid, Exception):
+                    self._sheet_errors[sheet_name] = grid
+                else:
+                    self._sheet_grids[sheet_name] = grid
+                    self._grid_windows[sheet_name] = windows[sheet_name]
+                    if sheet_cache is not None and sheet_name in fingerprints:
+                        sheet_cache.put(fingerprints[sheet_name], windows[sheet_name], grid.rows,
+                                        grid.max_row, grid.max_column, grid.min_row, grid.min_column)
+                self._sheet_timings[sheet_name] = {"read_seconds": seconds, "detect_seconds": 0.0, "cached": False}
+        
+        if sheet_cache is not None:
+            try:
+                sheet_cache.save()
+            except OSError as e:
+                logger.warning(f"Could not save sheet cache: {e}")
+        
+        logger.info(f"Read {len(to_read)} of {len(windows)} sheets with {max(workers, 1)} worker(s), "
+                    f"{len(windows) - len(to_read)} unchanged")
+    
+    def _sheet_grid(self, sheet_name: str, window: Window = DETECTION_WINDOW) -> SheetGrid:
+        """Get a grid covering a block of a sheet, reading it if it was not prefetched.
+        
+        Several tables in the plan can match the same sheet; they all share
+        the one pass over it. A sheet prefetched for a smaller block, such
+        as a located table whose range no longer holds it, is read again.
+        """
+        if sheet_name in self._sheet_errors:
+            raise self._sheet_errors[sheet_name]
+        
+        grid = self._sheet_grids.get(sheet_name)
+        read = self._grid_windows.get(sheet_name)
+        if grid is None or not _covers(read, window):
+            if read is not None:
+                window = _union(read, window)
+            started = time.perf_counter()
+            grid = SheetGrid.from_worksheet(self.workbook[sheet_name], window)
+            self._sheet_grids[sheet_name] = grid
+            self._grid_windows[sheet_name] = window
+            timing = self._sheet_timings.setdefault(sheet_name, {"read_seconds": 0.0, "detect_seconds": 0.0})
+            timing["read_seconds"] += time.perf_counter() - started
+            timing["cached"] = False
+        return grid
+    
+    def _extract_located_table(self, location: Dict[str, Any],
+                               required_columns: List[str]) -> Optional[Tuple[List[Any], Dict[str, Any]]]:
+        """Extract a table from its known location.
+        
+        Returns:
+            Data and metadata, or None if the location's header row no longer
+            has the required columns.
+        """
+        sheet_name = location["sheet"]
+        if sheet_name not in self.workbook.sheetnames:
+            return None
+        
+        grid = self._sheet_grid(sheet_name, self._location_window(location))
+        started = time.perf_counter()
+        try:
+            header_row = location["header_row"]
+            header_cells = []
+            for col in range(location["start_col"], location["end_col"] + 1):
+                value = grid.value(header_row, col)
+                if value and str(value).strip():
+                    header_cells.append((col, str(value).strip()))
+            
+            header_texts = [cell[1] for cell in header_cells]
+            if not header_cells or not self._matches_required_columns(header_texts, required_columns):
+                return None
+            
+            start_col = header_cells[0][0]
+            end_col = header_cells[-1][0]
+            if location["last_row"] is None:
+                data_rows = self._count_data_rows(grid, header_row, start_col, end_col)
+            else:
+                data_rows = location["last_row"] - header_row
+            if data_rows <= 0:
+                return None
+            
+            table = {
+                "header_row": header_row,
+                "start_col": start_col,
+                "end_col": end_col,
+                "data_rows": data_rows,
+                "range": f"{get_column_letter(start_col)}{header_row}:{get_column_letter(end_col)}{header_row + data_rows}",
+                "headers": header_texts
+            }
+            data = self._extract_table_data(grid, table, required_columns)
+            
+            metadata = {
+                "sheet_name": sheet_name,
+                "cell_range": table["range"],
+                "column_types": self._infer_column_types(data),
+                "row_count": len(data),
+                "has_headers": True
+            }
+            return data, metadata
+        finally:
+            self._sheet_timings[sheet_name]["detect_seconds"] += time.perf_counter() - started
+    
+    def _range_map_entries(self, extraction_plan: Dict[str, Dict[str, Any]], fingerprints: Dict[str, str],
+                           table_metadata: Dict[str, Dict[str, Any]], failed: set) -> Dict[str, Dict[str, Any]]:
+        """Range map entries for the tables of this extraction.
+        
+        Tables that failed, or whose sheets could not all be read, are left
+        out so they are searched for again next time.
+        """
+        entries = {}
+        for table_name, config in extraction_plan.items():
+            candidates = self._find_matching_sheets(config["sheet_patterns"])
+            source = self._table_sources.get(table_name, "detected")
+            metadata = table_metadata.get(table_name)
+            
+            if metadata is not None:
+                entries[table_name] = {
+                    "config": config,
+                    "sheet": metadata["sheet_name"],
+                    "range": metadata["cell_range"],
+                    "fingerprint": fingerprints.get(metadata["sheet_name"]),
+                    "candidates": {
+                        sheet_name: fingerprints.get(sheet_name)
+                        for sheet_name in earlier_candidates(candidates, metadata["sheet_name"])
+                    },
+                    "source": source
+                }
+            elif table_name not in failed and not any(sheet_name in self._sheet_errors for sheet_name in candidates):
+                entries[table_name] = {
+                    "config": config,
+                    "sheet": None,
+                    "candidates": {sheet_name: fingerprints.get(sheet_name) for sheet_name in candidates},
+                    "source": source
+                }
+        return entries
+    
+    def _detect_tables(self, grid: SheetGrid, required_columns: List[str]) -> List[Dict[str, Any]]:
         """Detect tables in a worksheet."""
         tables = []
         
-        # Look for header rows
-        for row in range(1, min(ws.max_row + 1, 50)):
+        # Look for header rows; the grid can be wider when artifacts need more of the sheet
+        for row in range(1, min(grid.max_row, HEADER_SCAN_ROWS) + 1):
             header_cells = []
-            for col in range(1, min(ws.max_column + 1, 20)):
-                cell = ws.cell(row=row, column=col)
-                if cell.value and str(cell.value).strip():
-                    header_cells.append((col, str(cell.value).strip()))
+            for col in range(1, min(grid.max_column, HEADER_SCAN_COLUMNS) + 1):
+                value = grid.value(row, col)
+                if value and str(value).strip():
+                    header_cells.append((col, str(value).strip()))
             
             # Check if this looks like a header row with required columns
             header_texts = [cell[1] for cell in header_cells]
@@ -244,22 +723,13 @@ class DatasetExtractor:
                 end_col = header_cells[-1][0]
                 
                 # Count data rows
-                data_rows = 0
-                for check_row in range(row + 1, min(row + 101, ws.max_row + 1)):
-                    has_data = False
-                    for col in range(start_col, end_col + 1):
-                        cell = ws.cell(row=check_row, column=col)
-                        if cell.value is not None:
-                            has_data = True
-                            break
-                    if has_data:
-                        data_rows += 1
-                    elif data_rows > 0:
-                        # Stop at first empty row after finding data
-                        break
+                data_rows = self._count_data_rows(grid, row, start_col, end_col)
                 
                 if data_rows > 0:
-                    table_range = f"{ws.cell(row=row, column=start_col).coordinate}:{ws.cell(row=row+data_rows, column=end_col).coordinate}"
+                    table_range = (
+                        f"{get_column_letter(start_col)}{row}:"
+                        f"{get_column_letter(end_col)}{row + data_rows}"
+                    )
                     tables.append({
                         "header_row": row,
                         "start_col": start_col,
@@ -271,6 +741,21 @@ class DatasetExtractor:
         
         return tables
     
+    def _count_data_rows(self, grid: SheetGrid, header_row: int, start_col: int, end_col: int) -> int:
+        """Count data rows below a header, stopping at the first empty row after data."""
+        data_rows = 0
+        for check_row in range(header_row + 1, min(header_row + DATA_SCAN_ROWS, grid.max_row) + 1):
+            has_data = any(
+                grid.value(check_row, col) is not None
+                for col in range(start_col, end_col + 1)
+            )
+            if has_data:
+                data_rows += 1
+            elif data_rows > 0:
+                # Stop at first empty row after finding data
+                break
+        return data_rows
+    
     def _matches_required_columns(self, headers: List[str], required: List[str]) -> bool:
         """Check if headers match required columns."""
         header_lower = [h.lower() for h in headers]
@@ -284,7 +769,7 @@ class DatasetExtractor:
         
         return matches >= len(required) * 0.7  # Allow 70% match
     
-    def _extract_table_data(self, ws, table: Dict[str, Any], required_columns: List[str]) -> List[Dict[str, Any]]:
+    def _extract_table_data(self, grid: SheetGrid, table: Dict[str, Any], required_columns: List[str]) -> List[Dict[str, Any]]:
         """Extract data from a detected table."""
         data = []
         headers = table["headers"]
@@ -304,8 +789,7 @@ class DatasetExtractor:
             has_data = False
             
             for col in range(start_col, end_col + 1):
-                cell = ws.cell(row=header_row + row_offset, column=col)
-                value = cell.value
+                value = grid.value(header_row + row_offset, col)
                 
                 if value is not None:
                     has_data = True
@@ -350,6 +834,48 @@ class DatasetExtractor:
         
         return column_types
     
+    def _write_artifacts(self, version_dir: Path, metadata: Dict[str, Any],
+                         tables: Dict[str, Any]) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """Build each artifact and write it into the version directory.
+        
+        Returns:
+            Artifact name -> file, publish target and hash; and the problems
+            met, for the extraction report.
+        """
+        artifacts = {}
+        issues = []
+        if not self.artifacts:
+            return artifacts, issues
+        
+        context = ArtifactContext(self._sheet_grids, metadata, tables)
+        artifact_dir = version_dir / "artifacts"
+        artifact_dir.mkdir(exist_ok=True)
+        
+        for handler in self.artifacts:
+            try:
+                content = handler.build(context)
+            except Exception as e:
+                logger.error(f"Failed to build artifact {handler.name}: {e}")
+                issues.append(f"Artifact {handler.name} failed: {e}")
+                continue
+        
+            if content is None:
+                logger.warning(f"No content for artifact {handler.name}")
+                continue
+        
+            path = artifact_dir / handler.filename
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(content, f, indent=2, default=str)
+        
+            artifacts[handler.name] = {
+                "file": f"artifacts/{handler.filename}",
+                "target": handler.target,
+                "sha256": hash_file(path)
+            }
+            logger.info(f"Built artifact {handler.name}")
+        
+        return artifacts, issues
+    
     def _generate_version(self, workbook_hash: str) -> str:
         """Generate version string from workbook hash and timestamp."""
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -370,7 +896,8 @@ class DatasetExtractor:
                 "sheet": meta["sheet_name"],
                 "range": meta["cell_range"],
                 "rows": meta["row_count"],
-                "columns": list(meta["column_types"].keys())
+                "columns": list(meta["column_types"].keys()),
+                "source": self._table_sources.get(table_name, "detected")
             }
         
         return report
@@ -0,0 +1,93 @@
+"""
+Unified extraction pipeline.
+
+One pass over the workbook produces the dataset version and every artifact
+the backend and frontend load; the artifacts are then published from the
+version directory to where they are served.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import json
+import logging
+import os
+import shutil
+
+from .artifacts import DATASETS, FRONTEND, ArtifactHandler, default_handlers
+from .dataset_extractor import DatasetExtractor
+
+logger = logging.getLogger(__name__)
+
+
+def publish_artifacts(version_dir: Union[str, Path], targets: Dict[str, Union[str, Path]]) -> List[Path]:
+    """Copy a version's artifacts to the directories they are served from.
+
+    Each copy is written beside its destination and renamed over it, so
+    readers never see a partial file.
+
+    Args:
+        version_dir: Directory of an extracted dataset version.
+        targets: Publish target (``"frontend"``, ``"datasets"``) -> directory.
+            Artifacts for other targets stay in the version directory only.
+
+    Returns:
+        Paths written.
+    """
+    version_dir = Path(version_dir)
+    with open(version_dir / "extraction_report.json", 'r', encoding='utf-8') as f:
+        artifacts = json.load(f).get("artifacts", {})
+
+    published = []
+    for name, entry in artifacts.items():
+        target_dir = targets.get(entry["target"])
+        if target_dir is None:
+            continue
+
+        source = version_dir / entry["file"]
+        destination = Path(target_dir) / source.name
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, destination)
+
+        published.append(destination)
+        logger.info(f"Published artifact {name} to {destination}")
+
+    return published
+
+
+def run_pipeline(workbook_path: Union[str, Path], dataset_dir: Union[str, Path] = "datasets",
+                 frontend_dir: Optional[Union[str, Path]] = None, workers: int = 1,
+                 use_sheet_cache: bool = True, handlers: Optional[List[ArtifactHandler]] = None,
+                 workbook_map: Optional[Union[str, Path]] = None) -> str:
+    """Extract a dataset version with its artifacts and publish them.
+
+    Args:
+        workbook_path: Path to the Excel workbook file.
+        dataset_dir: Dataset directory; backend artifacts are published here.
+        frontend_dir: Directory the frontend serves static data from;
+            frontend artifacts are not published if omitted.
+        workers: Processes reading sheets in parallel; 1 reads them in
+            this process.
+        use_sheet_cache: Reuse sheets unchanged since the last extraction.
+        handlers: Artifact handlers; every default artifact if omitted.
+        workbook_map: Structure map written by ``workbook_mapper.py``, used
+            to locate tables when made from the same workbook.
+
+    Returns:
+        Version string of the extracted dataset.
+    """
+    extractor = DatasetExtractor(
+        workers=workers,
+        use_sheet_cache=use_sheet_cache,
+        artifacts=default_handlers() if handlers is None else handlers,
+        workbook_map=workbook_map
+    )
+    version = extractor.extract_dataset(workbook_path, dataset_dir)
+
+    targets = {DATASETS: Path(dataset_dir)}
+    if frontend_dir is not None:
+        targets[FRONTEND] = Path(frontend_dir)
+    publish_artifacts(Path(dataset_dir) / version, targets)
+
+    return version
@@ -0,0 +1,172 @@
+"""
+Range map locating dataset tables in the workbook.
+
+Built from the workbook's defined names, the structure recorded by
+``workbook_mapper.py`` and earlier extractions, so tables can be read from
+known cell ranges instead of being searched for.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import json
+import logging
+import os
+import re
+
+try:
+    from openpyxl.utils import range_boundaries
+except ImportError:
+    raise ImportError("openpyxl is required for dataset extraction")
+
+logger = logging.getLogger(__name__)
+
+RANGE_MAP_FILENAME = "range_map.json"
+RANGE_MAP_FORMAT = 1
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase a name and drop everything but letters and digits."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def defined_name_ranges(workbook) -> Dict[str, Tuple[str, str]]:
+    """Ranges of the workbook-scoped defined names that point into the workbook.
+
+    Names with errors (``#REF!``), formulas, structured or external
+    references, several areas, or whole columns are left out.
+
+    Returns:
+        Normalized name -> (sheet name, range such as ``"A3:C5"``).
+    """
+    defined_names = workbook.defined_names
+    # openpyxl 3.1 made this a dict of name -> DefinedName
+    names = defined_names.values() if hasattr(defined_names, "values") else defined_names.definedName
+
+    ranges = {}
+    for defined_name in names:
+        try:
+            destinations = list(defined_name.destinations)
+        except Exception:
+            continue
+        if len(destinations) != 1:
+            continue
+
+        sheet_name, cell_range = destinations[0]
+        cell_range = cell_range.replace("$", "")
+        if sheet_name not in workbook.sheetnames:
+            continue
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        except ValueError:
+            continue
+        if None in (min_col, min_row, max_col, max_row):
+            continue
+
+        ranges[normalize_name(defined_name.name)] = (sheet_name, cell_range)
+    return ranges
+
+
+def read_workbook_map(path: Union[str, Path], workbook_hash: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Tables recorded by ``workbook_mapper.py`` for this exact workbook.
+
+    Returns:
+        Sheet name -> detected tables (``header_row``, ``start_col``,
+        ``end_col``, ``headers``), or nothing if the map is missing or was
+        made from a different workbook.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            workbook_map = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable workbook map {path}: {e}")
+        return {}
+
+    if workbook_map.get("workbook_info", {}).get("file_hash") != workbook_hash:
+        logger.info(f"Workbook map {path} was made from another workbook; not used")
+        return {}
+
+    return {
+        sheet_name: sheet.get("tables_detected", [])
+        for sheet_name, sheet in workbook_map.get("sheets", {}).items()
+    }
+
+
+def earlier_candidates(candidates: List[str], sheet_name: Optional[str]) -> List[str]:
+    """Candidate sheets a search visits before reaching ``sheet_name``.
+
+    All of them when the table is missing or on a sheet outside the
+    candidates.
+    """
+    if sheet_name in candidates:
+        return candidates[:candidates.index(sheet_name)]
+    return list(candidates)
+
+
+class RangeMap:
+    """Where each table was found by earlier extractions.
+
+    An entry records the table's sheet and range, or that none of its
+    candidate sheets held it, along with the fingerprints of the sheets
+    involved: the table's sheet and every candidate searched before it.
+    Entries stay valid while the workbook hash or those sheets'
+    fingerprints are unchanged, so a search would find the same table.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.workbook_hash: Optional[str] = None
+        self.tables: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == RANGE_MAP_FORMAT:
+                self.workbook_hash = data.get("workbook_hash")
+                self.tables = data.get("tables", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable range map {self.path}: {e}")
+
+    def lookup(self, table_name: str, config: Dict[str, Any], workbook_hash: str,
+               fingerprints: Dict[str, str], candidates: List[str]) -> Optional[Dict[str, Any]]:
+        """Still-valid entry for a table, or None.
+
+        Args:
+            table_name: Table in the extraction plan.
+            config: The table's extraction plan entry; entries made under
+                another plan are not used.
+            workbook_hash: Hash of the workbook being extracted.
+            fingerprints: Current sheet fingerprints.
+            candidates: Sheets the plan would search for the table.
+        """
+        entry = self.tables.get(table_name)
+        if entry is None or entry.get("config") != config:
+            return None
+        if workbook_hash == self.workbook_hash:
+            return entry
+
+        # Known to be missing, or found, while no sheet searched before it changed
+        earlier = earlier_candidates(candidates, entry.get("sheet"))
+        current = {sheet_name: fingerprints.get(sheet_name) for sheet_name in earlier}
+        if None in current.values() or current != entry.get("candidates"):
+            return None
+        if entry.get("sheet") is None:
+            return entry
+
+        fingerprint = fingerprints.get(entry["sheet"])
+        return entry if fingerprint is not None and fingerprint == entry.get("fingerprint") else None
+
+    def save(self, workbook_hash: str, tables: Dict[str, Dict[str, Any]]):
+        """Replace the map with the locations of the latest extraction, atomically."""
+        self.workbook_hash = workbook_hash
+        self.tables = tables
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"format": RANGE_MAP_FORMAT, "workbook_hash": workbook_hash, "tables": tables},
+                      f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
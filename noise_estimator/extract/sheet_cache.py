@@ -0,0 +1,161 @@
+"""
+Per-sheet fingerprint cache for incremental workbook extraction.
+"""
+
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import hashlib
+import json
+import logging
+import os
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILENAME = "sheet_cache.json"
+CACHE_FORMAT = 2
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sheet_fingerprints(workbook_path: Union[str, Path], workbook, salt: str = "") -> Dict[str, str]:
+    """Fingerprint each worksheet of an xlsx/xlsm workbook.
+
+    Uses the CRC-32 and size the zip container already records for each
+    sheet part, so nothing is decompressed. Cell values also depend on the
+    shared string table, the date epoch and which styles are date formats,
+    so those are folded into every fingerprint.
+
+    Args:
+        workbook_path: Workbook file.
+        workbook: The same workbook opened read-only with openpyxl.
+        salt: Extra text folded in, e.g. extractor settings that change
+            what is read from a sheet.
+
+    Returns:
+        Sheet name -> fingerprint, for the sheets that could be located.
+    """
+    try:
+        with zipfile.ZipFile(workbook_path) as archive:
+            parts = {info.filename: info for info in archive.infolist()}
+    except (OSError, zipfile.BadZipFile) as e:
+        logger.warning(f"Cannot fingerprint sheets of {workbook_path}: {e}")
+        return {}
+
+    def part_key(name: str) -> str:
+        info = parts.get(name.lstrip("/"))
+        return f"{info.CRC:08x}:{info.file_size}" if info is not None else "-"
+
+    shared = "|".join([
+        part_key("xl/sharedStrings.xml"),
+        str(getattr(workbook, "epoch", "")),
+        ",".join(str(style) for style in sorted(getattr(workbook, "_date_formats", ()) or ())),
+        ",".join(str(style) for style in sorted(getattr(workbook, "_timedelta_formats", ()) or ())),
+        salt,
+    ])
+
+    fingerprints = {}
+    for sheet_name in workbook.sheetnames:
+        path = getattr(workbook[sheet_name], "_worksheet_path", None)
+        if not path or part_key(path) == "-":
+            continue
+        fingerprints[sheet_name] = hashlib.sha256(f"{shared}|{part_key(path)}".encode("utf-8")).hexdigest()
+    return fingerprints
+
+
+def _encode(value: Any) -> Any:
+    # Cell values that JSON cannot carry are tagged so they round-trip exactly
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, time):
+        return {"$time": value.isoformat()}
+    if isinstance(value, timedelta):
+        return {"$timedelta": value.total_seconds()}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, text), = value.items()
+        if tag == "$datetime":
+            return datetime.fromisoformat(text)
+        if tag == "$date":
+            return date.fromisoformat(text)
+        if tag == "$time":
+            return time.fromisoformat(text)
+        if tag == "$timedelta":
+            return timedelta(seconds=text)
+    return value
+
+
+class SheetCache:
+    """Sheet grids from earlier extractions, keyed by sheet fingerprint.
+
+    Each entry records the window of the sheet it holds. Stored as one JSON
+    file next to the datasets; each save keeps only the entries used by the
+    latest extraction.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._used: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("format") == CACHE_FORMAT:
+                self._entries = data.get("sheets", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable sheet cache {self.path}: {e}")
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Cached grid fields and the ``window`` it was read for, or None."""
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            return None
+        self._used[fingerprint] = entry
+        return {
+            "rows": [tuple(_decode(value) for value in row) for row in entry["rows"]],
+            "max_row": entry["max_row"],
+            "max_column": entry["max_column"],
+            "min_row": entry["min_row"],
+            "min_column": entry["min_column"],
+            "window": tuple(entry["window"]),
+        }
+
+    def put(self, fingerprint: str, window, rows, max_row: int, max_column: int,
+            min_row: int = 1, min_column: int = 1):
+        """Record a sheet grid under its fingerprint, replacing any other window of the sheet."""
+        entry = {
+            "window": list(window),
+            "rows": [[_encode(value) for value in row] for row in rows],
+            "max_row": max_row,
+            "max_column": max_column,
+            "min_row": min_row,
+            "min_column": min_column,
+        }
+        self._entries[fingerprint] = entry
+        self._used[fingerprint] = entry
+
+    def save(self):
+        """Write the entries used since loading, atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"format": CACHE_FORMAT, "sheets": self._used}, f, default=str)
+        os.replace(tmp_path, self.path)
@@ -7,6 +7,9 @@ from enum import Enum
 from typing import Dict, List, Optional, Union, Any
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+# Octave bands from 63 Hz to 8 kHz, as in noise_estimator.core.spectral
+OCTAVE_BAND_COUNT = 8
+
 
 class AssessmentType(str, Enum):
     """Type of noise assessment."""
@@ -76,8 +79,19 @@ class Scenario(BaseModel):
     name: str
     description: Optional[str] = None
     sound_power_levels: Dict[str, float] = Field(default_factory=dict)
+    # Optional unweighted octave-band SWL (63 Hz-8 kHz) per plant, for spectral mode
+    octave_band_levels: Dict[str, List[float]] = Field(default_factory=dict)
     propagation_type: PropagationType
     applicable_measures: List[str] = Field(default_factory=list)
+    
+    @field_validator('octave_band_levels')
+    @classmethod
+    def validate_octave_band_levels(cls, v):
+        """Validate each plant has one level per octave band."""
+        for plant_id, levels in v.items():
+            if len(levels) != OCTAVE_BAND_COUNT:
+                raise ValueError(f'octave_band_levels for {plant_id} must hold {OCTAVE_BAND_COUNT} bands (63 Hz to 8 kHz)')
+        return v
 
 
 class Plant(BaseModel):
@@ -86,9 +100,19 @@ class Plant(BaseModel):
     name: str
     description: Optional[str] = None
     sound_power_level: float
+    # Optional unweighted octave-band SWL (63 Hz-8 kHz), for spectral mode
+    octave_band_levels: Optional[List[float]] = None
     category: Optional[str] = None
     duty_cycle: float = 1.0
     usage_factor: float = 1.0
+    
+    @field_validator('octave_band_levels')
+    @classmethod
+    def validate_octave_band_levels(cls, v):
+        """Validate there is one level per octave band."""
+        if v is not None and len(v) != OCTAVE_BAND_COUNT:
+            raise ValueError(f'octave_band_levels must hold {OCTAVE_BAND_COUNT} bands (63 Hz to 8 kHz)')
+        return v
 
 
 class MitigationMeasure(BaseModel):
@@ -181,6 +205,11 @@ class EstimationResult(BaseModel):
     # Distance results (if applicable)
     distances: Optional[DistanceResult] = None
     
+    # Meteorological sweep (when propagating with the parametric Concawe model)
+    met_category: Optional[str] = None
+    met_category_levels: Optional[Dict[str, float]] = None
+    worst_met_category: Optional[int] = None
+    
     # Mitigation measures
     standard_measures: List[MitigationMeasure] = Field(default_factory=list)
     additional_measures: List[MitigationMeasure] = Field(default_factory=list)
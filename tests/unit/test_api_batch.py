@@ -0,0 +1,153 @@
+"""
+Unit tests for the streaming batch estimation endpoint.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from noise_estimator.api import main as api_main
+from noise_estimator.api.executor import CalculationExecutor
+from noise_estimator.core.cache import ResultCache
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.models.schemas import EstimationRequest
+
+
+@pytest.fixture(params=["inline", "executor"])
+def client(request, noise_calculator, monkeypatch):
+    """API client wired to the sample dataset, with and without the executor."""
+    executor = CalculationExecutor(noise_calculator, max_workers=2) if request.param == "executor" else None
+    monkeypatch.setattr(api_main, "calculator", noise_calculator)
+    monkeypatch.setattr(api_main, "executor", executor)
+    monkeypatch.setattr(api_main, "BATCH_CHUNK_SIZE", 2)
+
+    yield TestClient(api_main.app)
+
+    if executor is not None:
+        executor.shutdown()
+
+
+def batch_payload(sample_requests):
+    """JSON-serializable batch of the sample requests."""
+    return [
+        EstimationRequest(**data).model_dump(mode="json")
+        for data in sample_requests.values()
+    ]
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestBatchEndpoint:
+    """Test cases for POST /estimate/batch."""
+
+    def test_json_array(self, client, noise_calculator, sample_requests):
+        """Test a JSON array body streams one result per request in order."""
+        payload = batch_payload(sample_requests)
+        response = client.post("/estimate/batch", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        records = read_ndjson(response)
+        assert [record["index"] for record in records] == list(range(len(payload)))
+        for record, item in zip(records, payload):
+            assert record["success"]
+            expected = noise_calculator.calculate(EstimationRequest(**item))
+            assert record["data"]["predicted_level_db"] == expected.predicted_level_db
+
+    def test_ndjson_with_failures(self, client, sample_requests):
+        """Test bad lines and invalid requests fail individually."""
+        payload = batch_payload(sample_requests)
+        unknown_scenario = dict(payload[0], scenario_id="missing")
+        body = "\n".join([
+            json.dumps(payload[0]),
+            "{not json",
+            json.dumps({"assessment_type": "full_estimator"}),
+            json.dumps(unknown_scenario),
+            json.dumps(payload[1]),
+        ])
+
+        response = client.post("/estimate/batch", content=body, headers={"content-type": "application/x-ndjson"})
+        records = read_ndjson(response)
+
+        assert [record["success"] for record in records] == [True, False, False, False, True]
+        assert "Invalid JSON" in records[1]["errors"][0]["message"]
+        assert {error["field"] for error in records[2]["errors"]} >= {"noise_category_id"}
+        assert "missing" in records[3]["errors"][0]["message"]
+
+    def test_empty_body(self, client):
+        """Test an empty batch streams nothing."""
+        response = client.post("/estimate/batch", content="")
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_malformed_array(self, client, sample_requests):
+        """Test damage after the first item is reported at the end of the stream."""
+        payload = batch_payload(sample_requests)
+        body = "[" + json.dumps(payload[0]) + " " + json.dumps(payload[1]) + "]"
+        records = read_ndjson(client.post("/estimate/batch", content=body))
+
+        assert records[-1]["success"] is False and records[-1]["index"] is None
+
+    def test_repeats_served_from_cache(self, dataset_manager, sample_requests, monkeypatch):
+        """Test batch items use the result cache shared with /estimate."""
+        calculator = NoiseCalculator(dataset_manager, result_cache=ResultCache())
+        monkeypatch.setattr(api_main, "calculator", calculator)
+        monkeypatch.setattr(api_main, "executor", None)
+        client = TestClient(api_main.app)
+        payload = batch_payload(sample_requests)
+
+        first = read_ndjson(client.post("/estimate/batch", json=payload))
+        assert calculator.result_cache.stats()["hits"] == 0
+        second = read_ndjson(client.post("/estimate/batch", json=payload))
+
+        assert calculator.result_cache.stats()["hits"] == len(payload)
+        assert [record["data"]["predicted_level_db"] for record in second] == \
+            [record["data"]["predicted_level_db"] for record in first]
+
+
+class TestBatchBodyParser:
+    """Test cases for incremental batch body parsing."""
+
+    def parse(self, body, size):
+        parser = api_main.BatchBodyParser()
+        items = []
+        for start in range(0, len(body), size):
+            items.extend(parser.feed(body[start:start + size]))
+        items.extend(parser.feed("", final=True))
+        if parser.error:
+            raise parser.error
+        return items
+
+    @pytest.mark.parametrize("size", [1, 3, 1000])
+    def test_array_split_anywhere(self, size):
+        """Test array items are found however the body is split, including numbers at a split."""
+        body = ' [ {"a": [1, 2]}, 12345 ,"x,]"] '
+
+        assert self.parse(body, size) == [(0, {"a": [1, 2]}), (1, 12345), (2, "x,]")]
+
+    @pytest.mark.parametrize("size", [1, 7])
+    def test_ndjson_split_anywhere(self, size):
+        """Test NDJSON lines are parsed as they complete, bad lines in place."""
+        items = self.parse('{"a": 1}\n\n{bad\n{"b": 2}', size)
+
+        assert [index for index, _ in items] == [0, 1, 2]
+        assert items[0][1] == {"a": 1} and items[2][1] == {"b": 2}
+        assert isinstance(items[1][1], json.JSONDecodeError)
+
+    def test_items_returned_before_body_ends(self):
+        """Test completed items are handed over without waiting for the rest."""
+        parser = api_main.BatchBodyParser()
+
+        assert parser.feed('[{"a": 1}, {"b"') == [(0, {"a": 1})]
+        assert parser.feed(': 2}]', final=True) == [(1, {"b": 2})]
+
+    @pytest.mark.parametrize("body", ["[1, 2", "[1 2]", "[1], 2", "[,1]"])
+    def test_malformed_array_raises(self, body):
+        """Test malformed arrays raise once the damage is reached."""
+        with pytest.raises(ValueError):
+            self.parse(body, 1000)
@@ -0,0 +1,101 @@
+"""
+Unit tests for the streaming JSONL batch runner.
+"""
+
+import json
+
+import pytest
+
+from noise_estimator.core.batch import parse_request_lines, run_batch
+from noise_estimator.core.cache import ResultCache
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.models.schemas import EstimationRequest
+
+
+@pytest.fixture
+def request_lines(sample_requests):
+    """JSONL lines for the sample requests with a blank and a bad line."""
+    lines = [EstimationRequest(**data).model_dump_json() for data in sample_requests.values()]
+    return lines[:2] + ["", "{not json"] + lines[2:]
+
+
+def run_to_records(noise_calculator, lines, **kwargs):
+    output = []
+    counts = run_batch(noise_calculator, [line + "\n" for line in lines], output.append, **kwargs)
+    return [json.loads(line) for line in output], counts
+
+
+class TestBatchRunner:
+    """Test cases for run_batch."""
+
+    def test_parse_keeps_file_line_numbers(self, request_lines):
+        """Test blank lines are skipped but still counted."""
+        items = list(parse_request_lines(request_lines))
+
+        assert [line for line, _ in items] == [1, 2, 4, 5, 6]
+        assert isinstance(items[2][1], Exception)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, noise_calculator, request_lines, workers):
+        """Test results are written in order, tagged with line numbers."""
+        records, counts = run_to_records(noise_calculator, request_lines, workers=workers, chunk_size=2)
+
+        assert [record["line"] for record in records] == [1, 2, 4, 5, 6]
+        assert [record["success"] for record in records] == [True, True, False, True, True]
+        assert counts == {"succeeded": 4, "failed": 1}
+
+        expected = noise_calculator.calculate(EstimationRequest.model_validate_json(request_lines[0]))
+        assert records[0]["data"]["predicted_level_db"] == expected.predicted_level_db
+
+    def test_calculation_failures_are_reported(self, noise_calculator, sample_requests):
+        """Test a failing request does not stop the batch."""
+        bad = dict(sample_requests["full_estimator_scenario"], scenario_id="missing")
+        lines = [EstimationRequest(**bad).model_dump_json(), EstimationRequest(**sample_requests["full_estimator_scenario"]).model_dump_json()]
+
+        records, counts = run_to_records(noise_calculator, lines)
+
+        assert [record["success"] for record in records] == [False, True]
+        assert "missing" in records[0]["errors"][0]["message"]
+
+    def test_workers_use_calculator_settings(self, dataset_manager, sample_requests):
+        """Test worker processes calculate with the parent calculator's settings."""
+        calculator = NoiseCalculator(dataset_manager, propagation_mode="interpolated", met_category=6)
+        request = EstimationRequest(**{**sample_requests["full_estimator_scenario"], "receiver_distance": 400.0})
+
+        records, _ = run_to_records(calculator, [request.model_dump_json()] * 2, workers=2, chunk_size=1)
+
+        expected = calculator.calculate(request)
+        assert records[0]["data"]["predicted_level_db"] == expected.predicted_level_db
+        assert records[1]["data"]["met_category_levels"] == expected.met_category_levels
+        assert expected.predicted_level_db != NoiseCalculator(dataset_manager).calculate(request).predicted_level_db
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_result_cache_used(self, dataset_manager, request_lines, workers):
+        """Test repeated requests are served from the calculator's cache, with or without workers."""
+        calculator = NoiseCalculator(dataset_manager, result_cache=ResultCache())
+
+        first, _ = run_to_records(calculator, request_lines, workers=workers, chunk_size=2)
+        second, counts = run_to_records(calculator, request_lines, workers=workers, chunk_size=2)
+
+        assert calculator.result_cache.stats()["hits"] == counts["succeeded"] == 4
+        assert [record.get("data", {}).get("predicted_level_db") for record in second] == \
+            [record.get("data", {}).get("predicted_level_db") for record in first]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_default_version_resolved_once(self, noise_calculator, request_lines, workers, monkeypatch):
+        """Test the default dataset version is resolved in the parent once per run and pinned."""
+        manager = noise_calculator.dataset_manager
+        version = manager.load_dataset().metadata.version
+        load_dataset = manager.load_dataset
+        default_loads = []
+
+        def recording_load(version=None):
+            if version is None:
+                default_loads.append(version)
+            return load_dataset(version)
+
+        monkeypatch.setattr(manager, "load_dataset", recording_load)
+        records, _ = run_to_records(noise_calculator, request_lines, workers=workers, chunk_size=2)
+
+        assert len(default_loads) == 1
+        assert {record["data"]["dataset_version"] for record in records if record["success"]} == {version}
@@ -0,0 +1,145 @@
+"""
+Unit tests for the compiled binary dataset artifact.
+"""
+
+import json
+import os
+
+import pytest
+
+from noise_estimator.core.binary import (
+    BINARY_FILENAME,
+    BinaryDatasetError,
+    load_if_current,
+    read_dataset_binary,
+    source_stamp,
+    write_dataset_binary,
+)
+from noise_estimator.core import dataset as dataset_module
+from noise_estimator.core.dataset import DatasetManager
+
+
+def dataset_dict(sample_dataset):
+    """Sample dataset as it is stored in dataset.json."""
+    return json.loads(json.dumps(sample_dataset.model_dump(), default=str))
+
+
+class TestBinaryDataset:
+    """Test cases for writing and reading dataset.bin."""
+
+    def test_round_trip(self, temp_dir, sample_dataset):
+        """Test the artifact loads to the same dataset as the JSON."""
+        data = dataset_dict(sample_dataset)
+        path = write_dataset_binary(data, temp_dir / BINARY_FILENAME)
+
+        loaded = read_dataset_binary(path)
+
+        assert loaded.model_dump(mode="json") == sample_dataset.model_dump(mode="json")
+        assert loaded.metadata.extraction_timestamp == sample_dataset.metadata.extraction_timestamp
+
+    def test_column_types(self, temp_dir, sample_dataset):
+        """Test mixed, missing and null values survive columnar encoding."""
+        data = dataset_dict(sample_dataset)
+        rows = [
+            {"id": "a", "level": 1.5, "count": 3, "active": True, "extra": {"x": 1}},
+            {"id": "b", "level": None, "count": 2 ** 40, "active": False},
+            {"count": -1, "id": "a", "level": 2.0, "extra": [1, "two"], "mixed": 1},
+            {"id": None, "level": 0.0, "count": 0, "active": None, "mixed": 1.5},
+        ]
+        data["tables"]["rows"] = rows
+        data["tables"]["grid"] = {"10": {"a": 1.0}, "20": {"a": 2.0}}
+        path = write_dataset_binary(data, temp_dir / BINARY_FILENAME)
+
+        loaded = read_dataset_binary(path)
+
+        assert loaded.tables["rows"] == rows
+        assert loaded.tables["grid"] == data["tables"]["grid"]
+        assert type(loaded.tables["rows"][2]["mixed"]) is int
+
+    def test_corruption_detected(self, temp_dir, sample_dataset):
+        """Test a modified artifact fails its hash check."""
+        path = write_dataset_binary(dataset_dict(sample_dataset), temp_dir / BINARY_FILENAME)
+        content = bytearray(path.read_bytes())
+        content[-1] ^= 0xFF
+        path.write_bytes(bytes(content))
+
+        with pytest.raises(BinaryDatasetError):
+            read_dataset_binary(path)
+
+    def test_not_an_artifact(self, temp_dir):
+        """Test arbitrary files are rejected."""
+        path = temp_dir / BINARY_FILENAME
+        path.write_bytes(b"not a dataset" * 10)
+
+        with pytest.raises(BinaryDatasetError):
+            read_dataset_binary(path)
+
+
+class TestDatasetManagerBinary:
+    """Test cases for DatasetManager's use of the artifact."""
+
+    def test_compiled_on_json_load(self, dataset_manager, sample_dataset):
+        """Test loading from JSON leaves an artifact behind for next time."""
+        version_dir = dataset_manager.dataset_dir / sample_dataset.metadata.version
+
+        assert (version_dir / BINARY_FILENAME).exists()
+
+        fresh = DatasetManager(dataset_manager.dataset_dir)
+        dataset = fresh.load_dataset(sample_dataset.metadata.version)
+        assert dataset.model_dump(mode="json") == sample_dataset.model_dump(mode="json")
+        assert fresh.get_view(dataset).plants["excavator"].name
+
+    def test_stale_artifact_ignored(self, dataset_manager, sample_dataset):
+        """Test an artifact is not used once dataset.json changes, whatever its mtime."""
+        version_dir = dataset_manager.dataset_dir / sample_dataset.metadata.version
+        json_path = version_dir / "dataset.json"
+        assert load_if_current(version_dir) is not None
+
+        json_stat = json_path.stat()
+        data = json.loads(json_path.read_text())
+        data["metadata"]["workbook_hash"] = "edited"
+        json_path.write_text(json.dumps(data, indent=2))
+        os.utime(json_path, ns=(json_stat.st_atime_ns, json_stat.st_mtime_ns - 10 ** 9))
+
+        assert load_if_current(version_dir) is None
+        fresh = DatasetManager(dataset_manager.dataset_dir)
+        assert fresh.load_dataset(sample_dataset.metadata.version).metadata.workbook_hash == "edited"
+        assert load_if_current(version_dir).metadata.workbook_hash == "edited"
+
+    def test_source_stamp_checked(self, temp_dir, sample_dataset):
+        """Test an artifact is only read for the source content it was built from."""
+        data = dataset_dict(sample_dataset)
+        content = json.dumps(data).encode("utf-8")
+        path = write_dataset_binary(data, temp_dir / BINARY_FILENAME, source=source_stamp(content))
+
+        assert read_dataset_binary(path, source=source_stamp(content)).metadata.version == sample_dataset.metadata.version
+        with pytest.raises(BinaryDatasetError):
+            read_dataset_binary(path, source=source_stamp(content + b" "))
+
+    def test_compile_failure_not_fatal(self, dataset_manager, sample_dataset, monkeypatch, caplog):
+        """Test a failure to write the artifact while loading is logged, not raised."""
+        version_dir = dataset_manager.dataset_dir / sample_dataset.metadata.version
+        (version_dir / BINARY_FILENAME).unlink()
+
+        def fail(*args, **kwargs):
+            raise PermissionError("read-only")
+        monkeypatch.setattr(dataset_module, "write_dataset_binary", fail)
+
+        fresh = DatasetManager(dataset_manager.dataset_dir)
+        assert fresh.load_dataset(sample_dataset.metadata.version).metadata.version == sample_dataset.metadata.version
+        assert "Could not write binary dataset" in caplog.text
+        assert not list(version_dir.glob("*.tmp"))
+
+    def test_corrupt_artifact_falls_back(self, dataset_manager, sample_dataset):
+        """Test a corrupt artifact falls back to dataset.json."""
+        version_dir = dataset_manager.dataset_dir / sample_dataset.metadata.version
+        path = version_dir / BINARY_FILENAME
+        stat = path.stat()
+        path.write_bytes(b"\0" * 128)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        fresh = DatasetManager(dataset_manager.dataset_dir)
+        dataset = fresh.load_dataset(sample_dataset.metadata.version)
+
+        assert dataset.metadata.version == sample_dataset.metadata.version
+        assert read_dataset_binary(path).metadata.version == sample_dataset.metadata.version
@@ -0,0 +1,154 @@
+"""
+Unit tests for the request-level result cache.
+"""
+
+import json
+import os
+
+import pytest
+
+from noise_estimator.core import cache as cache_module
+from noise_estimator.core.cache import ResultCache, request_cache_key
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.models.schemas import EstimationRequest
+
+
+@pytest.fixture
+def cached_calculator(dataset_manager):
+    """Noise calculator with a result cache."""
+    return NoiseCalculator(dataset_manager, result_cache=ResultCache())
+
+
+class TestRequestCacheKey:
+    """Test canonical request hashing."""
+
+    def test_key_ignores_field_order(self, sample_requests):
+        """Test equal requests hash equally however they were built."""
+        data = sample_requests["full_estimator_scenario"]
+        reordered = dict(reversed(list(data.items())))
+
+        assert request_cache_key(EstimationRequest(**data), "v1", "h") == \
+            request_cache_key(EstimationRequest(**reordered), "v1", "h")
+
+    def test_key_uses_resolved_dataset(self, sample_requests):
+        """Test the requested version is replaced by the resolved dataset."""
+        data = sample_requests["full_estimator_scenario"]
+        latest = EstimationRequest(**data)
+        explicit = EstimationRequest(**data, dataset_version="v1")
+
+        assert request_cache_key(latest, "v1", "h") == request_cache_key(explicit, "v1", "h")
+        assert request_cache_key(latest, "v1", "h") != request_cache_key(latest, "v1", "other")
+
+    def test_key_changes_with_inputs(self, sample_requests):
+        """Test differing requests hash differently."""
+        data = sample_requests["full_estimator_scenario"]
+        moved = dict(data, receiver_distance=51.0)
+
+        assert request_cache_key(EstimationRequest(**data), "v1", "h") != \
+            request_cache_key(EstimationRequest(**moved), "v1", "h")
+
+    def test_key_changes_with_context(self, sample_requests):
+        """Test calculator context is part of the key."""
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+
+        assert request_cache_key(request, "v1", "h") != request_cache_key(request, "v1", "h", {"spectral": True})
+        assert request_cache_key(request, "v1", "h", {"spectral": True}) != \
+            request_cache_key(request, "v1", "h", {"spectral": False})
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hit_returns_fresh_copy(self, cached_calculator, sample_requests):
+        """Test repeated requests are served from the cache as new results."""
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+
+        first = cached_calculator.calculate(request)
+        second = cached_calculator.calculate(request)
+
+        assert second.predicted_level_db == first.predicted_level_db
+        assert second.request_id != first.request_id
+        assert second is not first
+
+        stats = cached_calculator.result_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_lru_eviction(self, noise_calculator, sample_requests):
+        """Test the least recently used result is evicted first."""
+        result = noise_calculator.calculate(EstimationRequest(**sample_requests["full_estimator_scenario"]))
+        cache = ResultCache(max_entries=2)
+
+        cache.put("a", result)
+        cache.put("b", result)
+        cache.get("a")
+        cache.put("c", result)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_memory_budget(self, noise_calculator, sample_requests):
+        """Test entries are evicted to stay within the byte budget."""
+        result = noise_calculator.calculate(EstimationRequest(**sample_requests["full_estimator_scenario"]))
+        size = len(result.model_dump_json())
+        cache = ResultCache(max_bytes=size * 2)
+
+        for key in ["a", "b", "c"]:
+            cache.put(key, result)
+
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["bytes"] <= size * 2
+
+    def test_ttl_expiry(self, noise_calculator, sample_requests, monkeypatch):
+        """Test results expire after the TTL."""
+        result = noise_calculator.calculate(EstimationRequest(**sample_requests["full_estimator_scenario"]))
+        cache = ResultCache(ttl_seconds=10.0)
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+        cache.put("a", result)
+        now[0] += 11.0
+
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalidate_keeps_version(self, noise_calculator, sample_requests):
+        """Test invalidation drops results for other dataset versions."""
+        result = noise_calculator.calculate(EstimationRequest(**sample_requests["full_estimator_scenario"]))
+        cache = ResultCache()
+        cache.put("a", result)
+
+        assert cache.invalidate(keep_version=result.dataset_version) == 0
+        assert cache.invalidate(keep_version="other") == 1
+        assert cache.get("a") is None
+
+    def test_shared_cache_separates_calculator_settings(self, dataset_manager, sample_requests):
+        """Test calculators sharing a cache do not serve each other's results."""
+        cache = ResultCache()
+        request = EstimationRequest(**{**sample_requests["full_estimator_scenario"], "receiver_distance": 400.0})
+
+        workbook = NoiseCalculator(dataset_manager, result_cache=cache).calculate(request)
+        model = NoiseCalculator(dataset_manager, result_cache=cache, met_category=6).calculate(request)
+
+        assert model.predicted_level_db != workbook.predicted_level_db
+        assert cache.stats()["hits"] == 0
+
+    def test_republished_concawe_table_misses(self, cached_calculator, sample_requests):
+        """Test results calculated with a replaced Concawe table are not served."""
+        concawe_file = cached_calculator.dataset_manager.dataset_dir / "concawe_propagation.json"
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+
+        def publish(attenuation, mtime_offset):
+            rows = {"0": {"rural": 83.2}, "10": {"rural": attenuation}}
+            concawe_file.write_text(json.dumps({"concawe_attenuation": rows}))
+            stat = concawe_file.stat()
+            os.utime(concawe_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+        publish(76.3, 0)
+        first = cached_calculator.calculate(request)
+        publish(70.3, 1_000_000_000)
+        second = cached_calculator.calculate(request)
+
+        assert second.predicted_level_db == pytest.approx(first.predicted_level_db - 6.0, abs=0.1)
+        assert cached_calculator.result_cache.stats()["hits"] == 0
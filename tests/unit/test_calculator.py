@@ -67,6 +67,33 @@ class TestNoiseCalculator:
                 noise_calculator.dataset_manager.get_current_dataset(), None
             )
     
+    def test_propagate_many_matches_scalar(self, noise_calculator):
+        """Test batch propagation is bit-identical to the scalar path."""
+        import numpy as np
+
+        dataset = noise_calculator.dataset_manager.get_current_dataset()
+        source_levels = np.array([105.0, 102.0, 98.5, 110.0])
+        distances = np.array([1.0, 12.3, 50.0, 250.0])
+
+        result = noise_calculator.propagate_many(source_levels, distances, PropagationType.RURAL, dataset)
+
+        expected = [
+            noise_calculator._apply_propagation(swl, d, PropagationType.RURAL, dataset, None)
+            for swl, d in zip(source_levels.tolist(), distances.tolist())
+        ]
+        assert result.tolist() == expected
+
+    def test_propagate_many_broadcasts_source_level(self, noise_calculator):
+        """Test a single source level is broadcast across distances."""
+        result = noise_calculator.propagate_many(105.0, [10.0, 100.0], PropagationType.RURAL)
+        assert result.shape == (2,)
+        assert result[0] > result[1]
+
+    def test_propagate_many_rejects_non_positive_distance(self, noise_calculator):
+        """Test batch propagation validates every distance."""
+        with pytest.raises(ValueError, match="Distance must be positive"):
+            noise_calculator.propagate_many(105.0, [10.0, 0.0], PropagationType.RURAL)
+
     def test_determine_impact_band(self, noise_calculator):
         """Test impact band determination."""
         # Test not affected (below NML)
@@ -123,6 +150,18 @@ class TestNoiseCalculator:
         # Should return None for unachievable target
         assert result is None
     
+    def test_calculate_distances_to_thresholds(self, noise_calculator):
+        """Test all threshold distances are found in one call."""
+        result = noise_calculator._calculate_distances_to_thresholds(
+            105.0, 45.0, 55.0, PropagationType.RURAL,
+            noise_calculator.dataset_manager.get_current_dataset(), None
+        )
+
+        # Geometric spreading: L = 105 - 20*log10(d)
+        assert result.distance_to_nml == 316.2
+        assert result.distance_to_highly_affected == 316.2
+        assert result.distance_to_exceed_background == 1000.0
+
     def test_get_representative_background_from_category(self, noise_calculator):
         """Test getting representative background from category data."""
         from noise_estimator.models.schemas import NoiseCategory, TimePeriod
@@ -160,6 +199,21 @@ class TestNoiseCalculator:
         # Test night period fallback
         result = noise_calculator._get_representative_background(category, TimePeriod.NIGHT, None)
         assert result == 35.0  # Default fallback
+        
+        # Composite periods average the single-period defaults
+        result = noise_calculator._get_representative_background(category, TimePeriod.DAY_EVENING, None)
+        assert result == pytest.approx(43.2, abs=0.05)
+    
+    def test_get_representative_background_composite_period(self, noise_calculator, dataset_manager):
+        """Test composite periods come from the precomputed background index."""
+        from noise_estimator.models.schemas import TimePeriod
+        
+        category = dataset_manager.get_noise_categories()["U2"]
+        result = noise_calculator._get_representative_background(category, TimePeriod.EVENING_NIGHT, None)
+        
+        expected = dataset_manager.get_view().background_levels[("U2", "evening_night")]
+        assert result == expected
+        assert category.time_periods[TimePeriod.NIGHT] < result < category.time_periods[TimePeriod.EVENING]
 
 
 class TestCalculationWorkflows:
@@ -300,3 +354,34 @@ class TestCalculationWorkflows:
                 receiver_distance=50.0
                 # Missing user_background_level
             )
+    
+    def test_calculate_many_matches_calculate(self, noise_calculator, sample_requests):
+        """Test batch results match individual calculations in input order."""
+        from noise_estimator.models.schemas import EstimationRequest
+        
+        requests = [EstimationRequest(**data) for data in sample_requests.values()]
+        for distance in [10.0, 25.0, 80.0]:
+            requests.append(EstimationRequest(**{**sample_requests["full_estimator_plant"], "receiver_distance": distance}))
+        
+        batch_results = list(noise_calculator.calculate_many(requests))
+        
+        assert len(batch_results) == len(requests)
+        for request, batch_result in zip(requests, batch_results):
+            expected = noise_calculator.calculate(request)
+            assert batch_result.model_dump(exclude={"request_id", "timestamp"}) == \
+                expected.model_dump(exclude={"request_id", "timestamp"})
+    
+    def test_calculate_many_return_exceptions(self, noise_calculator, sample_requests):
+        """Test failed requests are reported in place when requested."""
+        from noise_estimator.models.schemas import EstimationRequest
+        
+        good = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        bad = EstimationRequest(**{**sample_requests["full_estimator_scenario"], "scenario_id": "invalid_scenario"})
+        
+        results = list(noise_calculator.calculate_many([good, bad, good], return_exceptions=True))
+        
+        assert results[0].predicted_level_db == results[2].predicted_level_db
+        assert isinstance(results[1], ValueError)
+        
+        with pytest.raises(ValueError, match="Scenario invalid_scenario not found"):
+            list(noise_calculator.calculate_many([good, bad]))
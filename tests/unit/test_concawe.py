@@ -0,0 +1,153 @@
+"""
+Unit tests for the parametric Concawe model.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.core.concawe import (
+    MET_CATEGORIES, WORST_CASE, ConcaweModel, geometric_spreading, ground_attenuation, met_correction
+)
+from noise_estimator.models.schemas import EstimationRequest
+
+CONCAWE_PATH = Path(__file__).resolve().parents[2] / "datasets" / "concawe_propagation.json"
+
+
+class TestConcaweTerms:
+    """Test cases for the individual model terms."""
+
+    def test_geometric_spreading(self):
+        """Test spreading follows 20 log10(r) + 11 over the slant distance."""
+        result = geometric_spreading(np.array([0.0, 3.0, 100.0]), 4.0)
+        np.testing.assert_allclose(result, [20 * np.log10(4) + 11, 20 * np.log10(5) + 11, 20 * np.log10(np.hypot(100, 4)) + 11])
+
+    def test_ground_attenuation_scales_with_ground_factor(self):
+        """Test hard ground adds nothing and the porous term is never negative."""
+        result = ground_attenuation(np.array([0.0, 5.0, 1000.0, 1e6]), [0.0, 0.5, 1.0], 1.5)
+
+        assert result.shape == (4, 3)
+        assert np.all(result[:, 0] == 0.0)
+        assert np.all(result[:2] == 0.0)
+        assert result[3, 2] == pytest.approx(4.8, abs=1e-3)
+        np.testing.assert_allclose(result[:, 1], result[:, 2] / 2)
+
+    def test_met_correction_grows_with_distance(self):
+        """Test met corrections start at 100 m and reach their limit at 1 km."""
+        result = met_correction(np.array([50.0, 100.0, np.sqrt(1e5), 1000.0, 5000.0]), [8.0, 0.0, -4.0])
+
+        np.testing.assert_allclose(result[:, 0], [0.0, 0.0, 4.0, 8.0, 8.0])
+        assert np.all(result[:, 1] == 0.0)
+        assert result[4, 2] == -4.0
+
+
+class TestConcaweModel:
+    """Test cases for compiled model tables."""
+
+    def test_attenuation_shape(self):
+        """Test attenuation is evaluated over distance x key x category at once."""
+        model = ConcaweModel()
+        result = model.attenuation([10.0, 200.0, 2000.0])
+
+        assert result.shape == (3, 3, len(MET_CATEGORIES))
+        # Only met corrections differ between categories, and not below 100 m
+        assert np.ptp(result[0], axis=1).max() == 0.0
+        assert np.all(np.diff(result[2], axis=1) > 0)
+
+    def test_tables_cached_by_parameters(self):
+        """Test models with the same parameters share compiled tables."""
+        first = ConcaweModel(height_offset=6.5).tables(500)
+        second = ConcaweModel(height_offset=6.5).tables(500)
+        other = ConcaweModel(height_offset=8.0).tables(500)
+
+        assert first is second
+        assert other is not first
+        assert set(first) == set(MET_CATEGORIES) | {WORST_CASE}
+        assert first[4].max_distance == 500
+
+    def test_worst_case_is_least_attenuation(self):
+        """Test the worst-case table takes the loudest category at each distance."""
+        tables = ConcaweModel().tables(2000)
+        stacked = np.stack([tables[category].attenuation for category in MET_CATEGORIES])
+
+        np.testing.assert_array_equal(tables[WORST_CASE].attenuation, stacked.max(axis=0))
+        np.testing.assert_array_equal(tables[WORST_CASE].attenuation[1500], tables[6].attenuation[1500])
+
+    def test_unknown_met_category(self):
+        """Test unknown categories are rejected."""
+        with pytest.raises(ValueError):
+            ConcaweModel().table(7)
+        with pytest.raises(ValueError):
+            ConcaweModel(met_corrections={0: 1.0})
+
+    @pytest.mark.skipif(not CONCAWE_PATH.exists(), reason="Concawe table not extracted")
+    def test_neutral_weather_close_to_workbook_table(self):
+        """Test category 4 stays close to the workbook's measured table."""
+        with open(CONCAWE_PATH) as f:
+            measured = json.load(f)["concawe_attenuation"]
+        distances = sorted(int(d) for d in measured)
+        table = ConcaweModel().table(4, max_distance=distances[-1])
+
+        for j, key in enumerate(table.keys):
+            expected = np.array([measured[str(d)][key] for d in distances])
+            assert np.abs(table.attenuation[:, j] - expected).max() < 3.0
+
+
+class TestCalculatorMetCategories:
+    """Test cases for propagating with the parametric model."""
+
+    def test_met_category_selects_model_table(self, dataset_manager):
+        """Test the calculator propagates and inverts with the category's table."""
+        calculator = NoiseCalculator(dataset_manager, met_category=6)
+        table = ConcaweModel().table(6)
+
+        expected = 100.0 - 110 + table.lookup([50.0, 800.0], "Rural")[1]
+        np.testing.assert_allclose(calculator.propagate_many(100.0, [50.0, 800.0], "Rural"), expected)
+
+        distance, = calculator._find_distances_for_levels(100.0, [40.0], "Rural", None, ["nml"])
+        # Distances are rounded to 0.1 m
+        assert float(calculator.propagate_many(100.0, distance, "Rural")) == pytest.approx(40.0, abs=0.05)
+
+    def test_met_sweep(self, dataset_manager):
+        """Test sweeps cover every category and the worst case is their maximum."""
+        calculator = NoiseCalculator(dataset_manager, met_category=WORST_CASE)
+        sweep = calculator.met_sweep(np.array([[100.0], [110.0]]), np.array([20.0, 600.0, 3000.0]), "Rural")
+
+        assert sweep.shape == (2, 3, len(MET_CATEGORIES))
+        np.testing.assert_allclose(sweep.max(axis=-1), calculator.propagate_many(np.array([[100.0], [110.0]]),
+                                                                                 np.array([20.0, 600.0, 3000.0]), "Rural"))
+
+    def test_results_carry_sweep(self, dataset_manager, sample_requests):
+        """Test every result reports the level at the receiver under each category."""
+        calculator = NoiseCalculator(dataset_manager, met_category="worst")
+        tables = ConcaweModel().tables()
+
+        for name in ["full_estimator_scenario", "distance_based_scenario"]:
+            request = EstimationRequest(**{**sample_requests[name], "receiver_distance": 400.0})
+            for result in [calculator.calculate(request), next(calculator.calculate_many([request.model_copy(update={"include_trace": False})]))]:
+                levels = result.met_category_levels
+                assert result.met_category == WORST_CASE
+                assert list(levels) == [str(c) for c in MET_CATEGORIES]
+                assert result.worst_met_category == 6
+                assert levels["6"] == pytest.approx(result.predicted_level_db)
+                shift = float(tables[1].lookup(400.0, request.propagation_type)[1] - tables[6].lookup(400.0, request.propagation_type)[1])
+                assert levels["1"] - levels["6"] == pytest.approx(shift, abs=0.1)
+
+    def test_no_sweep_on_workbook_table(self, noise_calculator, sample_requests):
+        """Test results from the workbook table carry no sweep."""
+        result = noise_calculator.calculate(EstimationRequest(**sample_requests["full_estimator_scenario"]))
+        assert result.met_category is None and result.met_category_levels is None
+
+    def test_met_category_from_configuration(self, dataset_manager):
+        """Test configuration strings are parsed into categories."""
+        assert NoiseCalculator(dataset_manager, met_category="6").met_category == 6
+        assert NoiseCalculator(dataset_manager, met_category="Worst").met_category == WORST_CASE
+        assert NoiseCalculator(dataset_manager, met_category="").met_category is None
+
+    def test_unknown_met_category_rejected(self, dataset_manager):
+        """Test calculators refuse unknown categories up front."""
+        with pytest.raises(ValueError):
+            NoiseCalculator(dataset_manager, met_category=0)
@@ -0,0 +1,201 @@
+"""
+Unit tests for dataset snapshots and hot promotion.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from noise_estimator.core.dataset import DatasetManager
+from noise_estimator.core.manifest import register_version
+
+NEWER = "20990101_000000_newer"
+
+
+def add_version(dataset_dir, sample_dataset, version, register=True):
+    """Copy the sample dataset into the directory under another version."""
+    data = json.loads(json.dumps(sample_dataset.model_dump(), default=str))
+    data["metadata"]["version"] = version
+    version_dir = dataset_dir / version
+    version_dir.mkdir(parents=True)
+    with open(version_dir / "dataset.json", 'w') as f:
+        json.dump(data, f)
+    if register:
+        register_version(dataset_dir, version, data["metadata"])
+
+
+@pytest.fixture
+def manager(dataset_manager):
+    """Manager serving the sample dataset as its default version."""
+    manager = DatasetManager(dataset_manager.dataset_dir)
+    manager.load_dataset()
+    yield manager
+    manager.stop_watching()
+
+
+class TestDatasetRegistry:
+    """Test cases for snapshot publication and promotion."""
+
+    def test_previous_default_served_while_preparing(self, manager, sample_dataset):
+        """Test a new default is prepared in the background, then swapped in."""
+        add_version(manager.dataset_dir, sample_dataset, NEWER)
+        manager.get_manifest(refresh=True)
+
+        assert manager.load_dataset().metadata.version == sample_dataset.metadata.version
+
+        snapshot = manager.promote(NEWER).result(timeout=10)
+        assert snapshot.version == NEWER
+        assert manager.load_dataset().metadata.version == NEWER
+        assert manager.get_current_dataset() is snapshot.dataset
+        assert manager.get_view(snapshot.dataset) is snapshot.view
+
+    def test_concurrent_readers_during_promotion(self, manager, sample_dataset, monkeypatch):
+        """Test readers never fail or block while a version is loaded once."""
+        add_version(manager.dataset_dir, sample_dataset, NEWER)
+        manager.get_manifest(refresh=True)
+
+        reads = []
+        read_dataset = manager._read_dataset
+
+        def slow_read(version):
+            reads.append(version)
+            time.sleep(0.2)
+            return read_dataset(version)
+
+        monkeypatch.setattr(manager, "_read_dataset", slow_read)
+
+        seen = set()
+        errors = []
+
+        def reader():
+            try:
+                for _ in range(50):
+                    seen.add(manager.load_dataset().metadata.version)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        manager.promote(NEWER).result(timeout=10)
+
+        assert not errors
+        assert reads == [NEWER]
+        assert sample_dataset.metadata.version in seen
+        assert manager.load_dataset().metadata.version == NEWER
+
+    def test_held_snapshot_survives_clear(self, manager):
+        """Test data held by an in-flight request is unaffected by eviction."""
+        dataset = manager.load_dataset()
+        plants = manager.get_view(dataset).plants
+
+        manager.clear_cache()
+
+        assert manager.get_view(dataset).plants == plants
+        assert manager.load_dataset() is not dataset
+
+    def test_failed_promotion_keeps_default(self, manager, sample_dataset):
+        """Test a broken new version leaves the previous default in place."""
+        add_version(manager.dataset_dir, sample_dataset, NEWER)
+        (manager.dataset_dir / NEWER / "dataset.json").write_text("{")
+        manager.get_manifest(refresh=True)
+
+        with pytest.raises(Exception):
+            manager.promote(NEWER).result(timeout=10)
+
+        assert manager.load_dataset().metadata.version == sample_dataset.metadata.version
+        # Not retried on every request
+        with pytest.raises(RuntimeError):
+            manager.promote(NEWER).result(timeout=10)
+
+    def test_listener_and_watcher(self, manager, sample_dataset):
+        """Test the watcher promotes a newly registered version."""
+        promoted = []
+        manager.add_promotion_listener(lambda snapshot: promoted.append(snapshot.version))
+        manager.start_watching(interval=0.05)
+
+        add_version(manager.dataset_dir, sample_dataset, NEWER)
+
+        deadline = time.monotonic() + 10
+        while not promoted and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert promoted == [NEWER]
+        assert manager.load_dataset().metadata.version == NEWER
+
+
+class TestDatasetCache:
+    """Test cases for the memory-bounded version cache."""
+
+    def test_lru_eviction_within_budget(self, dataset_manager, sample_dataset):
+        """Test least recently used versions are evicted beyond the budget."""
+        for version in ("20200101_000000_a", "20200101_000000_b", "20200101_000000_c"):
+            add_version(dataset_manager.dataset_dir, sample_dataset, version)
+
+        manager = DatasetManager(dataset_manager.dataset_dir)
+        manager.load_dataset()
+        manager.load_dataset("20200101_000000_a")
+        size = manager.cache_stats()["resident_bytes"]
+        # Room for the pinned default and two more versions
+        manager.max_cache_bytes = int(size * 1.6)
+
+        manager.load_dataset("20200101_000000_b")
+        manager.load_dataset("20200101_000000_a")
+        manager.load_dataset("20200101_000000_c")
+
+        stats = manager.cache_stats()
+        assert set(stats["resident_versions"]) == {
+            sample_dataset.metadata.version, "20200101_000000_a", "20200101_000000_c"
+        }
+        assert stats["pinned_version"] == sample_dataset.metadata.version
+        assert stats["evictions"] == 1
+        assert stats["resident_bytes"] <= manager.max_cache_bytes
+        assert stats["hits"] == 1 and stats["misses"] == 4
+
+    def test_default_version_pinned(self, dataset_manager, sample_dataset):
+        """Test the default version stays resident even over budget."""
+        add_version(dataset_manager.dataset_dir, sample_dataset, "20200101_000000_a")
+        manager = DatasetManager(dataset_manager.dataset_dir, max_cache_bytes=1)
+
+        default = manager.load_dataset()
+        manager.load_dataset("20200101_000000_a")
+        manager.load_dataset("20200101_000000_a")
+
+        assert manager.load_dataset() is default
+        assert manager.cache_stats()["resident_versions"] == [sample_dataset.metadata.version, "20200101_000000_a"]
+
+        add_version(dataset_manager.dataset_dir, sample_dataset, "20200101_000000_b")
+        manager.load_dataset("20200101_000000_b")
+        assert manager.cache_stats()["resident_versions"] == [sample_dataset.metadata.version, "20200101_000000_b"]
+
+    def test_evicted_views_released(self, dataset_manager, sample_dataset):
+        """Test views of an evicted version are dropped and not cached again."""
+        add_version(dataset_manager.dataset_dir, sample_dataset, "20200101_000000_a")
+        add_version(dataset_manager.dataset_dir, sample_dataset, "20200101_000000_b")
+        manager = DatasetManager(dataset_manager.dataset_dir, max_cache_bytes=1)
+        manager.load_dataset()
+        evicted = manager.load_dataset("20200101_000000_a")
+        # As if its view failed to build on load, so get_view caches one
+        manager._snapshots["20200101_000000_a"].view = None
+        view = manager.get_view(evicted)
+        assert manager._view_cache["20200101_000000_a"] is view
+
+        manager.load_dataset("20200101_000000_b")
+
+        assert "20200101_000000_a" not in manager._view_cache
+        assert manager.get_view(evicted).plants == view.plants
+        assert "20200101_000000_a" not in manager._view_cache
+
+    def test_estimate_scales_with_rows(self, sample_dataset):
+        """Test size estimates grow with table size, including sampled tables."""
+        from noise_estimator.core.dataset import estimate_size
+
+        rows = [{"id": f"row{i}", "value": float(i)} for i in range(5000)]
+        small, large = estimate_size(rows[:500]), estimate_size(rows)
+
+        assert 8 < large / small < 12
+        assert estimate_size(rows) == pytest.approx(estimate_size(rows, sample_limit=10 ** 6), rel=0.05)
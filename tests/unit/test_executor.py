@@ -0,0 +1,127 @@
+"""
+Unit tests for the bounded calculation executor.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from noise_estimator.api.executor import CalculationExecutor, CalculationCancelled, ExecutorBusy
+from noise_estimator.core.cache import ResultCache
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.models.schemas import EstimationRequest
+
+
+class DisconnectedRequest:
+    """Stand-in for an HTTP request whose client has gone away."""
+
+    async def is_disconnected(self):
+        return True
+
+
+@pytest.fixture
+def blocked_calculator(noise_calculator, monkeypatch):
+    """Calculator whose calculations wait until the returned event is set."""
+    release = threading.Event()
+    calculate = noise_calculator.calculate
+
+    def blocking_calculate(request):
+        release.wait(5)
+        return calculate(request)
+
+    monkeypatch.setattr(noise_calculator, "calculate", blocking_calculate)
+    yield noise_calculator, release
+    release.set()
+
+
+class TestCalculationExecutor:
+    """Test cases for CalculationExecutor."""
+
+    def test_calculate_matches_direct(self, noise_calculator, sample_requests):
+        """Test results from the pool match a direct calculation."""
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        executor = CalculationExecutor(noise_calculator, max_workers=2)
+
+        try:
+            result = asyncio.run(executor.calculate(request))
+        finally:
+            executor.shutdown()
+
+        assert result.predicted_level_db == noise_calculator.calculate(request).predicted_level_db
+        assert executor.stats()["completed"] == 1
+        assert executor.stats()["in_flight"] == 0
+
+    def test_rejects_when_queue_full(self, blocked_calculator, sample_requests):
+        """Test submissions beyond workers plus queue are rejected."""
+        calculator, release = blocked_calculator
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        executor = CalculationExecutor(calculator, max_workers=1, max_queue=1)
+
+        try:
+            executor.submit(request)
+            executor.submit(request)
+            with pytest.raises(ExecutorBusy):
+                executor.submit(request)
+            assert executor.stats()["rejected"] == 1
+            assert executor.stats()["in_flight"] == 2
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_cancelled_on_disconnect(self, blocked_calculator, sample_requests):
+        """Test queued calculations are cancelled when the client disconnects."""
+        calculator, release = blocked_calculator
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        executor = CalculationExecutor(calculator, max_workers=1, poll_interval=0.01)
+
+        try:
+            executor.submit(request)  # occupy the only worker
+            with pytest.raises(CalculationCancelled):
+                asyncio.run(executor.calculate(request, DisconnectedRequest()))
+            assert executor.stats()["cancelled"] == 1
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_unknown_mode(self, noise_calculator):
+        """Test unsupported pool modes are rejected."""
+        with pytest.raises(ValueError):
+            CalculationExecutor(noise_calculator, mode="fiber")
+
+    def test_process_mode_loads_off_event_loop(self, dataset_manager, sample_requests, monkeypatch):
+        """Test process mode pins and looks up requests without loading datasets on the loop."""
+        calculator = NoiseCalculator(dataset_manager, result_cache=ResultCache())
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        version = dataset_manager.load_dataset().metadata.version
+        load_dataset = dataset_manager.load_dataset
+        loading_threads = []
+
+        def recording_load(*args, **kwargs):
+            loading_threads.append(threading.get_ident())
+            return load_dataset(*args, **kwargs)
+
+        monkeypatch.setattr(dataset_manager, "load_dataset", recording_load)
+        executor = CalculationExecutor(calculator, max_workers=1, mode="process")
+
+        try:
+            first = asyncio.run(executor.calculate(request))
+            second = asyncio.run(executor.calculate(request))
+        finally:
+            executor.shutdown()
+
+        assert first.predicted_level_db == second.predicted_level_db
+        assert first.dataset_version == version
+        assert calculator.result_cache.stats()["hits"] == 1
+        assert loading_threads and threading.get_ident() not in loading_threads
+
+    def test_pin_dataset_version(self, noise_calculator, sample_requests):
+        """Test unpinned requests are pinned to the default version and pinned ones kept."""
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        other = request.model_copy(update={"dataset_version": "other"})
+
+        pinned = noise_calculator.pin_dataset_version([request, other, request])
+
+        version = noise_calculator.dataset_manager.load_dataset().metadata.version
+        assert [item.dataset_version for item in pinned] == [version, "other", version]
+        assert request.dataset_version is None
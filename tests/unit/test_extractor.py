@@ -0,0 +1,392 @@
+"""
+Unit tests for workbook dataset extraction.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+from noise_estimator.extract import dataset_extractor
+from noise_estimator.extract.catalog import DEFAULT_WORK_TYPES
+from noise_estimator.extract.dataset_extractor import DatasetExtractor
+from noise_estimator.extract.pipeline import run_pipeline
+from noise_estimator.extract.sheet_cache import hash_file
+
+
+@pytest.fixture
+def workbook_path(temp_dir):
+    """Small workbook with categories, plants and scenarios sheets."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Noise Categories"
+    ws.append(["Notes"])
+    ws.append([])
+    ws.append(["ID", "Name", "Description"])
+    ws.append(["R1", "  Rural  ", "Quiet"])
+    ws.append(["U2", "Urban", ""])
+    ws.append([])
+    ws.append(["X9", "After the gap", None])
+
+    plants = wb.create_sheet("Plant library")
+    plants.append(["id", "name", "sound_power_level"])
+    for i in range(150):
+        plants.append([f"P{i}", f"Plant {i}", 90 + i % 20])
+
+    scenarios = wb.create_sheet("Scenario distances")
+    scenarios.append(["id", "name", "sound_power_level", "distance", "level", "updated"])
+    scenarios.append(["S1", "Scenario 1", 110, 10, 80.5, datetime(2024, 1, 2, 3, 4, 5)])
+
+    path = temp_dir / "workbook.xlsx"
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def artifact_workbook_path(temp_dir):
+    """Workbook with the sheets the frontend and Concawe artifacts read."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Distance Based (Scenario)"
+    for _ in range(9):
+        ws.append([])
+    ws.append([None, "Road resurfacing", "Milling and paving", 108, None, 112])
+    ws.append([None, "Noise level", "Not a scenario"])
+
+    concawe = wb.create_sheet("conc_scen")
+    concawe.append(["Concawe"])
+    concawe.append([None, "Distance", "Hard", "Urban", "Rural"])
+    for distance in range(3):
+        concawe.append([None, distance, 83.0 - distance, 82.0 - distance, 81.0 - distance])
+
+    measures = wb.create_sheet("Standard Measures")
+    for _ in range(9):
+        measures.append([])
+    measures.append([None, "Quiet plant", "Use quieter plant", 5])
+
+    path = temp_dir / "artifacts.xlsx"
+    wb.save(path)
+    return path
+
+
+def extract(workbook_path, out_dir):
+    version = DatasetExtractor().extract_dataset(workbook_path, out_dir)
+    with open(out_dir / version / "dataset.json") as f:
+        return json.load(f)
+
+
+class TestDatasetExtractor:
+    """Test cases for DatasetExtractor."""
+
+    def test_extracts_tables(self, workbook_path, temp_dir):
+        """Test tables are found below their header rows and stop at a gap."""
+        dataset = extract(workbook_path, temp_dir / "datasets")
+        tables = dataset["tables"]
+
+        assert tables["noise_categories"] == [
+            {"ID": "R1", "Name": "Rural", "Description": "Quiet"},
+            {"ID": "U2", "Name": "Urban", "Description": None},
+        ]
+        assert dataset["table_metadata"]["noise_categories"]["cell_range"] == "A3:C5"
+        # At most 100 data rows are read below a header
+        assert len(tables["plants"]) == 100
+        assert tables["scenarios"][0]["sound_power_level"] == 110
+        # The same sheet serves several tables
+        assert tables["distance_tables"] == tables["scenarios"]
+
+    def test_each_sheet_read_once(self, workbook_path, temp_dir, monkeypatch):
+        """Test extraction streams each sheet once without random cell access."""
+        passes = []
+        iter_rows = ReadOnlyWorksheet.iter_rows
+
+        def counting_iter_rows(ws, *args, **kwargs):
+            passes.append(ws.title)
+            return iter_rows(ws, *args, **kwargs)
+
+        def no_cell(ws, *args, **kwargs):
+            raise AssertionError("random cell access")
+
+        monkeypatch.setattr(ReadOnlyWorksheet, "iter_rows", counting_iter_rows)
+        monkeypatch.setattr(ReadOnlyWorksheet, "cell", no_cell)
+
+        extract(workbook_path, temp_dir / "datasets")
+
+        assert sorted(passes) == sorted(set(passes))
+        assert "Scenario distances" in passes
+
+    def test_parallel_matches_sequential(self, workbook_path, temp_dir, monkeypatch):
+        """Test parallel sheet reading produces the same dataset and report."""
+        monkeypatch.setattr(DatasetExtractor, "_generate_version", lambda self, workbook_hash: "v1")
+
+        outputs = {}
+        for workers in (1, 3):
+            out_dir = temp_dir / f"datasets_{workers}"
+            DatasetExtractor(workers=workers).extract_dataset(workbook_path, out_dir)
+            with open(out_dir / "v1" / "dataset.json") as f:
+                dataset = json.load(f)
+            with open(out_dir / "v1" / "extraction_report.json") as f:
+                report = json.load(f)
+
+            timings = report.pop("timings")
+            assert set(timings["sheets"]) == {"Noise Categories", "Plant library", "Scenario distances"}
+            for summary in (dataset["metadata"], report["extraction_summary"]):
+                summary.pop("extraction_timestamp")
+            outputs[workers] = (dataset, report)
+
+        assert outputs[1] == outputs[3]
+
+    def test_sequential_by_default(self):
+        """Test parallel sheet reading is opt-in."""
+        assert DatasetExtractor().workers == 1
+
+
+class TestIncrementalExtraction:
+    """Test cases for reuse of unchanged sheets between extractions."""
+
+    def report(self, out_dir, version):
+        with open(out_dir / version / "extraction_report.json") as f:
+            return json.load(f)
+
+    def test_unchanged_sheets_reused(self, workbook_path, temp_dir, monkeypatch):
+        """Test only sheets changed since the last extraction are read."""
+        from itertools import count
+
+        runs = count(1)
+        monkeypatch.setattr(DatasetExtractor, "_generate_version", lambda self, workbook_hash: f"v{next(runs)}")
+        out_dir = temp_dir / "datasets"
+        # Round-trip once so only the edit below differs between saves
+        openpyxl.load_workbook(workbook_path).save(workbook_path)
+        first = DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+
+        # New strings or date styles would change every sheet's fingerprint
+        wb = openpyxl.load_workbook(workbook_path)
+        wb["Plant library"]["C2"] = 99
+        wb.save(workbook_path)
+
+        second = DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+        third = DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+
+        cached = {
+            version: {name: timing["cached"] for name, timing in self.report(out_dir, version)["timings"]["sheets"].items()}
+            for version in (first, second, third)
+        }
+        assert not any(cached[first].values())
+        assert cached[second] == {"Noise Categories": True, "Plant library": False, "Scenario distances": True}
+        assert all(cached[third].values())
+
+        tables = {}
+        for version in (first, second, third):
+            with open(out_dir / version / "dataset.json") as f:
+                tables[version] = json.load(f)["tables"]
+        assert tables[second]["plants"][0]["sound_power_level"] == 99
+        assert tables[second] == tables[third]
+        # Dates survive the cache
+        assert tables[third]["scenarios"] == tables[first]["scenarios"]
+        assert tables[third]["scenarios"][0]["updated"] == str(datetime(2024, 1, 2, 3, 4, 5))
+
+    def test_cache_disabled(self, workbook_path, temp_dir):
+        """Test extraction can ignore the sheet cache."""
+        out_dir = temp_dir / "datasets"
+        DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+        DatasetExtractor(workers=1, use_sheet_cache=False).extract_dataset(workbook_path, out_dir)
+
+        version = max(path.name for path in out_dir.iterdir() if path.is_dir())
+        sheets = self.report(out_dir, version)["timings"]["sheets"]
+        assert not any(timing["cached"] for timing in sheets.values())
+
+
+class TestTableLocation:
+    """Test cases for reading tables from known ranges instead of searching."""
+
+    def report(self, out_dir, version):
+        with open(out_dir / version / "extraction_report.json") as f:
+            return json.load(f)
+
+    def test_defined_name_read_exactly(self, workbook_path, temp_dir):
+        """Test a defined name matching a table gives its exact range."""
+        from openpyxl.workbook.defined_name import DefinedName
+
+        wb = openpyxl.load_workbook(workbook_path)
+        defined_name = DefinedName("Noise_Categories", attr_text="'Noise Categories'!$A$3:$C$7")
+        if hasattr(wb.defined_names, "add"):
+            wb.defined_names.add(defined_name)
+        else:
+            wb.defined_names.append(defined_name)
+        wb.save(workbook_path)
+
+        out_dir = temp_dir / "datasets"
+        version = DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+        with open(out_dir / version / "dataset.json") as f:
+            dataset = json.load(f)
+
+        # The named range runs past the gap that stops detection
+        assert [row["ID"] for row in dataset["tables"]["noise_categories"]] == ["R1", "U2", "X9"]
+        assert dataset["table_metadata"]["noise_categories"]["cell_range"] == "A3:C7"
+        tables = self.report(out_dir, version)["tables_extracted"]
+        assert tables["noise_categories"]["source"] == "defined_name"
+        assert tables["plants"]["source"] == "detected"
+
+    def test_range_map_skips_detection(self, workbook_path, temp_dir, monkeypatch):
+        """Test unchanged sheets are read at their mapped ranges only."""
+        out_dir = temp_dir / "datasets"
+        openpyxl.load_workbook(workbook_path).save(workbook_path)
+        first = DatasetExtractor(workers=1, use_sheet_cache=False).extract_dataset(workbook_path, out_dir)
+
+        detected = []
+        detect_tables = DatasetExtractor._detect_tables
+        windows = {}
+        iter_rows = ReadOnlyWorksheet.iter_rows
+
+        def counting_detect_tables(self, grid, required_columns):
+            detected.append(required_columns)
+            return detect_tables(self, grid, required_columns)
+
+        def recording_iter_rows(ws, *args, **kwargs):
+            windows[ws.title] = (kwargs.get("min_row"), kwargs.get("max_row"))
+            return iter_rows(ws, *args, **kwargs)
+
+        monkeypatch.setattr(DatasetExtractor, "_detect_tables", counting_detect_tables)
+        monkeypatch.setattr(ReadOnlyWorksheet, "iter_rows", recording_iter_rows)
+
+        second = DatasetExtractor(workers=1, use_sheet_cache=False).extract_dataset(workbook_path, out_dir)
+
+        assert detected == []
+        assert windows["Plant library"] == (1, 101)
+        assert windows["Noise Categories"] == (3, 5)
+        with open(out_dir / first / "dataset.json") as f:
+            expected = json.load(f)["tables"]
+        with open(out_dir / second / "dataset.json") as f:
+            assert json.load(f)["tables"] == expected
+        sources = {name: table["source"] for name, table in self.report(out_dir, second)["tables_extracted"].items()}
+        assert set(sources.values()) == {"detected"}
+
+        # A changed sheet is searched again; the others keep their ranges
+        wb = openpyxl.load_workbook(workbook_path)
+        wb["Noise Categories"].insert_rows(1)
+        wb.save(workbook_path)
+        detected.clear()
+
+        third = DatasetExtractor(workers=1, use_sheet_cache=False).extract_dataset(workbook_path, out_dir)
+
+        assert detected == [["id", "name"]]
+        with open(out_dir / third / "dataset.json") as f:
+            dataset = json.load(f)
+        assert dataset["table_metadata"]["noise_categories"]["cell_range"] == "A4:C6"
+        assert dataset["tables"] == expected
+
+    def test_range_map_revalidates_earlier_candidates(self, workbook_path, temp_dir):
+        """Test a table moves when a sheet searched before its mapped sheet starts to hold it."""
+        wb = openpyxl.load_workbook(workbook_path)
+        wb.create_sheet("Plant notes", 1).append(["Notes"])
+        wb.save(workbook_path)
+
+        out_dir = temp_dir / "datasets"
+        first = DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+        with open(out_dir / first / "dataset.json") as f:
+            assert json.load(f)["table_metadata"]["plants"]["sheet_name"] == "Plant library"
+
+        wb = openpyxl.load_workbook(workbook_path)
+        notes = wb["Plant notes"]
+        notes.append(["id", "name", "sound_power_level"])
+        notes.append(["N1", "Noted plant", 101])
+        wb.save(workbook_path)
+
+        incremental = DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+        full = DatasetExtractor(workers=1, use_range_map=False).extract_dataset(workbook_path, temp_dir / "full")
+
+        with open(out_dir / incremental / "dataset.json") as f:
+            dataset = json.load(f)
+        with open(temp_dir / "full" / full / "dataset.json") as f:
+            expected = json.load(f)
+        assert dataset["table_metadata"]["plants"]["sheet_name"] == "Plant notes"
+        assert dataset["tables"] == expected["tables"]
+
+    def test_range_map_disabled(self, workbook_path, temp_dir, monkeypatch):
+        """Test extraction can search for every table regardless of the map."""
+        out_dir = temp_dir / "datasets"
+        DatasetExtractor(workers=1).extract_dataset(workbook_path, out_dir)
+
+        detected = []
+        detect_tables = DatasetExtractor._detect_tables
+        monkeypatch.setattr(DatasetExtractor, "_detect_tables",
+                            lambda self, grid, required: detected.append(required) or detect_tables(self, grid, required))
+
+        DatasetExtractor(workers=1, use_range_map=False).extract_dataset(workbook_path, out_dir)
+        assert len(detected) >= 3
+
+
+class TestExtractionPipeline:
+    """Test cases for artifacts built in the extraction pass."""
+
+    def test_artifacts_published(self, artifact_workbook_path, temp_dir):
+        """Test every artifact is built, versioned and published."""
+        dataset_dir = temp_dir / "datasets"
+        frontend_dir = temp_dir / "public"
+        version = run_pipeline(artifact_workbook_path, dataset_dir, frontend_dir=frontend_dir, workers=1)
+
+        with open(frontend_dir / "scenarios.json") as f:
+            scenarios = json.load(f)
+        assert scenarios[0] == {
+            "id": "road_resurfacing",
+            "name": "Road resurfacing",
+            "description": "Milling and paving",
+            "sound_power_levels": {"excavator": 108, "paver": 112},
+            "propagation_type": "rural"
+        }
+        assert len(scenarios) == 1 + len(DEFAULT_WORK_TYPES)
+
+        with open(frontend_dir / "wizard-data.json") as f:
+            wizard = json.load(f)
+        assert wizard["guidance"]["mitigation_measures"]["standard"] == [
+            {"title": "Quiet plant", "description": "Use quieter plant", "reduction": 5}
+        ]
+
+        with open(dataset_dir / "concawe_propagation.json") as f:
+            concawe = json.load(f)
+        assert concawe["metadata"]["version"] == version
+        assert concawe["concawe_attenuation"]["2"] == {"hard": 81.0, "urban": 80.0, "rural": 79.0}
+
+        with open(dataset_dir / version / "extraction_report.json") as f:
+            artifacts = json.load(f)["artifacts"]
+        assert set(artifacts) == {"plants", "scenarios", "wizard_data", "concawe_propagation"}
+        assert artifacts["plants"]["sha256"] == hash_file(frontend_dir / "plants.json")
+
+    def test_one_pass_for_all_artifacts(self, artifact_workbook_path, temp_dir, monkeypatch):
+        """Test the workbook is opened once and each sheet read once."""
+        opens = []
+        passes = []
+        open_workbook = dataset_extractor._open_workbook
+        iter_rows = ReadOnlyWorksheet.iter_rows
+
+        def counting_open(*args, **kwargs):
+            opens.append(args)
+            return open_workbook(*args, **kwargs)
+
+        def counting_iter_rows(ws, *args, **kwargs):
+            passes.append(ws.title)
+            return iter_rows(ws, *args, **kwargs)
+
+        monkeypatch.setattr(dataset_extractor, "_open_workbook", counting_open)
+        monkeypatch.setattr(ReadOnlyWorksheet, "iter_rows", counting_iter_rows)
+
+        run_pipeline(artifact_workbook_path, temp_dir / "datasets", frontend_dir=temp_dir / "public", workers=1)
+
+        assert len(opens) == 1
+        assert sorted(passes) == ["Distance Based (Scenario)", "Standard Measures", "conc_scen"]
+
+    def test_missing_sheet_keeps_published_file(self, workbook_path, temp_dir):
+        """Test an artifact with no source data does not replace the served copy."""
+        dataset_dir = temp_dir / "datasets"
+        dataset_dir.mkdir()
+        (dataset_dir / "concawe_propagation.json").write_text("{}")
+
+        version = run_pipeline(workbook_path, dataset_dir, workers=1)
+
+        assert (dataset_dir / "concawe_propagation.json").read_text() == "{}"
+        with open(dataset_dir / version / "extraction_report.json") as f:
+            assert "concawe_propagation" not in json.load(f)["artifacts"]
+        assert not (temp_dir / "public").exists()
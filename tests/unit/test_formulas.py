@@ -0,0 +1,184 @@
+"""
+Unit tests for the workbook formula engine.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from noise_estimator.core.formulas import FormulaError, FormulaModel, TableSpec, parse_formula
+from noise_estimator.core.propagation import PropagationTable
+
+LOGIC_PATH = Path(__file__).resolve().parents[2] / "docs" / "workbook_logic.json"
+ESTIMATOR = "Estimator (Scenario)"
+
+
+def evaluate(formula, inputs=None, tables=None):
+    """Evaluate one formula on sheet S."""
+    model = FormulaModel({"S!Z1": formula}, tables=tables)
+    return model.evaluate(inputs or {}, ["S!Z1"])["S!Z1"]
+
+
+class TestFormulaParsing:
+    """Test cases for parsing Excel formulas."""
+
+    def test_precedence(self):
+        """Test Excel operator precedence, including negation before powers."""
+        assert evaluate("=1+2*3^2").tolist() == [19.0]
+        assert evaluate("=-2^2").tolist() == [4.0]
+        assert evaluate("=2^3^2").tolist() == [64.0]
+        assert evaluate('=1+2&"x"').tolist() == ["3x"]
+        assert evaluate("=50%").tolist() == [0.5]
+
+    def test_references(self):
+        """Test cell, range and structured references parse to their cells and tables."""
+        tree = parse_formula("='Sheet (2)'!$B$3+C4+SUM(D1:E2)+T[[#Headers],[a]:[b]]", "S")
+
+        (_, _, (_, _, (_, _, first, second), total), table) = tree
+        assert first == ("cell", "Sheet (2)!B3")
+        assert second == ("cell", "S!C4")
+        assert total == ("call", "SUM", [("range", "S", 1, 4, 2, 5)])
+        assert table == ("table", "T", "[#Headers],[a]:[b]")
+
+    def test_function_names_are_not_cells(self):
+        """Test names like LOG10 read as functions, not cell references."""
+        assert evaluate("=LOG10(100)").tolist() == [2.0]
+
+    def test_unsupported_formula_recorded(self):
+        """Test formulas that cannot compile are recorded, not raised."""
+        model = FormulaModel({"S!A1": "=NOSUCH(1)", "S!A2": "=A1+1", "S!A3": "=1"})
+
+        assert set(model.errors) == {"S!A1"}
+        assert model.evaluate({}, ["S!A3"])["S!A3"].tolist() == [1.0]
+        with pytest.raises(FormulaError):
+            model.evaluate({}, ["S!A2"])
+
+
+class TestFormulaEvaluation:
+    """Test cases for vectorized evaluation."""
+
+    def test_dependency_order(self):
+        """Test formulas are evaluated after the cells they read, whatever their order."""
+        model = FormulaModel({"S!A3": "=A2*2", "S!A2": "=A1+1", "S!B9": "=A3"})
+
+        assert model.plan(["S!B9"]) == ["S!A2", "S!A3", "S!B9"]
+        assert model.inputs_for(["S!B9"]) == ["S!A1"]
+        result = model.evaluate({"S!A1": [1, 2, 3]}, ["S!B9", "S!A2"])
+        assert result["S!B9"].tolist() == [4.0, 6.0, 8.0]
+        assert result["S!A2"].tolist() == [2.0, 3.0, 4.0]
+
+    def test_inputs_replace_formulas(self):
+        """Test a value given for a formula cell is used instead of its formula."""
+        model = FormulaModel({"S!A2": "=A1+1", "S!A3": "=A2*2"})
+
+        assert model.plan(["S!A3"], given=["S!A2"]) == ["S!A3"]
+        assert model.evaluate({"S!A2": 10}, ["S!A3"])["S!A3"].tolist() == [20.0]
+
+    def test_circular_reference(self):
+        """Test circular references are reported."""
+        model = FormulaModel({"S!A1": "=B1", "S!B1": "=A1"})
+        with pytest.raises(FormulaError, match="Circular"):
+            model.plan(["S!A1"])
+
+    def test_mixed_types(self):
+        """Test text and number results mix per row, and errors read as NaN."""
+        result = evaluate('=IF(A1="x","",A2-110)', {"S!A1": ["X", "y"], "S!A2": [100, 120]})
+        assert result.tolist() == ["", 10.0]
+
+        result = evaluate('=A1-110', {"S!A1": ["", 100]})
+        assert np.isnan(result[0]) and result[1] == -10.0
+
+    def test_excel_rounding(self):
+        """Test ROUND takes halves away from zero and CEILING rounds to a multiple."""
+        assert evaluate("=ROUND(A1,0)", {"S!A1": [2.5, -2.5, 0.49, 2.675]}).tolist() == [3.0, -3.0, 0.0, 3.0]
+        assert evaluate("=ROUND(2.675,2)").tolist() == [2.68]
+        assert evaluate("=CEILING(A1,5)", {"S!A1": [41, 45, 0.1, -3]}).tolist() == [45.0, 45.0, 5.0, 0.0]
+
+    def test_lookups(self):
+        """Test MATCH, INDEX and VLOOKUP against a table, one lookup per row."""
+        tables = {"t": TableSpec(["Activity", "40", "45"], rows=[["Paving", 30, 20], ["Milling", 60, 45]])}
+
+        assert evaluate("=VLOOKUP(A1,t[],2,0)", {"S!A1": ["milling", "Paving", "None"]}, tables)[:2].tolist() == [60, 30]
+        assert np.isnan(evaluate("=VLOOKUP(A1,t[],2,0)", {"S!A1": "None"}, tables)[0])
+
+        result = evaluate('=INDEX(t[[40]:[45]],MATCH(A1,t[Activity],0),MATCH(A2,t[[#Headers],[40]:[45]],0))',
+                          {"S!A1": ["Paving", "Milling"], "S!A2": ["45", "40"]}, tables)
+        assert result.tolist() == [20, 60]
+
+        # Approximate matches on ascending and descending columns
+        assert evaluate("=MATCH(A1,t[40],1)", {"S!A1": [29, 30, 59, 99]}, tables)[1:].tolist() == [1.0, 1.0, 2.0]
+        assert evaluate("=MATCH(A1,t[45],-1)", {"S!A1": [45, 30, 10]}, tables)[1:].tolist() == [1.0, 2.0]
+
+    def test_sheet_table(self):
+        """Test a table over sheet cells reads the formulas in it."""
+        model = FormulaModel(
+            {"T!B2": "=A2*10", "T!B3": "=A3*10", "S!A1": "=INDEX(t[Level],MATCH(B1,t[Key],0))"},
+            tables={"t": TableSpec(["Key", "Level"], sheet="T", data_range="A2:B3")},
+            constants={"T!A2": 1, "T!A3": 2}
+        )
+
+        assert model.plan(["S!A1"])[-1] == "S!A1"
+        assert model.evaluate({"S!B1": [2, 1, 3]}, ["S!A1"])["S!A1"][:2].tolist() == [20.0, 10.0]
+
+
+@pytest.mark.skipif(not LOGIC_PATH.exists(), reason="workbook logic not extracted")
+class TestWorkbookCrossCheck:
+    """Test cases running the extracted workbook formulas against NoiseCalculator."""
+
+    @pytest.fixture
+    def concawe_table(self):
+        rows = {}
+        for distance in range(0, 200):
+            rows[str(distance)] = {
+                "hard": 83.2 - 20 * np.log10(distance + 1),
+                "urban": 83.2 - 21 * np.log10(distance + 1),
+                "rural": 83.2 - 22 * np.log10(distance + 1),
+            }
+        return PropagationTable.from_concawe_data(rows)
+
+    def test_all_formulas_parse(self):
+        """Test every extracted formula parses; only table definitions are missing."""
+        model = FormulaModel.from_logic(LOGIC_PATH)
+
+        assert len(model.cells) > 1000
+        assert all("Unknown table" in error for error in model.errors.values())
+
+    def test_contribution_matches_calculator(self, noise_calculator, concawe_table, monkeypatch):
+        """Test the estimator's received level formula against propagate_many in bulk."""
+        rng = np.random.default_rng(7)
+        size = 5000
+        scenarios = [f"Scenario {i}" for i in range(20)]
+        swl = dict(zip(scenarios, rng.integers(95, 125, len(scenarios)).astype(float)))
+        settings = ["Water", "Developed settlements (urban and suburban areas)", "Rural"]
+        sight = ["Yes", "No (behind solid barrier)", "No"]
+
+        picked = rng.integers(0, len(scenarios), size)
+        # Whole metres plus offsets clear of .5, where Excel and NumPy rounding differ
+        distances = rng.integers(1, 190, size) + rng.choice([-0.3, 0.0, 0.2], size)
+        setting = rng.integers(0, len(settings), size)
+        line_of_sight = rng.integers(0, len(sight), size)
+
+        model = FormulaModel.from_logic(LOGIC_PATH, sheets=[ESTIMATOR], tables={
+            "scen_tbl": TableSpec(["Activity", "SWL"], rows=[[name, level] for name, level in swl.items()]),
+            "conc_scen": TableSpec.from_propagation_table(concawe_table),
+        })
+        result = model.evaluate({
+            f"{ESTIMATOR}!B28": [scenarios[i] for i in picked],
+            f"{ESTIMATOR}!D28": [sight[i] for i in line_of_sight],
+            f"{ESTIMATOR}!D25": distances,
+            f"{ESTIMATOR}!D12": [settings[i] for i in setting],
+        }, [f"{ESTIMATOR}!G28", f"{ESTIMATOR}!D30"])
+
+        monkeypatch.setattr(noise_calculator.dataset_manager, "get_propagation_table", lambda dataset=None: concawe_table)
+        barrier = np.array([0.0, -5.0, -10.0])[line_of_sight]
+        expected = np.empty(size)
+        for i, name in enumerate(settings):
+            rows = setting == i
+            expected[rows] = noise_calculator.propagate_many(
+                np.array([swl[scenarios[j]] for j in picked[rows]]), distances[rows], name,
+                barrier_adjustment=barrier[rows]
+            )
+
+        np.testing.assert_allclose(result[f"{ESTIMATOR}!G28"].astype(float), expected, atol=1e-9)
+        assert np.array_equal(result[f"{ESTIMATOR}!D30"], np.floor(expected + 0.5))
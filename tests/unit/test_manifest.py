@@ -0,0 +1,85 @@
+"""
+Unit tests for the dataset version manifest.
+"""
+
+import json
+
+import pytest
+
+from noise_estimator.core.dataset import DatasetManager
+from noise_estimator.core.manifest import MANIFEST_FILENAME, read_manifest, register_version
+
+
+def add_version(dataset_dir, sample_dataset, version):
+    """Copy the sample dataset into the directory under another version."""
+    data = json.loads(json.dumps(sample_dataset.model_dump(), default=str))
+    data["metadata"]["version"] = version
+    version_dir = dataset_dir / version
+    version_dir.mkdir(parents=True)
+    with open(version_dir / "dataset.json", 'w') as f:
+        json.dump(data, f)
+    return data["metadata"]
+
+
+class TestManifest:
+    """Test cases for manifest-based version resolution."""
+
+    def test_built_from_scan(self, dataset_manager, sample_dataset):
+        """Test a missing manifest is built from the directory and saved."""
+        version = sample_dataset.metadata.version
+
+        assert dataset_manager.list_datasets() == [version]
+        manifest = read_manifest(dataset_manager.dataset_dir)
+        assert manifest["latest"] == version
+        assert manifest["versions"][version]["workbook_hash"] == sample_dataset.metadata.workbook_hash
+
+    def test_no_scan_per_lookup(self, dataset_manager, sample_dataset):
+        """Test folders added without registering are not picked up by lookups."""
+        dataset_manager.get_manifest()
+        add_version(dataset_manager.dataset_dir, sample_dataset, "20990101_000000_unregistered")
+
+        assert dataset_manager.default_version() == sample_dataset.metadata.version
+        assert "20990101_000000_unregistered" in dataset_manager.rebuild_manifest()["versions"]
+        assert dataset_manager.default_version() == "20990101_000000_unregistered"
+
+    def test_registered_version_seen_after_check_interval(self, temp_dir, dataset_manager, sample_dataset):
+        """Test manifest changes are picked up when the file is rechecked."""
+        manager = DatasetManager(dataset_manager.dataset_dir, manifest_check_interval=3600)
+        assert manager.default_version() == sample_dataset.metadata.version
+
+        metadata = add_version(manager.dataset_dir, sample_dataset, "20990101_000000_newer")
+        register_version(manager.dataset_dir, "20990101_000000_newer", metadata)
+
+        assert manager.default_version() == sample_dataset.metadata.version
+        manager.get_manifest(refresh=True)
+        assert manager.default_version() == "20990101_000000_newer"
+        assert manager.load_dataset().metadata.version == "20990101_000000_newer"
+
+    def test_active_pointer(self, dataset_manager, sample_dataset):
+        """Test an active version overrides latest until unpinned."""
+        metadata = add_version(dataset_manager.dataset_dir, sample_dataset, "20990101_000000_newer")
+        register_version(dataset_manager.dataset_dir, "20990101_000000_newer", metadata)
+
+        dataset_manager.set_active_version(sample_dataset.metadata.version)
+        assert dataset_manager.load_dataset().metadata.version == sample_dataset.metadata.version
+
+        dataset_manager.set_active_version(None)
+        assert dataset_manager.default_version() == "20990101_000000_newer"
+
+        with pytest.raises(FileNotFoundError):
+            dataset_manager.set_active_version("missing")
+
+    def test_corrupt_manifest_rebuilt(self, dataset_manager, sample_dataset):
+        """Test an unreadable manifest is replaced by a scan."""
+        (dataset_manager.dataset_dir / MANIFEST_FILENAME).write_text("{")
+
+        assert dataset_manager.get_manifest(refresh=True)["latest"] == sample_dataset.metadata.version
+        assert read_manifest(dataset_manager.dataset_dir)["latest"] == sample_dataset.metadata.version
+
+    def test_empty_directory(self, temp_dir):
+        """Test a missing dataset directory has no versions."""
+        manager = DatasetManager(temp_dir / "missing")
+
+        assert manager.list_datasets() == []
+        with pytest.raises(FileNotFoundError):
+            manager.load_dataset()
@@ -0,0 +1,73 @@
+"""
+Unit tests for compiled mitigation-measure rules.
+"""
+
+import pytest
+
+from noise_estimator.core.mitigation import MitigationRuleIndex
+from noise_estimator.models.schemas import (
+    MitigationMeasure, ImpactBand, TimePeriod, PropagationType
+)
+
+
+@pytest.fixture
+def measures():
+    """Measures covering band, enum, unhashable and absent conditions."""
+    return [
+        MitigationMeasure(id="barrier", title="Barrier", text="", type="standard",
+                          trigger_conditions={"impact_band": ["moderately_affected", "highly_affected"]}),
+        MitigationMeasure(id="night_only", title="Night", text="", type="standard",
+                          trigger_conditions={"impact_band": "highly_affected", "time_period": "night"}),
+        MitigationMeasure(id="rural", title="Rural", text="", type="additional",
+                          trigger_conditions={"propagation_type": "rural"}),
+        MitigationMeasure(id="listed", title="Listed", text="", type="additional",
+                          trigger_conditions={"time_period": ["day", "evening"]}),
+        MitigationMeasure(id="always", title="Always", text="", type="additional",
+                          trigger_conditions={}),
+    ]
+
+
+class TestMitigationRuleIndex:
+    """Test cases for MitigationRuleIndex."""
+
+    @pytest.mark.parametrize("band, time_period, propagation_type, expected_standard, expected_additional", [
+        (ImpactBand.HIGHLY_AFFECTED, TimePeriod.NIGHT, PropagationType.RURAL, ["barrier", "night_only"], ["rural", "always"]),
+        (ImpactBand.HIGHLY_AFFECTED, TimePeriod.DAY, PropagationType.URBAN, ["barrier"], ["always"]),
+        (ImpactBand.MODERATELY_AFFECTED, TimePeriod.NIGHT, PropagationType.URBAN, ["barrier"], ["always"]),
+        (ImpactBand.NOT_AFFECTED, TimePeriod.DAY, PropagationType.RURAL, [], ["rural", "always"]),
+    ])
+    def test_select(self, measures, band, time_period, propagation_type, expected_standard, expected_additional):
+        """Test band and input conditions select measures in table order."""
+        rules = MitigationRuleIndex(measures)
+
+        standard, additional = rules.select(band, {"time_period": time_period, "propagation_type": propagation_type})
+
+        assert [m.id for m in standard] == expected_standard
+        assert [m.id for m in additional] == expected_additional
+
+    def test_list_conditions_on_inputs_compare_whole_values(self, measures):
+        """Test a list condition on an input key must equal the input, not contain it."""
+        rules = MitigationRuleIndex(measures)
+
+        for time_period in TimePeriod:
+            _, additional = rules.select(ImpactBand.NOT_AFFECTED, {"time_period": time_period})
+            assert "listed" not in [m.id for m in additional]
+
+    def test_missing_input_keys_are_ignored(self, measures):
+        """Test conditions on keys absent from the inputs do not filter."""
+        rules = MitigationRuleIndex(measures)
+
+        standard, additional = rules.select(ImpactBand.HIGHLY_AFFECTED, {})
+        assert [m.id for m in standard] == ["barrier", "night_only"]
+        assert [m.id for m in additional] == ["rural", "listed", "always"]
+
+    def test_unhashable_input(self, measures):
+        """Test unhashable input values are compared without hashing."""
+        rules = MitigationRuleIndex(measures)
+
+        _, additional = rules.select(ImpactBand.NOT_AFFECTED, {"time_period": ["day", "evening"]})
+        assert [m.id for m in additional] == ["rural", "listed", "always"]
+
+    def test_no_measures(self):
+        """Test an empty rule set selects nothing."""
+        assert MitigationRuleIndex([]).select(ImpactBand.HIGHLY_AFFECTED, {}) == ([], [])
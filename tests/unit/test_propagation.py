@@ -0,0 +1,213 @@
+"""
+Unit tests for compiled Concawe propagation tables.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from noise_estimator.api import main as api_main
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.core.propagation import INTERPOLATED, PropagationTable
+from noise_estimator.models.schemas import PropagationType
+
+
+@pytest.fixture
+def concawe_data():
+    """Small Concawe attenuation mapping with a gap in the distances."""
+    return {
+        "0": {"hard": 83.2, "urban": 83.2, "rural": 83.2},
+        "1": {"hard": 83.1, "urban": 83.1, "rural": 83.0},
+        "2": {"hard": 82.6, "urban": 82.6, "rural": 82.6},
+        "5": {"hard": 80.3, "urban": 80.2, "rural": 80.2},
+        "10": {"hard": 76.5, "urban": 76.4, "rural": 76.3},
+    }
+
+
+def write_concawe_file(dataset_dir, concawe_data):
+    """Write a concawe_propagation.json file into a dataset directory."""
+    with open(dataset_dir / "concawe_propagation.json", 'w') as f:
+        json.dump({"concawe_attenuation": concawe_data}, f)
+
+
+class TestPropagationTable:
+    """Test cases for PropagationTable."""
+
+    def test_empty_data_compiles_to_none(self):
+        """Test that an empty mapping yields no table."""
+        assert PropagationTable.from_concawe_data({}) is None
+
+    def test_lookup_matches_nearest_scan(self, concawe_data):
+        """Test lookups agree with a sorted linear nearest-distance scan."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        available = sorted(int(d) for d in concawe_data)
+
+        for distance in [0.2, 0.5, 1.0, 2.5, 3.4, 3.5, 3.6, 7.5, 8.0, 50.0]:
+            expected_distance = min(available, key=lambda x: abs(x - round(distance)))
+            used, attenuation = table.lookup(distance, "Rural")
+            assert int(used) == expected_distance
+            assert float(attenuation) == concawe_data[str(expected_distance)]["rural"]
+
+    def test_lookup_vectorized(self, concawe_data):
+        """Test lookups over an array of distances."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        used, attenuation = table.lookup(np.array([1.0, 5.0, 10.0]), "Water")
+
+        assert used.tolist() == [1, 5, 10]
+        assert attenuation.tolist() == [83.1, 80.3, 76.5]
+
+    def test_unknown_propagation_type_uses_rural(self, concawe_data):
+        """Test enum propagation types fall back to the rural column."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        _, attenuation = table.lookup(10.0, PropagationType.URBAN)
+        assert float(attenuation) == 76.3
+
+    def test_invert_matches_fine_scan(self, concawe_data):
+        """Test inversion returns the first distance where the level meets the target."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        scan = np.arange(1.0, 20.0, 0.01)
+        _, attenuation = table.lookup(scan, "Rural")
+        levels = 100.0 - 110 + attenuation
+
+        targets = np.array([73.5, 72.0, 70.0, 66.5])
+        result = table.invert(100.0, targets, "Rural", 1.0, 20.0)
+
+        for target, distance in zip(targets, result):
+            expected = scan[np.nonzero(levels <= target)[0][0]]
+            assert distance == pytest.approx(expected, abs=0.011)
+
+    def test_invert_bounds(self, concawe_data):
+        """Test targets met at the minimum distance or never met."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        result = table.invert(100.0, [80.0, 50.0], "Rural", 1.0, 20.0)
+
+        assert result[0] == 1.0
+        assert np.isnan(result[1])
+
+    def test_extension_follows_measured_slope(self, concawe_data):
+        """Test the extended rows continue the slope fitted to the far half of the table."""
+        table = PropagationTable.from_concawe_data(concawe_data, extend_to=1000)
+        slope = (76.3 - 80.2) / np.log10(2)
+
+        assert table.max_distance == 1000
+        assert table.measured_max_distance == 10
+        assert len(table) == 5 + 990
+        used, attenuation = table.lookup([10.0, 100.0, 1000.0, 5000.0], "Rural")
+        assert used.tolist() == [10, 100, 1000, 1000]
+        np.testing.assert_allclose(attenuation, 76.3 + slope * np.array([0, 1, 2, 2]))
+
+        # Tables already reaching the distance are not copied
+        assert table.extended(500) is table
+
+    def test_interpolated_lookup(self, concawe_data):
+        """Test interpolation is linear in log-distance and exact at table rows."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        # sqrt(50) m is midway between the 5 m and 10 m rows in log-distance
+        used, attenuation = table.lookup([2.0, np.sqrt(50.0), 10.0, 0.5, 50.0], "Rural", INTERPOLATED)
+
+        assert used.tolist() == pytest.approx([2.0, np.sqrt(50.0), 10.0, 1.0, 10.0])
+        assert attenuation[0] == 82.6 and attenuation[2] == 76.3
+        assert attenuation[1] == pytest.approx((80.2 + 76.3) / 2)
+        assert attenuation[3] == 83.0 and attenuation[4] == 76.3
+
+    def test_invert_interpolated_round_trips(self, concawe_data):
+        """Test interpolated inversion returns distances the interpolated lookup agrees with."""
+        table = PropagationTable.from_concawe_data(concawe_data, extend_to=5000)
+        targets = np.array([72.9, 70.0, 61.3, 45.0, 30.0])
+        result = table.invert(100.0, targets, "Rural", 1.0, 5000.0, mode=INTERPOLATED)
+
+        _, attenuation = table.lookup(result[:-1], "Rural", INTERPOLATED)
+        np.testing.assert_allclose(100.0 - 110 + attenuation, targets[:-1])
+        assert np.isnan(result[-1])
+        assert table.invert(100.0, [80.0], "Rural", 1.0, 20.0, mode=INTERPOLATED)[0] == 1.0
+
+    def test_unknown_mode_rejected(self, concawe_data):
+        """Test lookup modes other than nearest and interpolated are rejected."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        with pytest.raises(ValueError, match="mode"):
+            table.lookup(10.0, "Rural", "cubic")
+
+    def test_table_is_read_only(self, concawe_data):
+        """Test compiled arrays cannot be mutated by callers."""
+        table = PropagationTable.from_concawe_data(concawe_data)
+        with pytest.raises(ValueError):
+            table.attenuation[0, 0] = 0.0
+
+
+class TestDatasetManagerPropagationTable:
+    """Test compiled table caching in DatasetManager."""
+
+    def test_table_compiled_once(self, dataset_manager, concawe_data):
+        """Test the Concawe file is compiled once and reused."""
+        write_concawe_file(dataset_manager.dataset_dir, concawe_data)
+
+        first = dataset_manager.get_propagation_table()
+        second = dataset_manager.get_propagation_table()
+
+        assert first is not None
+        assert first is second
+
+    def test_table_recompiled_when_file_changes(self, dataset_manager, concawe_data):
+        """Test the table is invalidated when the file's mtime changes."""
+        write_concawe_file(dataset_manager.dataset_dir, concawe_data)
+        first = dataset_manager.get_propagation_table()
+
+        concawe_data["10"]["rural"] = 70.0
+        write_concawe_file(dataset_manager.dataset_dir, concawe_data)
+        concawe_file = dataset_manager.dataset_dir / "concawe_propagation.json"
+        stat = concawe_file.stat()
+        os.utime(concawe_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = dataset_manager.get_propagation_table()
+        assert second is not first
+        assert float(second.lookup(10.0, "Rural")[1]) == 70.0
+
+    def test_table_not_extended(self, dataset_manager, concawe_data):
+        """Test the dataset manager hands out the measured table as extracted."""
+        write_concawe_file(dataset_manager.dataset_dir, concawe_data)
+        table = dataset_manager.get_propagation_table()
+
+        assert table.max_distance == 10
+        assert table.extended(5000) is table.extended(5000)
+
+    def test_no_concawe_data(self, dataset_manager):
+        """Test datasets without Concawe data yield no table."""
+        assert dataset_manager.get_propagation_table() is None
+
+
+class TestCalculatorExtendedRange:
+    """Test how far past the measured table the calculator propagates."""
+
+    def test_default_holds_last_row(self, dataset_manager, concawe_data):
+        """Test the default matches the workbook: the last measured row applies beyond it."""
+        write_concawe_file(dataset_manager.dataset_dir, concawe_data)
+        calculator = NoiseCalculator(dataset_manager)
+
+        received = calculator.propagate_many(100.0, [10.0, 50.0, 300.0], "Rural")
+        np.testing.assert_allclose(received, 100.0 - 110 + 76.3)
+        assert calculator._search_range == (1.0, 1000.0)
+
+    def test_extended_range_continues_table(self, dataset_manager, concawe_data):
+        """Test extended_range continues the fitted slope past the last row."""
+        write_concawe_file(dataset_manager.dataset_dir, concawe_data)
+        calculator = NoiseCalculator(dataset_manager, extended_range=True)
+        slope = (76.3 - 80.2) / np.log10(2)
+
+        received = calculator.propagate_many(100.0, [10.0, 100.0], "Rural")
+        np.testing.assert_allclose(received, 100.0 - 110 + 76.3 + slope * np.array([0, 1]))
+        assert calculator._search_range == (1.0, 5000.0)
+
+    def test_api_configuration(self, dataset_manager, monkeypatch):
+        """Test the API builds its calculator with the configured lookup mode and range."""
+        for name in ["dataset_manager", "calculator", "result_cache"]:
+            monkeypatch.setattr(api_main, name, None)
+        monkeypatch.setattr(api_main, "PROPAGATION_MODE", INTERPOLATED)
+        monkeypatch.setattr(api_main, "EXTENDED_RANGE", True)
+
+        api_main.initialize_components(str(dataset_manager.dataset_dir))
+
+        settings = api_main.calculator.settings()
+        assert settings["propagation_mode"] == INTERPOLATED
+        assert settings["extended_range"] is True
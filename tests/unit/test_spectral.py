@@ -0,0 +1,136 @@
+"""
+Unit tests for octave-band spectral propagation.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from noise_estimator.core.calculator import NoiseCalculator
+from noise_estimator.core.dataset import DatasetManager
+from noise_estimator.core.spectral import (
+    A_WEIGHTING, BARRIER_BAND_FACTORS, MAX_BARRIER_ATTENUATION, OCTAVE_BANDS,
+    a_weighted_level, band_air_correction, band_barrier_adjustment, propagate_bands
+)
+from noise_estimator.models.schemas import EstimationRequest, Plant
+
+# Unweighted octave-band SWL whose A-weighted totals are close to the broadband levels
+SPECTRA = {
+    "excavator": [104.0, 106.0, 103.0, 101.0, 99.0, 96.0, 92.0, 86.0],
+    "truck": [103.0, 102.0, 100.0, 98.0, 96.0, 93.0, 88.0, 82.0],
+}
+
+
+@pytest.fixture
+def spectral_manager(temp_dir, sample_dataset):
+    """Dataset manager whose excavation scenario and its plants carry octave-band levels."""
+    data = sample_dataset.model_dump(mode="json")
+    for scenario in data["tables"]["scenarios"]:
+        if scenario["id"] == "excavation":
+            scenario["octave_band_levels"] = SPECTRA
+    for plant in data["tables"]["plants"]:
+        if plant["id"] in SPECTRA:
+            plant["octave_band_levels"] = SPECTRA[plant["id"]]
+
+    dataset_dir = temp_dir / "datasets" / sample_dataset.metadata.version
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    with open(dataset_dir / "dataset.json", 'w') as f:
+        json.dump(data, f)
+
+    manager = DatasetManager(temp_dir / "datasets")
+    manager.load_dataset(sample_dataset.metadata.version)
+    return manager
+
+
+class TestSpectralTerms:
+    """Test cases for the per-band terms."""
+
+    def test_a_weighted_level(self):
+        """Test bands are A-weighted and energy-summed over the last axis."""
+        flat = np.full((2, len(OCTAVE_BANDS)), 80.0) - A_WEIGHTING
+        np.testing.assert_allclose(a_weighted_level(flat), 80.0 + 10 * np.log10(len(OCTAVE_BANDS)))
+
+        with pytest.raises(ValueError):
+            a_weighted_level([80.0] * 7)
+
+    def test_band_terms_neutral_at_reference_band(self):
+        """Test the broadband values apply unchanged at 500 Hz."""
+        reference = OCTAVE_BANDS.index(500)
+        assert band_air_correction(1000.0)[reference] == 0.0
+        assert BARRIER_BAND_FACTORS[reference] == pytest.approx(1.0)
+
+        air = band_air_correction(np.array([0.0, 1000.0]))
+        assert np.all(air[0] == 0.0)
+        assert np.all(np.diff(air[1]) < 0)
+
+    def test_barrier_scaled_per_band_and_capped(self):
+        """Test high bands gain barrier attenuation, up to the cap."""
+        adjustment = band_barrier_adjustment(np.array([0.0, -5.0, -15.0]))
+
+        assert adjustment.shape == (3, len(OCTAVE_BANDS))
+        assert np.all(adjustment[0] == 0.0)
+        assert np.all(np.diff(adjustment[1]) < 0)
+        assert adjustment[2].min() == -MAX_BARRIER_ATTENUATION
+
+    def test_propagation_matches_broadband_without_band_terms(self):
+        """Test that with no band-specific terms, the result is the broadband formula on the A-weighted SWL."""
+        spectra = np.array(list(SPECTRA.values()))
+        received = propagate_bands(spectra, np.array([70.0, 60.0]), np.zeros(2))
+
+        np.testing.assert_allclose(a_weighted_level(received), a_weighted_level(spectra) - 110 + np.array([70.0, 60.0]))
+
+    def test_plant_schema_requires_every_band(self):
+        """Test plants reject octave-band levels with bands missing."""
+        with pytest.raises(ValidationError):
+            Plant(id="p", name="P", sound_power_level=100.0, octave_band_levels=[90.0] * 7)
+
+
+class TestSpectralCalculator:
+    """Test cases for spectral mode in NoiseCalculator."""
+
+    def test_propagate_spectra_sources_by_receivers(self, spectral_manager):
+        """Test a sources x receivers x bands array propagates in one call."""
+        calculator = NoiseCalculator(spectral_manager, spectral=True)
+        spectra = np.array(list(SPECTRA.values()))
+        distances = np.array([20.0, 80.0, 400.0])
+
+        received = calculator.propagate_spectra(spectra[:, np.newaxis, :], distances[np.newaxis, :], "Rural")
+
+        assert received.shape == (2, 3)
+        for i, spectrum in enumerate(spectra):
+            for j, distance in enumerate(distances):
+                assert received[i, j] == pytest.approx(float(calculator.propagate_spectra(spectrum, distance, "Rural")))
+
+    def test_spectral_scenario_calculation(self, spectral_manager, sample_requests):
+        """Test spectral assessments sum each plant's A-weighted bands at the receiver."""
+        calculator = NoiseCalculator(spectral_manager, spectral=True)
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        result = calculator.calculate(request)
+
+        spectra = np.array(list(SPECTRA.values()))
+        received = calculator.propagate_spectra(spectra, request.receiver_distance, request.propagation_type)
+        assert result.predicted_level_db == pytest.approx(10 * np.log10(np.sum(10 ** (received / 10))), abs=0.1)
+        assert set(result.trace.intermediate_values["source_spectra"]) == set(SPECTRA)
+
+    def test_batch_matches_per_request(self, spectral_manager, sample_requests):
+        """Test the vectorized batch path gives the per-request spectral results."""
+        calculator = NoiseCalculator(spectral_manager, spectral=True)
+        requests = []
+        for name in ["full_estimator_scenario", "full_estimator_plant", "distance_based_scenario"]:
+            for distance in [15.0, 60.0, 250.0]:
+                requests.append(EstimationRequest(**{**sample_requests[name], "receiver_distance": distance, "include_trace": False}))
+
+        batch = list(calculator.calculate_many(requests))
+        for request, result in zip(requests, batch):
+            assert result.predicted_level_db == pytest.approx(calculator.calculate(request).predicted_level_db)
+
+    def test_missing_spectra_fall_back_to_broadband(self, dataset_manager, sample_requests):
+        """Test sources without octave-band levels use the broadband path."""
+        request = EstimationRequest(**sample_requests["full_estimator_scenario"])
+        spectral = NoiseCalculator(dataset_manager, spectral=True).calculate(request)
+        broadband = NoiseCalculator(dataset_manager).calculate(request)
+
+        assert spectral.predicted_level_db == broadband.predicted_level_db
+        assert any("octave-band" in warning for warning in spectral.trace.warnings)
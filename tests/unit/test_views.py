@@ -0,0 +1,70 @@
+"""
+Unit tests for indexed dataset views.
+"""
+
+import pytest
+
+from noise_estimator.core.views import DatasetView, energy_average
+
+
+class TestDatasetView:
+    """Test cases for DatasetView."""
+
+    def test_entity_maps(self, sample_dataset):
+        """Test id -> model maps are built for every entity table."""
+        view = DatasetView(sample_dataset)
+
+        assert set(view.noise_categories) == {"R1", "U2"}
+        assert view.scenarios["excavation"].name
+        assert "excavator" in view.plants
+        assert view.mitigation_measures["additional_1"].reduction_db == 10.0
+
+    def test_maps_are_read_only(self, sample_dataset):
+        """Test views cannot be mutated by callers."""
+        view = DatasetView(sample_dataset)
+
+        with pytest.raises(TypeError):
+            view.plants["new"] = None
+
+    def test_background_index(self, sample_dataset):
+        """Test background levels are indexed by category and time period."""
+        view = DatasetView(sample_dataset)
+
+        assert view.background_levels[("R1", "night")] == 35.0
+        assert view.background_levels[("U2", "day")] == 55.0
+
+    def test_composite_background_periods(self, sample_dataset):
+        """Test composite periods are energy averages of their single periods."""
+        view = DatasetView(sample_dataset)
+
+        assert view.background_levels[("R1", "day_evening")] == pytest.approx(energy_average([45.0, 40.0]))
+        assert view.background_levels[("R1", "evening_night")] == pytest.approx(energy_average([40.0, 35.0]))
+        assert view.background_levels[("R1", "day_evening_night")] == pytest.approx(41.7, abs=0.05)
+
+
+class TestDatasetManagerViews:
+    """Test view caching in DatasetManager."""
+
+    def test_view_built_once(self, dataset_manager):
+        """Test getters share one view per loaded dataset."""
+        view = dataset_manager.get_view()
+
+        assert dataset_manager.get_view() is view
+        assert dataset_manager.get_plants() is view.plants
+        assert dataset_manager.get_noise_categories() is view.noise_categories
+
+    def test_view_cleared_with_cache(self, dataset_manager):
+        """Test clearing the cache drops built views."""
+        dataset = dataset_manager.get_current_dataset()
+        view = dataset_manager.get_view()
+
+        dataset_manager.clear_cache()
+
+        assert dataset_manager.get_view(dataset) is not view
+
+    def test_no_dataset_loaded(self, temp_dir):
+        """Test views require a dataset."""
+        from noise_estimator.core.dataset import DatasetManager
+
+        with pytest.raises(ValueError):
+            DatasetManager(temp_dir).get_view()